@@ -5,19 +5,91 @@ BSM307 - Güz 2025
 Issue #9, #10, #11, #12: Complete GA implementation
 """
 
+import itertools
 import random
-from typing import List, Optional, Sequence, Tuple
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 import networkx as nx
 
-from ...metrics.delay import total_delay
-from ...metrics.reliability import reliability_cost
-from ...metrics.resource_cost import bandwidth_cost, weighted_sum
+from ...network.compact_graph import CompactGraph
+from ...metrics.batch import BatchMetrics, evaluate_population, pad_population
+from ...metrics.cache import PathMetricsCache
+from ...metrics.path_evaluator import PathEvaluator, PathMetrics, PathPrefix
+from ...routing.bandwidth_index import BandwidthIndex
+from ...routing.bottleneck import BottleneckOracle
+from ...routing.detour_index import DetourIndex
+from ...routing.k_shortest import k_shortest_paths
+from ...routing.next_hop import NextHopTable
 from ...routing.path_validator import PathValidator
+from ...routing.weighted_solver import WeightedSumSolver
 from ...utils.logger import get_logger
+from .operators import common_nodes, remove_loops
+from .parallel import ParallelEvaluator
 
 logger = get_logger(__name__)
 
+# (generasyon, popülasyon, fitness'ler) -> gelen göçmen path'ler
+ExchangeHook = Callable[[int, List[List[int]], List[float]], List[List[int]]]
+
+
+class Chromosome(list):
+    """
+    Path (düğüm listesi) + artımlı değerlendirme bilgisi.
+    
+    metrics: GA'nın evaluator'ı ile hesaplanmış PathMetrics (None = henüz bilinmiyor)
+    prefix: Kümülatif metrik dizileri; birey parent olarak kullanıldığında oluşturulur
+    """
+
+    __slots__ = ("metrics", "prefix")
+
+    def __init__(
+        self,
+        path: Sequence[int] = (),
+        metrics: Optional[PathMetrics] = None,
+        prefix: Optional[PathPrefix] = None,
+    ):
+        super().__init__(path)
+        self.metrics = metrics
+        self.prefix = prefix
+
+    def clone(self) -> "Chromosome":
+        """Metrik ve prefix bilgisini koruyan kopya (değişmeyen child'lar için)."""
+        return Chromosome(self, self.metrics, self.prefix)
+
+
+# GAResult.stop_reason değerleri
+STOP_GENERATIONS = "generations"
+STOP_STALL = "stall"
+STOP_DIVERSITY = "diversity"
+STOP_DEADLINE = "deadline"
+STOP_NO_POPULATION = "no_population"
+
+
+@dataclass
+class GenerationStats:
+    """Bir generasyonun offspring üretim sayaçları."""
+
+    generation: int
+    attempts: int = 0
+    invalid_children: int = 0
+    repairs: int = 0
+    refilled: int = 0
+    best_fitness: float = float("inf")
+    diversity: float = 1.0
+
+
+@dataclass
+class GAResult:
+    """Bir çalıştırmanın sonucu ve durma nedeni."""
+
+    best_path: List[int]
+    best_fitness: float
+    generations: int
+    stop_reason: str
+    elapsed_ms: float
+
 
 class GeneticAlgorithm:
     """
@@ -27,11 +99,14 @@ class GeneticAlgorithm:
     Issue #10: Fitness function
     Issue #11: Crossover & mutation operators
     Issue #12: Main algorithm loop
+
+    Graf bir kez CompactGraph'a dönüştürülür; tüm komşuluk, kenar ve metrik
+    sorguları bu CSR anlık görüntüsü üzerinden yapılır.
     """
 
     def __init__(
         self,
-        graph: nx.Graph,
+        graph: Union[nx.Graph, CompactGraph],
         source: int,
         target: int,
         weights: Sequence[float] = (0.4, 0.3, 0.3),
@@ -40,10 +115,20 @@ class GeneticAlgorithm:
         crossover_rate: float = 0.8,
         mutation_rate: float = 0.05,
         seed: Optional[int] = None,
+        cache: Optional[PathMetricsCache] = None,
+        max_offspring_attempts: Optional[int] = None,
+        feasible_pool_size: Optional[int] = None,
+        executor: str = "serial",
+        workers: Optional[int] = None,
+        k_shortest_seeds: Optional[int] = None,
+        stall_generations: Optional[int] = None,
+        min_improvement: float = 0.0,
+        diversity_floor: float = 0.0,
+        deadline_ms: Optional[float] = None,
     ):
         """
         Args:
-            graph: NetworkX graph objesi
+            graph: NetworkX graph veya CompactGraph objesi
             source: Başlangıç düğümü
             target: Hedef düğümü
             weights: (delay_weight, reliability_weight, resource_weight) tuple
@@ -52,8 +137,29 @@ class GeneticAlgorithm:
             crossover_rate: Çaprazlama olasılığı
             mutation_rate: Mutasyon olasılığı
             seed: Rastgele tohum (reproducibility için)
+            cache: Paylaşılabilir PathMetricsCache (None ise önbellek kullanılmaz)
+            max_offspring_attempts: Generasyon başına en fazla selection/crossover
+                denemesi (None ise population_size * 10); bütçe dolunca popülasyon
+                uygun path havuzundan tamamlanır
+            feasible_pool_size: Şimdiye kadar görülen uygun path havuzunun boyutu
+                (None ise population_size * 4)
+            executor: "serial" veya "process"; "process" seçilirse run() süresince
+                fitness değerlendirmesi ParallelEvaluator process havuzunda yapılır
+                (aynı seed ile sonuçlar seri modla birebir aynıdır)
+            workers: Process havuzu boyutu (None ise os.cpu_count())
+            k_shortest_seeds: Başlangıç popülasyonuna eklenecek bileşik ağırlıklı
+                k-en kısa path sayısı (None ise population_size // 5, 0 ise kapalı)
+            stall_generations: Bu kadar generasyon anlamlı iyileşme olmazsa dur
+                (None ise kapalı)
+            min_improvement: Anlamlı sayılacak en küçük göreli iyileşme
+                ((eski - yeni) / |eski|); altındaki iyileşmeler durgunluk sayılır
+            diversity_floor: Farklı path oranı bu değerin altına düşerse dur (0 ise kapalı)
+            deadline_ms: Çalıştırma başına milisaniye cinsinden süre sınırı (None ise yok)
         """
+        if executor not in ("serial", "process"):
+            raise ValueError(f"executor must be 'serial' or 'process', got {executor!r}")
         self.graph = graph
+        self.compact = graph if isinstance(graph, CompactGraph) else CompactGraph.from_graph(graph)
         self.source = source
         self.target = target
         self.weights = tuple(weights)
@@ -61,8 +167,44 @@ class GeneticAlgorithm:
         self.population_size = population_size
         self.crossover_rate = crossover_rate
         self.mutation_rate = mutation_rate
-        
-        self.validator = PathValidator(graph)
+        self.cache = cache
+        self.max_offspring_attempts = (
+            max_offspring_attempts if max_offspring_attempts is not None else population_size * 10
+        )
+        self.feasible_pool_size = (
+            feasible_pool_size if feasible_pool_size is not None else population_size * 4
+        )
+        self.executor = executor
+        self.workers = workers
+        self.evaluation_seconds = 0.0
+        self.k_shortest_seeds = (
+            k_shortest_seeds if k_shortest_seeds is not None else population_size // 5
+        )
+        self.stall_generations = stall_generations
+        self.min_improvement = min_improvement
+        self.diversity_floor = diversity_floor
+        self.deadline_ms = deadline_ms
+        self.last_result: Optional[GAResult] = None
+        # Çalıştırmanın başlangıç zamanı ve mutlak süre sınırı (_execute ayarlar)
+        self._started = time.perf_counter()
+        self._deadline_at: Optional[float] = None
+        self._parallel: Optional[ParallelEvaluator] = None
+        # Son çalıştırmanın final popülasyonu (resume / reoptimize için)
+        self.population: List[Chromosome] = []
+        self.generation_stats: List[GenerationStats] = []
+        self._feasible_pool: Dict[Tuple[int, ...], Chromosome] = {}
+        self._repair_count = 0
+        
+        self.validator = PathValidator(self.compact)
+        self.bandwidth_index = BandwidthIndex(self.compact)
+        # (S, D, B) talebinin uygunluğu için O(log n) darboğaz kahini (ilk sorguda oluşturulur)
+        self._bottleneck: Optional[BottleneckOracle] = None
+        self.routes = NextHopTable(self.compact)
+        self._configure(self.weights, required_bandwidth)
+        # Mutasyon için ortak komşu indeksi (ilk mutasyonda oluşturulur)
+        self._detours: Optional[DetourIndex] = None
+        # k-en kısa tohumlar için bileşik ağırlık çözücüsü (ilk kullanımda oluşturulur)
+        self._solver: Optional[WeightedSumSolver] = None
         
         if seed is not None:
             random.seed(seed)
@@ -72,12 +214,27 @@ class GeneticAlgorithm:
             source, target, weights, population_size
         )
 
+    def _configure(self, weights: Sequence[float], required_bandwidth: float) -> None:
+        """Ağırlık ve bandwidth talebine bağlı evaluator, görünüm ve tabloları kurar."""
+        self.weights = tuple(weights)
+        self.required_bandwidth = required_bandwidth
+        self.evaluator = PathEvaluator(
+            self.compact, self.weights, required_bandwidth, source=self.source, target=self.target
+        )
+        # Bandwidth ≥ talep kenarlarının maskeli görünümü: random walk, repair ve
+        # shortest-path tohumlaması uygun olmayan kenarları hiç kullanmaz
+        self.feasible = self.bandwidth_index.view(required_bandwidth)
+        # Repair için next-hop tabloları: önce bandwidth-uygun kenarlar, sonra tüm graf
+        self.feasible_routes = NextHopTable(self.compact, required_bandwidth, self.bandwidth_index)
+
     def initialize_population(self, size: Optional[int] = None) -> List[List[int]]:
         """
         Issue #9: Rastgele geçerli path'lerden oluşan başlangıç popülasyonu oluştur.
         
         Strateji:
-        1. Shortest path'i ekle (deterministic)
+        0. Talep uygun değilse (max bottleneck < required_bandwidth) hemen boş döndür
+        1. Shortest path'i, maksimum-bottleneck ağaç path'ini ve bileşik ağırlıklara
+           göre k-en kısa path'leri ekle (deterministic)
         2. Kalan popülasyon için rastgele path'ler üret
         3. Her path geçerli olmalı (simple path, capacity check)
         
@@ -90,32 +247,52 @@ class GeneticAlgorithm:
         pop_size = size if size is not None else self.population_size
         logger.debug("Initializing population size=%s", pop_size)
         
-        population = []
+        max_bottleneck = self.bottleneck.max_bottleneck(self.source, self.target)
+        if max_bottleneck < self.required_bandwidth:
+            logger.warning(
+                "Demand %s→%s infeasible: max bottleneck %.1f Mbps < required %.1f Mbps",
+                self.source, self.target, max_bottleneck, self.required_bandwidth,
+            )
+            return []
+        
+        population: List[List[int]] = []
+        # Duplicate kontrolü için path tuple kümesi (O(L) hash + O(1) arama)
+        seen: Set[Tuple[int, ...]] = set()
         max_attempts = pop_size * 10  # Her path için maksimum deneme sayısı
         
-        # 1. Shortest path'i ekle (deterministic, iyi başlangıç)
-        if nx.has_path(self.graph, self.source, self.target):
-            try:
-                shortest = nx.shortest_path(self.graph, self.source, self.target)
-                if self._is_valid_path(shortest):
-                    population.append(shortest)
-                    logger.debug("Added shortest path to population: %s", shortest)
-            except nx.NetworkXNoPath:
-                pass
+        # 1. Shortest path'i ve darboğaz ağacı path'ini ekle (deterministic, iyi başlangıç)
+        shortest = self._route(self.source, self.target)
+        widest = self.bottleneck.tree_path(self.source, self.target)
+        ranked = k_shortest_paths(
+            self.solver, self.source, self.target, self.weights, self.required_bandwidth
+        )
+        k_best = (path for path, _ in itertools.islice(ranked, min(self.k_shortest_seeds, pop_size)))
+        for seed_path in itertools.chain([shortest, widest], k_best):
+            if len(population) >= pop_size:
+                break
+            if (seed_path is not None and self._is_valid_path(seed_path)
+                    and self._add_unique(population, seen, seed_path)):
+                logger.debug("Added seed path to population: %s", seed_path)
+            # Süre sınırı: k-en kısa iteratörü her path verdiğinde kontrol edilir
+            # (iki kontrol arasında önceki path uzunluğu kadar spur araması yapılabilir)
+            if len(population) and self._deadline_passed():
+                break
         
         # 2. Rastgele path'ler üret
         attempts = 0
         while len(population) < pop_size and attempts < max_attempts:
+            if len(population) and self._deadline_passed():
+                logger.info("Deadline reached while initializing population (%s paths)", len(population))
+                break
             attempts += 1
             path = self._generate_random_path()
             
             if path is not None and self._is_valid_path(path):
-                # Duplicate kontrolü
-                if path not in population:
-                    population.append(path)
+                # Duplicate kontrolü (tuple kümesi, O(1))
+                if self._add_unique(population, seen, path):
                     logger.debug("Added random path %s to population", path)
         
-        if len(population) < pop_size:
+        if len(population) < pop_size and not self._deadline_passed():
             logger.warning(
                 "Could only generate %s valid paths (requested %s)",
                 len(population), pop_size
@@ -124,6 +301,16 @@ class GeneticAlgorithm:
         logger.info("Initialized population with %s valid paths", len(population))
         return population
 
+    @staticmethod
+    def _add_unique(population: List[List[int]], seen: Set[Tuple[int, ...]], path: List[int]) -> bool:
+        """Path daha önce eklenmediyse population'a ekler; eklendiyse True."""
+        key = tuple(path)
+        if key in seen:
+            return False
+        seen.add(key)
+        population.append(path)
+        return True
+
     def _generate_random_path(self) -> Optional[List[int]]:
         """
         Rastgele bir path üret (DFS veya random walk kullanarak).
@@ -134,15 +321,15 @@ class GeneticAlgorithm:
         # Random walk stratejisi
         path = [self.source]
         visited = {self.source}
-        max_length = self.graph.number_of_nodes()  # Sonsuz döngüyü önle
+        max_length = self.compact.num_nodes  # Sonsuz döngüyü önle
         
         current = self.source
         for _ in range(max_length):
             if current == self.target:
                 return path
             
-            # Rastgele komşu seç
-            neighbors = list(self.graph.neighbors(current))
+            # Rastgele komşu seç (yalnızca bandwidth-uygun kenarlar)
+            neighbors = self.feasible.neighbors(current)
             unvisited_neighbors = [n for n in neighbors if n not in visited]
             
             if not unvisited_neighbors:
@@ -168,6 +355,9 @@ class GeneticAlgorithm:
         if not path or path[0] != self.source or path[-1] != self.target:
             return False
         
+        if self.cache is not None:
+            return self.cache.is_valid(self.validator, path, self.required_bandwidth)
+        
         if not self.validator.is_simple_path(path):
             return False
         
@@ -183,52 +373,227 @@ class GeneticAlgorithm:
         Fitness = weighted_sum(delay, reliability_cost, resource_cost)
         Düşük skor = daha iyi path (minimize ediyoruz)
         
+        Geçerlilik kontrolü ve üç metrik PathEvaluator ile tek geçişte hesaplanır.
+        
         Args:
             chromosome: Path (düğüm listesi)
             
         Returns:
             Fitness skoru (düşük = iyi)
         """
-        if not self._is_valid_path(chromosome):
-            return float("inf")  # Geçersiz path'ler için sonsuz maliyet
-        
-        # Metrikleri hesapla
-        delay = total_delay(graph=self.graph, path=chromosome)
-        rel_cost = reliability_cost(graph=self.graph, path=chromosome)
-        res_cost = bandwidth_cost(graph=self.graph, path=chromosome)
-        
-        # Ağırlıklı toplam
-        fitness_score = weighted_sum(delay, rel_cost, res_cost, self.weights)
+        # Geçersiz path'ler için sonsuz maliyet (PathMetrics.fitness)
+        if self.cache is not None:
+            return self.cache.evaluate(self.evaluator, chromosome).fitness
+        return self.evaluator.evaluate(chromosome).fitness
+
+    def population_fitness(self, population: List[List[int]]) -> List[float]:
+        """
+        Tüm popülasyonun fitness değerlerini tek bir vektörel çağrıyla hesaplar.
         
-        logger.debug(
-            "Fitness for path %s: delay=%.2f, rel=%.4f, res=%.4f, total=%.4f",
-            chromosome[:5] if len(chromosome) > 5 else chromosome,
-            delay, rel_cost, res_cost, fitness_score
-        )
+        Metrikleri zaten bilinen Chromosome'lar (elit, kopyalar, artımlı
+        değerlendirilmiş child'lar) ve önbellekte bulunan path'ler atlanır;
+        yalnızca kalanlar toplu değerlendirilir.
         
-        return fitness_score
+        Args:
+            population: Path listesi
+            
+        Returns:
+            fitness(chrom) ile aynı sırada fitness listesi
+        """
+        results: List[Optional[PathMetrics]] = [
+            getattr(chrom, "metrics", None) for chrom in population
+        ]
+        if self.cache is None and all(result is None for result in results):
+            return self._evaluate_batch(population).fitness.tolist()
+        
+        keys = {}
+        if self.cache is not None:
+            for i, chrom in enumerate(population):
+                if results[i] is None:
+                    keys[i] = self.cache.evaluation_key(self.evaluator, chrom)
+                    results[i] = self.cache.get(keys[i])
+        
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            batch = self._evaluate_batch([population[i] for i in missing])
+            for row, i in enumerate(missing):
+                results[i] = PathMetrics(*(column[row].item() for column in batch))
+                if i in keys:
+                    self.cache.put(keys[i], results[i])
+        
+        for chrom, result in zip(population, results):
+            if isinstance(chrom, Chromosome):
+                chrom.metrics = result
+        return [result.fitness for result in results]
 
-    def run(self, generations: int = 100) -> Tuple[List[int], float]:
+    def _evaluate_batch(self, paths: List[List[int]]) -> BatchMetrics:
+        """
+        Path'leri toplu değerlendirir; process havuzu açıksa satırlar
+        worker'lara parçalar halinde dağıtılır. Süre evaluation_seconds'a eklenir.
+        """
+        started = time.perf_counter()
+        matrix, lengths = pad_population(paths)
+        if self._parallel is not None:
+            batch = self._parallel.evaluate(matrix, lengths)
+        else:
+            batch = evaluate_population(
+                self.compact, (matrix, lengths), self.weights, self.required_bandwidth,
+                source=self.source, target=self.target,
+            )
+        self.evaluation_seconds += time.perf_counter() - started
+        return batch
+
+    def _prefix_of(self, chromosome: List[int]) -> Optional[PathPrefix]:
+        """Chromosome'un prefix dizilerini (gerekirse oluşturup saklayarak) döndürür."""
+        prefix = getattr(chromosome, "prefix", None)
+        if prefix is None:
+            prefix = self.evaluator.prefix(chromosome)
+            if isinstance(chromosome, Chromosome):
+                chromosome.prefix = prefix
+        return prefix
+
+    def run(self, generations: int = 100, exchange: Optional[ExchangeHook] = None) -> Tuple[List[int], float]:
         """
         Issue #12: GA ana döngüsü (selection, crossover, mutation, replacement).
         
         Args:
             generations: Generasyon sayısı
+            exchange: Island modeli için her generasyon sonunda çağrılan fonksiyon;
+                döndürdüğü path'ler popülasyonun en kötü bireylerinin yerine geçer
             
         Returns:
             (best_path, best_fitness) tuple
         """
+        return self._execute(lambda: self._run(generations, exchange))
+
+    def optimize(self, generations: int = 100) -> GAResult:
+        """
+        run() ile aynı; en iyi path'le birlikte ulaşılan generasyonu ve durma
+        nedenini (generations / stall / diversity / deadline / no_population) döndürür.
+        """
+        self.run(generations)
+        return self.last_result
+
+    def resume(self, generations: int = 100, stall_generations: Optional[int] = None) -> Tuple[List[int], float]:
+        """
+        Son çalıştırmanın final popülasyonundan aynı ayarlarla devam eder.
+        
+        Args:
+            generations: En fazla ek generasyon sayısı
+            stall_generations: Bu kadar generasyon iyileşme olmazsa dur (None ise yapıcıdaki değer)
+        """
+        if not self.population:
+            return self.run(generations)
+        population = list(self.population)
+        return self._execute(
+            lambda: self._run(generations, population=population, stall_generations=stall_generations)
+        )
+
+    def reoptimize(
+        self,
+        weights: Optional[Sequence[float]] = None,
+        required_bandwidth: Optional[float] = None,
+        generations: int = 100,
+        stall_generations: Optional[int] = 10,
+    ) -> Tuple[List[int], float]:
+        """
+        Ağırlık veya bandwidth talebi değiştiğinde sıcak başlangıçlı yeniden optimizasyon.
+        
+        Önceki final popülasyon yeni ayarlarla toplu olarak yeniden skorlanır,
+        yeni bandwidth eşiğini sağlamayanlar atılır, eksikler yeni path'lerle
+        tamamlanır ve GA iyileşme durduğunda (stall_generations) sonlanır.
+        
+        Args:
+            weights: Yeni ağırlıklar (None ise değişmez)
+            required_bandwidth: Yeni bandwidth talebi (None ise değişmez)
+            generations: En fazla generasyon sayısı
+            stall_generations: Bu kadar generasyon iyileşme olmazsa dur
+            
+        Returns:
+            (best_path, best_fitness) tuple
+        """
+        self._configure(
+            weights if weights is not None else self.weights,
+            required_bandwidth if required_bandwidth is not None else self.required_bandwidth,
+        )
+        previous = list(self.population)
+        
+        def body() -> Tuple[List[int], float]:
+            # Eski metrikler önceki ağırlık / talebe ait; yeniden skorlanmalı
+            seeds = [Chromosome(path) for path in previous]
+            feasible = self._evaluate_batch(seeds).feasible.tolist() if seeds else []
+            population: List[List[int]] = []
+            kept: Set[Tuple[int, ...]] = set()
+            for chrom, ok in zip(seeds, feasible):
+                if ok:
+                    self._add_unique(population, kept, chrom)
+            carried = len(population)
+            
+            if len(population) < self.population_size:
+                for path in self.initialize_population(self.population_size - len(population)):
+                    self._add_unique(population, kept, Chromosome(path))
+            
+            logger.info(
+                "Re-optimizing with weights=%s, required_bandwidth=%s: %s of %s individuals carried over",
+                self.weights, self.required_bandwidth, carried, len(seeds),
+            )
+            return self._run(generations, population=population, stall_generations=stall_generations)
+        
+        return self._execute(body)
+
+    def _execute(self, body: Callable[[], Tuple[List[int], float]]) -> Tuple[List[int], float]:
+        """
+        body'yi executor ayarına göre (gerekirse process havuzu açık iken) çalıştırır.
+        
+        deadline_ms süresi burada başlar; popülasyon başlatma (k-en kısa path'ler
+        dahil), offspring döngüsü ve generasyonlar arası kontroller aynı sınırı kullanır.
+        """
+        self._started = time.perf_counter()
+        if self.deadline_ms is not None:
+            self._deadline_at = self._started + self.deadline_ms / 1000.0
+        try:
+            if self.executor != "process":
+                return body()
+            
+            with ParallelEvaluator(
+                self.compact, self.weights, self.required_bandwidth,
+                source=self.source, target=self.target, workers=self.workers,
+            ) as parallel:
+                self._parallel = parallel
+                try:
+                    return body()
+                finally:
+                    self._parallel = None
+        finally:
+            self._deadline_at = None
+
+    def _run(
+        self,
+        generations: int,
+        exchange: Optional[ExchangeHook] = None,
+        population: Optional[List[Chromosome]] = None,
+        stall_generations: Optional[int] = None,
+    ) -> Tuple[List[int], float]:
         logger.info("Running GA for %s generations", generations)
+        self.evaluation_seconds = 0.0
+        stall_limit = stall_generations if stall_generations is not None else self.stall_generations
         
-        # Popülasyonu başlat
-        population = self.initialize_population()
+        # Popülasyonu başlat (sıcak başlangıçta verilen popülasyon kullanılır)
+        if population is None:
+            population = [Chromosome(path) for path in self.initialize_population()]
+        self.population = population
+        self.generation_stats = []
+        self._feasible_pool = {}
         
         if not population:
             logger.error("Could not initialize population!")
-            return [], float("inf")
+            return self._finish([], float("inf"), 0, STOP_NO_POPULATION)
+        
+        for chrom in population:
+            self._remember_feasible(chrom)
         
         # Fitness'leri hesapla
-        fitnesses = [self.fitness(chrom) for chrom in population]
+        fitnesses = self.population_fitness(population)
         best_idx = min(range(len(population)), key=lambda i: fitnesses[i])
         best_path = population[best_idx]
         best_fitness = fitnesses[best_idx]
@@ -236,56 +601,207 @@ class GeneticAlgorithm:
         logger.info("Initial best fitness: %.4f (path length: %s)", best_fitness, len(best_path))
         
         # Ana döngü
+        stalled = 0
+        generation = 0
+        reason = STOP_GENERATIONS
         for gen in range(generations):
-            # Yeni popülasyon oluştur
-            new_population = []
-            
-            # Elitizm: En iyi bireyi koru
-            new_population.append(best_path)
-            
-            # Popülasyon boyutuna ulaşana kadar yeni bireyler üret
-            while len(new_population) < self.population_size:
-                # Selection (tournament selection)
-                parent1 = self._tournament_selection(population, fitnesses, tournament_size=3)
-                parent2 = self._tournament_selection(population, fitnesses, tournament_size=3)
-                
-                # Crossover
-                if random.random() < self.crossover_rate:
-                    child1, child2 = self._crossover(parent1, parent2)
-                else:
-                    child1, child2 = parent1.copy(), parent2.copy()
-                
-                # Mutation
-                if random.random() < self.mutation_rate:
-                    child1 = self._mutate(child1)
-                if random.random() < self.mutation_rate:
-                    child2 = self._mutate(child2)
-                
-                # Geçerli child'ları ekle
-                if self._is_valid_path(child1) and len(new_population) < self.population_size:
-                    new_population.append(child1)
-                if self._is_valid_path(child2) and len(new_population) < self.population_size:
-                    new_population.append(child2)
+            if self._deadline_passed():
+                reason = STOP_DEADLINE
+                break
+            generation = gen + 1
             
-            # Popülasyonu güncelle
-            population = new_population
-            fitnesses = [self.fitness(chrom) for chrom in population]
+            # Yeni popülasyon oluştur (elitizm + sınırlı offspring döngüsü)
+            population, stats = self._next_generation(population, fitnesses, best_path, generation)
+            fitnesses = self.population_fitness(population)
+            if exchange is not None:
+                immigrants = exchange(generation, population, fitnesses)
+                if immigrants:
+                    fitnesses = self._immigrate(population, fitnesses, immigrants)
             
             # En iyiyi güncelle
             current_best_idx = min(range(len(population)), key=lambda i: fitnesses[i])
             current_best_fitness = fitnesses[current_best_idx]
             
+            # min_improvement altındaki iyileşmeler durgunluk sayacını sıfırlamaz
+            if self._is_significant(best_fitness, current_best_fitness):
+                stalled = 0
+            else:
+                stalled += 1
             if current_best_fitness < best_fitness:
                 best_path = population[current_best_idx]
                 best_fitness = current_best_fitness
                 logger.info(
                     "Generation %s: New best fitness=%.4f (path length=%s)",
-                    gen + 1, best_fitness, len(best_path)
+                    generation, best_fitness, len(best_path)
                 )
+            stats.best_fitness = best_fitness
+            stats.diversity = len({tuple(chrom) for chrom in population}) / len(population)
+            self.generation_stats.append(stats)
+            self.population = population
+            
+            if stall_limit is not None and stalled >= stall_limit:
+                reason = STOP_STALL
+                break
+            if stats.diversity < self.diversity_floor:
+                reason = STOP_DIVERSITY
+                break
+            if self._deadline_passed():
+                reason = STOP_DEADLINE
+                break
         
-        logger.info("GA completed. Best fitness: %.4f, path: %s", best_fitness, best_path)
+        return self._finish(list(best_path), best_fitness, generation, reason)
+
+    def _deadline_passed(self) -> bool:
+        return self._deadline_at is not None and time.perf_counter() >= self._deadline_at
+
+    def _is_significant(self, best: float, candidate: float) -> bool:
+        """candidate, best'e göre en az min_improvement (göreli) kadar iyi mi?"""
+        if not candidate < best:
+            return False
+        if best == float("inf"):
+            return True
+        return best - candidate > self.min_improvement * abs(best)
+
+    def _finish(
+        self, best_path: List[int], best_fitness: float, generation: int, reason: str
+    ) -> Tuple[List[int], float]:
+        """last_result'ı kaydeder ve (best_path, best_fitness) döndürür."""
+        self.last_result = GAResult(
+            best_path, best_fitness, generation, reason, (time.perf_counter() - self._started) * 1000.0
+        )
+        logger.info(
+            "GA completed after %s generations (%s). Best fitness: %.4f, path: %s "
+            "(evaluation time %.3fs, executor=%s)",
+            generation, reason, best_fitness, best_path, self.evaluation_seconds, self.executor,
+        )
         return best_path, best_fitness
 
+    def _next_generation(
+        self,
+        population: List[Chromosome],
+        fitnesses: List[float],
+        elite: Chromosome,
+        generation: int,
+    ) -> Tuple[List[Chromosome], GenerationStats]:
+        """
+        Selection, crossover, mutation ile yeni popülasyonu üretir.
+        
+        Deneme sayısı max_offspring_attempts ile sınırlıdır; bu sayede sıkı bir
+        required_bandwidth altında bile generasyon süresinin üst sınırı vardır.
+        Bütçe dolduğunda veya deadline_ms aşıldığında eksik bireyler uygun path
+        havuzundan tamamlanır.
+        
+        Returns:
+            (new_population, GenerationStats)
+        """
+        stats = GenerationStats(generation=generation)
+        repairs_before = self._repair_count
+        
+        # Elitizm: En iyi bireyi koru
+        new_population = [elite]
+        
+        # Popülasyon boyutuna ulaşana kadar (veya bütçe bitene kadar) yeni bireyler üret
+        while len(new_population) < self.population_size and stats.attempts < self.max_offspring_attempts:
+            if self._deadline_passed():
+                break
+            stats.attempts += 1
+            
+            # Selection (tournament selection)
+            parent1 = self._tournament_selection(population, fitnesses, tournament_size=3)
+            parent2 = self._tournament_selection(population, fitnesses, tournament_size=3)
+            
+            # Crossover
+            if random.random() < self.crossover_rate:
+                child1, child2 = self._crossover(parent1, parent2)
+            else:
+                child1, child2 = parent1.clone(), parent2.clone()
+            
+            # Mutation
+            if random.random() < self.mutation_rate:
+                child1 = self._mutate(child1)
+            if random.random() < self.mutation_rate:
+                child2 = self._mutate(child2)
+            
+            # Geçerli child'ları ekle
+            for child in (child1, child2):
+                if len(new_population) >= self.population_size:
+                    break
+                if self._is_valid_child(child):
+                    child = self._as_chromosome(child)
+                    new_population.append(child)
+                    self._remember_feasible(child)
+                else:
+                    stats.invalid_children += 1
+        
+        if len(new_population) < self.population_size:
+            stats.refilled = self._refill_from_pool(new_population)
+            logger.info(
+                "Generation %s: offspring loop stopped after %s attempts, refilled %s individuals from pool",
+                generation, stats.attempts, stats.refilled,
+            )
+        
+        stats.repairs = self._repair_count - repairs_before
+        logger.debug(
+            "Generation %s: attempts=%s, invalid=%s, repairs=%s, refilled=%s",
+            generation, stats.attempts, stats.invalid_children, stats.repairs, stats.refilled,
+        )
+        return new_population, stats
+
+    def _immigrate(
+        self, population: List[Chromosome], fitnesses: List[float], immigrants: List[List[int]]
+    ) -> List[float]:
+        """
+        Gelen göçmenleri popülasyonun en kötü bireylerinin yerine koyar.
+        
+        Zaten popülasyonda olan veya geçersiz path'ler atlanır; elit birey korunur.
+        
+        Returns:
+            Güncellenmiş fitness listesi
+        """
+        present = {tuple(chrom) for chrom in population}
+        worst_first = sorted(range(1, len(population)), key=lambda i: fitnesses[i], reverse=True)
+        slots = iter(worst_first)
+        for path in immigrants:
+            key = tuple(path)
+            if key in present or not self._is_valid_path(list(path)):
+                continue
+            slot = next(slots, None)
+            if slot is None:
+                break
+            present.add(key)
+            population[slot] = Chromosome(path)
+            self._remember_feasible(population[slot])
+        return self.population_fitness(population)
+
+    def _remember_feasible(self, chromosome: Chromosome) -> None:
+        """Uygun path'i (tekrarsız, FIFO sınırlı) havuza ekler."""
+        key = tuple(chromosome)
+        if key in self._feasible_pool:
+            return
+        self._feasible_pool[key] = chromosome
+        if len(self._feasible_pool) > self.feasible_pool_size:
+            del self._feasible_pool[next(iter(self._feasible_pool))]
+
+    def _refill_from_pool(self, new_population: List[Chromosome]) -> int:
+        """Eksik bireyleri uygun path havuzundan rastgele örnekleyerek tamamlar."""
+        pool = list(self._feasible_pool.values())
+        if not pool:
+            return 0
+        missing = self.population_size - len(new_population)
+        new_population.extend(random.choice(pool).clone() for _ in range(missing))
+        return missing
+
+    @staticmethod
+    def _as_chromosome(path: List[int]) -> Chromosome:
+        return path if isinstance(path, Chromosome) else Chromosome(path)
+
+    def _is_valid_child(self, child: List[int]) -> bool:
+        """Artımlı metrikleri olan child'lar için O(1), diğerleri için tam kontrol."""
+        metrics = getattr(child, "metrics", None)
+        if metrics is not None:
+            return metrics.feasible
+        return self._is_valid_path(child)
+
     def _tournament_selection(
         self, population: List[List[int]], fitnesses: List[float], tournament_size: int = 3
     ) -> List[int]:
@@ -299,10 +815,14 @@ class GeneticAlgorithm:
         """
         Issue #11: İki parent path'ten yeni child path'ler üreten crossover.
         
-        Strateji: Order crossover (OX) benzeri
-        1. Parent1'den bir segment al
-        2. Parent2'den kalan düğümleri sırayla ekle
-        3. Geçerliliği kontrol et ve düzelt
+        Strateji: Ortak düğüm crossover'ı (operators.crossover ile aynı)
+        1. İki parent'ta da bulunan bir ara düğüm seç (dict indeksi, O(L))
+        2. Bu düğümden sonraki kuyrukları değiştir
+        3. Child basitse skoru parent prefix'lerinden splice() ile artımlı
+           hesaplanır; döngü oluştuysa remove_loops ile O(L) kaldırılır
+        
+        Tüm kenarlar parent'lardan geldiği için repair gerekmez. Ortak ara düğüm
+        yoksa parent'lar (metrikleriyle) kopyalanır.
         
         Args:
             parent1: İlk parent path
@@ -311,38 +831,31 @@ class GeneticAlgorithm:
         Returns:
             (child1, child2) tuple
         """
-        if len(parent1) <= 2 or len(parent2) <= 2:
-            return parent1.copy(), parent2.copy()
-        
-        # Crossover point seç
-        start = random.randint(1, len(parent1) - 2)
-        end = random.randint(start + 1, len(parent1) - 1)
-        
-        # Child1: Parent1'den segment + Parent2'den kalan
-        segment = parent1[start:end]
-        child1 = [self.source] + segment + [self.target]
-        
-        # Parent2'den segment'te olmayan düğümleri ekle
-        for node in parent2[1:-1]:  # Source ve target hariç
-            if node not in segment and node not in child1:
-                # Uygun pozisyona ekle
-                insert_pos = random.randint(1, len(child1) - 1)
-                child1.insert(insert_pos, node)
-        
-        # Child2: Parent2'den segment + Parent1'den kalan
-        segment2 = parent2[start:min(end, len(parent2))] if end < len(parent2) else parent2[start:]
-        child2 = [self.source] + segment2 + [self.target]
-        
-        for node in parent1[1:-1]:
-            if node not in segment2 and node not in child2:
-                insert_pos = random.randint(1, len(child2) - 1)
-                child2.insert(insert_pos, node)
-        
-        # Geçerliliği düzelt (path repair)
-        child1 = self._repair_path(child1)
-        child2 = self._repair_path(child2)
-        
-        return child1, child2
+        crossing = common_nodes(parent1, parent2)
+        if not crossing:
+            return self._copy(parent1), self._copy(parent2)
+        
+        i, j = random.choice(crossing)
+        return (
+            self._swap_tails(parent1, i, parent2, j),
+            self._swap_tails(parent2, j, parent1, i),
+        )
+
+    def _swap_tails(self, head: List[int], i: int, tail: List[int], j: int) -> List[int]:
+        """head[:i+1] + tail[j+1:] (head[i] == tail[j]); mümkünse artımlı değerlendirilir."""
+        head_prefix = self._prefix_of(head)
+        tail_prefix = self._prefix_of(tail)
+        if head_prefix is not None and tail_prefix is not None:
+            child, metrics = self.evaluator.splice(head_prefix, i, [], tail_prefix, j + 1)
+            if metrics.is_simple:
+                return Chromosome(child, metrics)
+        else:
+            child = head[:i] + tail[j:]
+        return remove_loops(child)
+
+    @staticmethod
+    def _copy(path: List[int]) -> List[int]:
+        return path.clone() if isinstance(path, Chromosome) else path.copy()
 
     def _mutate(self, chromosome: List[int]) -> List[int]:
         """
@@ -353,6 +866,9 @@ class GeneticAlgorithm:
         2. O düğümü farklı bir geçerli düğümle değiştir
         3. Path geçerliliğini koru
         
+        Değişiklik path'i basit bırakıyorsa repair gerekmez; child'ın skoru
+        parent'ın prefix dizilerinden artımlı hesaplanıp Chromosome'a eklenir.
+        
         Args:
             chromosome: Mutasyona uğrayacak path
             rate: Mutasyon olasılığı (burada zaten çağrılmadan önce kontrol ediliyor)
@@ -363,35 +879,69 @@ class GeneticAlgorithm:
         if len(chromosome) <= 2:
             return chromosome.copy()
         
-        mutated = chromosome.copy()
-        
         # Rastgele bir pozisyon seç (source ve target hariç)
-        pos = random.randint(1, len(mutated) - 2)
-        old_node = mutated[pos]
+        pos = random.randint(1, len(chromosome) - 2)
+        old_node = chromosome[pos]
         
         # Önceki ve sonraki düğümlerin komşularını bul
-        prev_node = mutated[pos - 1]
-        next_node = mutated[pos + 1]
-        
-        # Önceki düğümün komşularından birini seç (next_node'a gidebilen)
-        prev_neighbors = list(self.graph.neighbors(prev_node))
-        valid_replacements = [
-            n for n in prev_neighbors
-            if n != old_node and self.graph.has_edge(n, next_node)
-        ]
+        prev_node = chromosome[pos - 1]
+        next_node = chromosome[pos + 1]
+        
+        # prev_node–w–next_node olan bir w seç (detour indeksi, O(1))
+        replacement = self.detours.sample(prev_node, next_node, exclude=old_node)
         
-        if valid_replacements:
-            mutated[pos] = random.choice(valid_replacements)
+        if replacement >= 0:
+            segment = [replacement]
+        elif self.compact.has_edge(prev_node, next_node):
+            # Geçerli değişim yok: düğümü kaldır (prev_node–next_node kenarı var)
+            segment = []
         else:
-            # Geçerli değişim yok, path'i kısalt veya uzat
-            # Basit strateji: Düğümü kaldır (eğer edge varsa)
-            if self.graph.has_edge(prev_node, next_node):
-                mutated.pop(pos)
+            return self._repair_path(chromosome.copy())
+        
+        # Artımlı değerlendirme: yalnızca prev_node → segment → next_node hop'ları;
+        # basitlik yalnızca yeni düğüm parent'ın positions sözlüğünde aranarak bulunur
+        if chromosome[0] == self.source and chromosome[-1] == self.target:
+            parent = self._prefix_of(chromosome)
+            if parent is not None:
+                child, metrics = self.evaluator.splice(parent, pos - 1, segment, parent, pos + 1)
+                if metrics.is_simple:
+                    return Chromosome(child, metrics)
+                return self._repair_path(child)
         
         # Path repair
-        mutated = self._repair_path(mutated)
+        return self._repair_path(chromosome[:pos] + segment + chromosome[pos + 1:])
+
+    @property
+    def bottleneck(self) -> BottleneckOracle:
+        """Darboğaz kahini (tembel oluşturulur)."""
+        if self._bottleneck is None:
+            self._bottleneck = BottleneckOracle(self.compact)
+        return self._bottleneck
+
+    @property
+    def solver(self) -> WeightedSumSolver:
+        """GA'nın BandwidthIndex'ini paylaşan WeightedSumSolver (tembel oluşturulur)."""
+        if self._solver is None:
+            self._solver = WeightedSumSolver(self.compact, bandwidth_index=self.bandwidth_index)
+        return self._solver
+
+    @property
+    def detours(self) -> DetourIndex:
+        """Ortak komşu indeksi (tembel oluşturulur)."""
+        if self._detours is None:
+            self._detours = DetourIndex(self.compact)
+        return self._detours
+
+    def _route(self, u: int, v: int) -> Optional[List[int]]:
+        """
+        u → v en az hop'lu path (next-hop tablo yürüyüşü).
         
-        return mutated
+        Bandwidth-uygun kenarlarla bir yol varsa o tercih edilir; yoksa tüm graf kullanılır.
+        """
+        path = self.feasible_routes.path(u, v)
+        if path is None:
+            path = self.routes.path(u, v)
+        return path
 
     def _repair_path(self, path: List[int]) -> List[int]:
         """
@@ -399,14 +949,14 @@ class GeneticAlgorithm:
         
         Strateji:
         1. Source ve target'ı koru
-        2. Eksik edge'leri shortest path ile doldur
+        2. Eksik veya bandwidth'i yetersiz edge'leri shortest path ile doldur (next-hop tabloları, BFS yok)
         3. Döngüleri kaldır
         """
+        self._repair_count += 1
         if not path or path[0] != self.source or path[-1] != self.target:
             # Path'i baştan oluştur
-            if nx.has_path(self.graph, self.source, self.target):
-                return nx.shortest_path(self.graph, self.source, self.target)
-            return [self.source, self.target]
+            shortest = self._route(self.source, self.target)
+            return shortest if shortest is not None else [self.source, self.target]
         
         repaired = [path[0]]
         
@@ -414,32 +964,24 @@ class GeneticAlgorithm:
             u = path[i]
             v = path[i + 1]
             
-            if self.graph.has_edge(u, v):
+            if self.feasible.has_edge(u, v):
                 repaired.append(v)
             else:
-                # Edge yok, shortest path ile doldur
-                if nx.has_path(self.graph, u, v):
-                    subpath = nx.shortest_path(self.graph, u, v)
+                # Edge yok veya bandwidth yetersiz, shortest path ile doldur
+                subpath = self._route(u, v)
+                if subpath is not None:
                     repaired.extend(subpath[1:])  # İlk düğümü atla (zaten var)
                 else:
                     # Ulaşılamıyor, path'i kır
                     break
         
-        # Döngüleri kaldır
-        seen = set()
-        result = []
-        for node in repaired:
-            if node not in seen:
-                result.append(node)
-                seen.add(node)
-            else:
-                # Döngü bulundu, kır
-                break
+        # Döngüleri kaldır (O(L))
+        result = remove_loops(repaired)
         
         # Target'a ulaş
         if result[-1] != self.target:
-            if nx.has_path(self.graph, result[-1], self.target):
-                subpath = nx.shortest_path(self.graph, result[-1], self.target)
+            subpath = self._route(result[-1], self.target)
+            if subpath is not None:
                 result.extend(subpath[1:])
         
         return result
@@ -0,0 +1,238 @@
+"""
+Island modeli GA (süreçler arası göç)
+BSM307 - Güz 2025
+
+N bağımsız GeneticAlgorithm popülasyonu ayrı süreçlerde evrilir. Her M
+generasyonda her ada en iyi k bireyini halka topolojisinde bir sonraki adaya
+(multiprocessing.Queue) gönderir ve önceki adadan gelenleri kendi en kötü
+bireylerinin yerine koyar. Değerlendirme başına IPC yoktur; süreçler arası
+trafik yalnızca göç anlarında k path'tir.
+
+Her ada farklı bir seed ile çalışır (seed + ada indeksi). Erken duran
+(stall_generations / diversity_floor / deadline_ms) ada bir sonraki adaya
+_FINISHED işareti gönderir; o ada artık göçmen beklemez. Graf adalara
+paylaşımlı bellek (SharedGraph) üzerinden kopyasız verilir.
+
+Sınır: yalnızca CompactGraph dizileri paylaşılır. Her ada GeneticAlgorithm
+kurarken türetilmiş indekslerini kendi belleğinde oluşturur: BandwidthIndex
+(kenar sıralaması + eşik maskeleri, O(E)), NextHopTable'lar (sorgulanan hedef
+başına O(n)), BottleneckOracle (O(n log n)) ve DetourIndex (sorgulanan çiftler,
+LRU sınırlı). Ada başına bellek bu yüzden E ile büyür; toplam ≈ adalar × O(E).
+"""
+
+import multiprocessing as mp
+import queue
+import traceback
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+import networkx as nx
+
+from ...network.compact_graph import CompactGraph
+from ...network.shared_graph import SharedGraph, SharedGraphHandle, attach_graph
+from ...utils.logger import get_logger
+from .genetic_algorithm import GeneticAlgorithm
+
+logger = get_logger(__name__)
+
+# Komşu adanın çalışmasını bitirdiğini bildiren işaret (göçmen listesi yerine)
+_FINISHED = None
+
+# Sonuç kuyruğunu yoklama aralığı (s); aralarda ada süreçlerinin canlılığı kontrol edilir
+_RESULT_POLL_SECONDS = 1.0
+
+
+class IslandResult(NamedTuple):
+    """Bir adanın çalıştırma sonucu."""
+
+    island: int
+    seed: Optional[int]
+    best_path: List[int]
+    best_fitness: float
+    migrations: int
+
+
+def _island_worker(
+    index: int,
+    handle: SharedGraphHandle,
+    source: int,
+    target: int,
+    seed: Optional[int],
+    generations: int,
+    migration_interval: int,
+    migrants: int,
+    migration_timeout: float,
+    ga_kwargs: dict,
+    inbox: "mp.Queue",
+    outbox: "mp.Queue",
+    results: "mp.Queue",
+) -> None:
+    """Bir adayı çalıştırır; göç anlarında outbox'a gönderir, inbox'tan alır."""
+    # Okunmayan göçmenler (ör. alıcı ada erken durduysa) çıkışı bloklamamalı
+    outbox.cancel_join_thread()
+    try:
+        ga = GeneticAlgorithm(attach_graph(handle), source, target, seed=seed, **ga_kwargs)
+        migrations = 0
+        upstream_finished = False
+
+        def exchange(generation, population, fitnesses):
+            nonlocal migrations, upstream_finished
+            if generation % migration_interval != 0:
+                return []
+            order = sorted(range(len(population)), key=lambda i: fitnesses[i])
+            outbox.put([list(population[i]) for i in order[:migrants] if fitnesses[i] < float("inf")])
+            if upstream_finished:
+                return []
+            try:
+                immigrants = inbox.get(timeout=migration_timeout)
+            except queue.Empty:
+                logger.warning("Island %d: no migrants received at generation %d", index, generation)
+                return []
+            if immigrants is _FINISHED:
+                upstream_finished = True
+                logger.info("Island %d: upstream island finished, no longer waiting for migrants", index)
+                return []
+            migrations += 1
+            return immigrants
+
+        best_path, best_fitness = ga.run(generations=generations, exchange=exchange)
+        results.put((index, IslandResult(index, seed, best_path, best_fitness, migrations), None))
+    except Exception:
+        results.put((index, None, traceback.format_exc()))
+    finally:
+        outbox.put(_FINISHED)
+
+
+class IslandModel:
+    """
+    GeneticAlgorithm etrafında süreç tabanlı island modeli.
+
+    Ek GeneticAlgorithm parametreleri (weights, required_bandwidth,
+    population_size, ...) ga_kwargs olarak her adaya aynen iletilir.
+    """
+
+    def __init__(
+        self,
+        graph: Union[nx.Graph, CompactGraph],
+        source: int,
+        target: int,
+        islands: int = 4,
+        migration_interval: int = 10,
+        migrants: int = 2,
+        seed: Optional[int] = None,
+        migration_timeout: float = 30.0,
+        **ga_kwargs,
+    ):
+        """
+        Args:
+            graph: NetworkX graph veya CompactGraph objesi
+            source: Başlangıç düğümü
+            target: Hedef düğümü
+            islands: Ada (süreç) sayısı
+            migration_interval: Göçler arası generasyon sayısı (M)
+            migrants: Her göçte gönderilen en iyi birey sayısı (k)
+            seed: Temel tohum; ada i, seed + i kullanır (None ise rastgele)
+            migration_timeout: Komşu adadan göçmen beklenecek en uzun süre (s)
+        """
+        if islands < 1 or migration_interval < 1 or migrants < 0:
+            raise ValueError("islands and migration_interval must be >= 1, migrants >= 0")
+        self.compact = graph if isinstance(graph, CompactGraph) else CompactGraph.from_graph(graph)
+        self.source = source
+        self.target = target
+        self.islands = islands
+        self.migration_interval = migration_interval
+        self.migrants = migrants
+        self.seed = seed
+        self.migration_timeout = migration_timeout
+        self.ga_kwargs = ga_kwargs
+        self.island_results: List[IslandResult] = []
+
+    def island_seed(self, index: int) -> Optional[int]:
+        return self.seed + index if self.seed is not None else None
+
+    def run(self, generations: int = 100) -> Tuple[List[int], float]:
+        """
+        Tüm adaları paralel çalıştırır.
+
+        Returns:
+            Adalar arasındaki (best_path, best_fitness)
+        """
+        logger.info(
+            "Running island model: islands=%d, generations=%d, interval=%d, migrants=%d",
+            self.islands, generations, self.migration_interval, self.migrants,
+        )
+        ctx = mp.get_context()
+        queues = [ctx.Queue() for _ in range(self.islands)]
+        results = ctx.Queue()
+        shared: Optional[SharedGraph] = None
+        processes = []
+        collected = {}
+        errors = []
+        try:
+            shared = SharedGraph(self.compact)
+            for i in range(self.islands):
+                # Halka: ada i, (i + 1) numaralı adaya gönderir ve queues[i]'den alır
+                process = ctx.Process(
+                    target=_island_worker,
+                    args=(
+                        i, shared.handle, self.source, self.target, self.island_seed(i), generations,
+                        self.migration_interval, self.migrants, self.migration_timeout,
+                        self.ga_kwargs, queues[i], queues[(i + 1) % self.islands], results,
+                    ),
+                    daemon=True,
+                )
+                process.start()
+                processes.append(process)
+
+            reported = set()
+            suspects = set()
+            while len(reported) < self.islands:
+                try:
+                    index, result, error = results.get(timeout=_RESULT_POLL_SECONDS)
+                except queue.Empty:
+                    # SIGKILL / OOM ile ölen ada finally bloğuna ulaşamaz ve hiç sonuç
+                    # göndermez. Çıkmış ama raporlamamış ada bir sonraki yoklamada da
+                    # sessizse (kuyrukta bekleyen sonucu olamaz) hata verilir.
+                    exited = {
+                        i for i, process in enumerate(processes)
+                        if i not in reported and process.exitcode is not None
+                    }
+                    lost = exited & suspects
+                    if lost:
+                        raise RuntimeError(
+                            "Island model failed: "
+                            + ", ".join(
+                                f"island {i} exited with code {processes[i].exitcode} without reporting"
+                                for i in sorted(lost)
+                            )
+                        )
+                    suspects = exited
+                    continue
+                reported.add(index)
+                if error is not None:
+                    errors.append(f"island {index}:\n{error}")
+                else:
+                    collected[index] = result
+        except BaseException:
+            # Başlatma veya toplama yarıda kaldıysa çalışan adalar beklenmez
+            for process in processes:
+                process.terminate()
+            raise
+        finally:
+            for process in processes:
+                process.join()
+            for q in queues + [results]:
+                q.close()
+            if shared is not None:
+                shared.close()
+
+        if errors:
+            raise RuntimeError("Island model failed:\n" + "\n".join(errors))
+
+        self.island_results = [collected[i] for i in range(self.islands)]
+        best = min(self.island_results, key=lambda result: result.best_fitness)
+        logger.info(
+            "Island model completed. Best fitness: %.4f (island %d), per-island: %s",
+            best.best_fitness, best.island,
+            [round(result.best_fitness, 4) for result in self.island_results],
+        )
+        return list(best.best_path), best.best_fitness
@@ -6,60 +6,91 @@ Issue #11: Crossover and mutation operators
 """
 
 import random
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import networkx as nx
 
+from ...routing.detour_index import DetourIndex
 from ...utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def remove_loops(path: List[int]) -> List[int]:
+    """
+    Path'teki döngüleri O(L) sürede kaldırır.
+    
+    Bir düğüm ikinci kez görüldüğünde ilk görüldüğü konumdan sonraki kısım
+    (döngü) atılır; path'in uç noktaları korunur.
+    
+    Args:
+        path: Düğüm listesi
+        
+    Returns:
+        Basit path
+    """
+    position = {}
+    result = []
+    for node in path:
+        k = position.get(node)
+        if k is None:
+            position[node] = len(result)
+            result.append(node)
+            continue
+        for dropped in result[k + 1:]:
+            del position[dropped]
+        del result[k + 1:]
+    return result
+
+
+def common_nodes(parent_a: List[int], parent_b: List[int]) -> List[Tuple[int, int]]:
+    """
+    İki path'in ortak ara düğümlerinin konumları.
+    
+    Returns:
+        [(parent_a'daki indeks, parent_b'deki indeks), ...] (uç düğümler hariç)
+    """
+    index_b = {node: j for j, node in enumerate(parent_b[1:-1], start=1)}
+    return [
+        (i, index_b[node]) for i, node in enumerate(parent_a[1:-1], start=1) if node in index_b
+    ]
+
+
 def crossover(
     parent_a: List[int],
     parent_b: List[int],
-    graph: nx.Graph,
-    source: int,
-    target: int,
+    graph: Optional[nx.Graph] = None,
+    source: Optional[int] = None,
+    target: Optional[int] = None,
 ) -> Tuple[List[int], List[int]]:
     """
     Issue #11: İki parent path'ten yeni child path'ler üreten crossover.
     
+    Strateji: Ortak düğüm crossover'ı
+    1. İki parent'ta da bulunan bir ara düğüm c seç (dict indeksi ile)
+    2. c'den sonraki kuyrukları değiştir: child1 = a[..c] + b[c..], child2 = b[..c] + a[c..]
+    3. Oluşan döngüleri O(L) remove_loops ile kaldır
+    
+    Child'lardaki tüm kenarlar parent'lardan geldiği için repair gerekmez.
+    Ortak ara düğüm yoksa parent'ların kopyaları döndürülür.
+    
     Args:
         parent_a: İlk parent path
         parent_b: İkinci parent path
-        graph: NetworkX graph
-        source: Başlangıç düğümü
-        target: Hedef düğümü
+        graph: Kullanılmıyor (geriye dönük uyumluluk için)
+        source: Kullanılmıyor (uç noktalar parent'lardan korunur)
+        target: Kullanılmıyor (uç noktalar parent'lardan korunur)
         
     Returns:
         (child1, child2) tuple
     """
-    if len(parent_a) <= 2 or len(parent_b) <= 2:
+    crossing = common_nodes(parent_a, parent_b)
+    if not crossing:
         return parent_a.copy(), parent_b.copy()
     
-    # Crossover point seç
-    start = random.randint(1, len(parent_a) - 2)
-    end = random.randint(start + 1, len(parent_a) - 1)
-    
-    # Child1: Parent1'den segment + Parent2'den kalan
-    segment = parent_a[start:end]
-    child1 = [source] + segment + [target]
-    
-    # Parent2'den segment'te olmayan düğümleri ekle
-    for node in parent_b[1:-1]:
-        if node not in segment and node not in child1:
-            insert_pos = random.randint(1, len(child1) - 1)
-            child1.insert(insert_pos, node)
-    
-    # Child2: Parent2'den segment + Parent1'den kalan
-    segment2 = parent_b[start:min(end, len(parent_b))] if end < len(parent_b) else parent_b[start:]
-    child2 = [source] + segment2 + [target]
-    
-    for node in parent_a[1:-1]:
-        if node not in segment2 and node not in child2:
-            insert_pos = random.randint(1, len(child2) - 1)
-            child2.insert(insert_pos, node)
+    i, j = random.choice(crossing)
+    child1 = remove_loops(parent_a[:i] + parent_b[j:])
+    child2 = remove_loops(parent_b[:j] + parent_a[i:])
     
     logger.debug("Crossover: parent_a=%s, parent_b=%s -> child1=%s, child2=%s",
                  parent_a[:5] if len(parent_a) > 5 else parent_a,
@@ -75,6 +106,7 @@ def mutate(
     graph: nx.Graph,
     source: int,
     target: int,
+    detours: Optional[DetourIndex] = None,
 ) -> List[int]:
     """
     Issue #11: Path'i rastgele değiştiren mutasyon operatörü.
@@ -84,6 +116,7 @@ def mutate(
         graph: NetworkX graph
         source: Başlangıç düğümü
         target: Hedef düğümü
+        detours: Verilirse yedek düğüm ortak komşu indeksinden O(1) seçilir
         
     Returns:
         Mutasyona uğramış path
@@ -102,11 +135,15 @@ def mutate(
     next_node = mutated[pos + 1]
     
     # Önceki düğümün komşularından birini seç (next_node'a gidebilen)
-    prev_neighbors = list(graph.neighbors(prev_node))
-    valid_replacements = [
-        n for n in prev_neighbors
-        if n != old_node and graph.has_edge(n, next_node)
-    ]
+    if detours is not None:
+        replacement = detours.sample(prev_node, next_node, exclude=old_node)
+        valid_replacements = [replacement] if replacement >= 0 else []
+    else:
+        prev_neighbors = list(graph.neighbors(prev_node))
+        valid_replacements = [
+            n for n in prev_neighbors
+            if n != old_node and graph.has_edge(n, next_node)
+        ]
     
     if valid_replacements:
         mutated[pos] = random.choice(valid_replacements)
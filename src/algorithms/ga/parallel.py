@@ -0,0 +1,162 @@
+"""
+Process havuzunda paralel GA fitness değerlendirmesi
+BSM307 - Güz 2025
+
+Graf, paylaşımlı belleğe (SharedGraph) bir kez yayınlanır; worker'lar havuz
+başlatılırken (initializer) yalnızca segment tanıtıcısını alır ve dizileri
+kopyasız açar. Görev başına graf pickle edilmez, worker başına bellek graf
+boyutundan bağımsızdır. Path'ler -1
+dolgulu int32 matris parçaları (chunk) olarak gönderilir ve her worker kendi
+parçasını metrics.batch.evaluate_population ile değerlendirir.
+
+Tüm parçalar aynı matris genişliğini kullandığından satır bazlı NumPy
+reduce'ları seri modla aynı sırada yapılır; sonuçlar bit düzeyinde aynıdır.
+
+Küçük popülasyonlarda IPC maliyeti değerlendirme süresini aşabilir;
+compare_with_serial() ile gerçek hızlanma ölçülebilir.
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+import networkx as nx
+import numpy as np
+
+from ...metrics.batch import BatchMetrics, evaluate_population
+from ...network.compact_graph import CompactGraph
+from ...network.shared_graph import SharedGraph, SharedGraphHandle, attach_graph
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Worker süreç durumu (initializer ile bir kez doldurulur)
+_WORKER_STATE: dict = {}
+
+
+def _init_worker(handle: SharedGraphHandle, settings: tuple) -> None:
+    """Worker başlangıcı: CompactGraph'ı paylaşımlı bellekten bir kez açar."""
+    _WORKER_STATE["graph"] = attach_graph(handle)
+    _WORKER_STATE["settings"] = settings
+
+
+def _evaluate_chunk(matrix: np.ndarray, lengths: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Bir path parçasını worker'daki graf üzerinde değerlendirir."""
+    weights, required_bandwidth, source, target = _WORKER_STATE["settings"]
+    metrics = evaluate_population(
+        _WORKER_STATE["graph"], (matrix, lengths), weights, required_bandwidth, source, target
+    )
+    return tuple(metrics)
+
+
+class ParallelEvaluator:
+    """
+    evaluate_population'ın ProcessPoolExecutor üzerinde çalışan karşılığı.
+
+    Context manager olarak veya close() ile kapatılarak kullanılmalıdır.
+    """
+
+    def __init__(
+        self,
+        graph: CompactGraph,
+        weights: Sequence[float],
+        required_bandwidth: float = 0.0,
+        source: Optional[int] = None,
+        target: Optional[int] = None,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ):
+        """
+        Args:
+            graph: CompactGraph
+            weights: (delay_weight, reliability_weight, resource_weight)
+            required_bandwidth: Minimum gerekli bandwidth (Mbps)
+            source, target: Beklenen uç noktalar
+            workers: Worker süreç sayısı (None ise os.cpu_count())
+            chunk_size: Görev başına path sayısı (None ise popülasyon / workers)
+        """
+        self.graph = graph
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._settings = settings = (tuple(weights), required_bandwidth, source, target)
+        self._shared = SharedGraph(graph)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker,
+            initargs=(self._shared.handle, settings),
+        )
+        logger.info("Started ParallelEvaluator with %d workers", self.workers)
+
+    def evaluate(self, matrix: np.ndarray, lengths: np.ndarray) -> BatchMetrics:
+        """Dolgulu path matrisini parçalara bölüp worker'larda değerlendirir."""
+        count = len(lengths)
+        if count == 0:
+            return evaluate_population(self.graph, (matrix, lengths), *self._settings)
+        chunk = self.chunk_size or math.ceil(count / self.workers)
+        starts = range(0, count, chunk)
+        futures = [
+            self._pool.submit(_evaluate_chunk, matrix[i:i + chunk], lengths[i:i + chunk])
+            for i in starts
+        ]
+        parts = [future.result() for future in futures]
+        return BatchMetrics(*(np.concatenate(column) for column in zip(*parts)))
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+        self._shared.close()
+
+    def __enter__(self) -> "ParallelEvaluator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class SpeedupReport(NamedTuple):
+    """Seri ve paralel GA çalıştırmalarının karşılaştırması."""
+
+    serial_seconds: float
+    parallel_seconds: float
+    speedup: float
+    identical: bool
+
+
+def compare_with_serial(
+    graph: nx.Graph,
+    source: int,
+    target: int,
+    generations: int = 50,
+    workers: Optional[int] = None,
+    seed: int = 42,
+    **ga_kwargs,
+) -> SpeedupReport:
+    """
+    Aynı tohumla seri ve paralel GA çalıştırıp süreleri ve sonuçları karşılaştırır.
+
+    Returns:
+        SpeedupReport (identical: en iyi path ve fitness birebir aynı mı)
+    """
+    # Döngüsel import'u önlemek için burada
+    from .genetic_algorithm import GeneticAlgorithm
+
+    compact = graph if isinstance(graph, CompactGraph) else CompactGraph.from_graph(graph)
+    results = {}
+    for mode in ("serial", "process"):
+        ga = GeneticAlgorithm(compact, source, target, seed=seed, executor=mode,
+                              workers=workers, **ga_kwargs)
+        started = time.perf_counter()
+        results[mode] = (ga.run(generations=generations), time.perf_counter() - started)
+
+    (serial_result, serial_time), (parallel_result, parallel_time) = results["serial"], results["process"]
+    report = SpeedupReport(
+        serial_time,
+        parallel_time,
+        serial_time / parallel_time if parallel_time > 0 else float("inf"),
+        serial_result == parallel_result,
+    )
+    logger.info(
+        "Parallel GA: serial=%.3fs, parallel=%.3fs, speedup=%.2fx, identical=%s",
+        *report,
+    )
+    return report
@@ -3,8 +3,11 @@ Simulated Annealing tabanlı yönlendirme
 BSM307 - Güz 2025
 """
 
-from typing import Any
+import random
+from typing import Any, List, Optional
 
+from ...network.compact_graph import CompactGraph
+from ...routing.detour_index import DetourIndex
 from ...utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -17,12 +20,44 @@ class SimulatedAnnealingRouter:
         self.graph = graph
         self.temperature = temperature
         self.cooling = cooling
+        self._detours: Optional[DetourIndex] = None
         logger.info("Initialized SA temp=%s cooling=%s", temperature, cooling)
 
-    def neighbor(self, solution: Any) -> Any:
-        """TODO: Geçerli komşu çözüm üret."""
-        logger.debug("Generating neighbor (placeholder)")
-        return solution
+    @property
+    def detours(self) -> DetourIndex:
+        """Ortak komşu indeksi (ilk komşu üretiminde oluşturulur)."""
+        if self._detours is None:
+            compact = self.graph if isinstance(self.graph, CompactGraph) else CompactGraph.from_graph(self.graph)
+            self._detours = DetourIndex(compact)
+        return self._detours
+
+    def neighbor(self, solution: List[int]) -> List[int]:
+        """
+        Geçerli komşu çözüm üret (detour indeksi ile O(1) hamleler).
+        
+        1. Değiştirme: ara düğüm x'i prev–w–next olan bir w ile değiştir
+        2. Ekleme: değiştirme olmazsa u–v kenarını u–w–v ile uzat
+        Uç noktalar korunur, path basit kalır; hamle yoksa kopya döner.
+        """
+        path = list(solution)
+        if len(path) < 2:
+            return path
+        
+        on_path = set(path)
+        pos = random.randrange(len(path) - 1)
+        u, v = path[pos], path[pos + 1]
+        
+        if pos > 0:
+            w = self.detours.sample(path[pos - 1], v, exclude=u)
+            if w >= 0 and w not in on_path:
+                path[pos] = w
+                return path
+        
+        w = self.detours.sample(u, v)
+        if w >= 0 and w not in on_path:
+            path.insert(pos + 1, w)
+        logger.debug("Generated neighbor %s -> %s", solution, path)
+        return path
 
     def acceptance(self, current_cost: float, candidate_cost: float) -> float:
         """TODO: Kabul olasılığını hesapla."""
@@ -0,0 +1,203 @@
+"""
+Path metrik önbelleği (LRU)
+BSM307 - Güz 2025
+
+GA her generasyonda elit bireyi ve çaprazlanmadan kopyalanan parent'ları,
+initialize_population ise senaryolar arasında aynı shortest path'leri tekrar
+tekrar değerlendirir. PathMetricsCache bu sonuçları
+
+    (graf sürümü, kanonik path, ağırlık vektörü, ek parametreler)
+
+anahtarıyla saklar. Graf sürümü CompactGraph için içerik özetidir (fingerprint).
+networkx grafı için path'in geçtiği kenarların (delay, reliability, bandwidth)
+değerleridir: sonuç yalnızca bu değerlere bağlıdır ve O(L) sürede okunur.
+Attribute'lar nasıl değiştirilirse değiştirilsin (helper'lar veya doğrudan
+graph.edges[u, v][...] ataması) anahtar da değişir. Eski kayıtlar bir daha
+eşleşmez ve LRU ile düşer.
+Önbellek hem kayıt sayısı hem de (yaklaşık) bayt ile sınırlandırılır.
+"""
+
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Sequence, Tuple, Union
+
+import networkx as nx
+
+from ..network.compact_graph import CompactGraph
+from ..routing.path_validator import PathValidator
+from ..utils.logger import get_logger
+from .delay import total_delay
+from .path_evaluator import PathEvaluator, PathMetrics
+from .reliability import reliability_cost
+from .resource_cost import bandwidth_cost, weighted_sum
+
+logger = get_logger(__name__)
+
+# Tuple + OrderedDict düğümü için sabit ek yük ve path elemanı başına bayt
+_ENTRY_OVERHEAD = 160
+_BYTES_PER_NODE = 36
+# networkx anahtarlarında hop başına (delay, reliability, bandwidth) tuple'ı
+_BYTES_PER_HOP_ATTRIBUTES = 136
+
+_EDGE_FIELDS = ("delay", "reliability", "bandwidth")
+
+
+class CacheStats(NamedTuple):
+    """Önbellek sayaçları."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def graph_token(graph: Union[nx.Graph, CompactGraph], path: Sequence[int]) -> Hashable:
+    """
+    Önbellek anahtarında kullanılan graf sürümü.
+
+    CompactGraph için içerik özeti; networkx grafı için path'in her hop'unun
+    (delay, reliability, bandwidth) değerleri (kenar yoksa None).
+    """
+    if isinstance(graph, CompactGraph):
+        return graph.fingerprint
+    if len(path) < 2:
+        return tuple(node in graph for node in path)
+    adj = graph.adj
+    hops = []
+    for u, v in zip(path, path[1:]):
+        data = adj[u].get(v) if u in adj else None
+        hops.append(None if data is None else tuple(data.get(name) for name in _EDGE_FIELDS))
+    return tuple(hops)
+
+
+class PathMetricsCache:
+    """
+    Kayıt sayısı ve bayt ile sınırlı LRU path metrik önbelleği.
+
+    Aynı önbellek farklı GA örnekleri / senaryolar arasında paylaşılabilir.
+    """
+
+    def __init__(self, max_entries: int = 100_000, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            max_entries: En fazla kayıt sayısı
+            max_bytes: Yaklaşık en fazla bellek kullanımı (bayt)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        logger.info(
+            "Initialized PathMetricsCache max_entries=%s, max_bytes=%s", max_entries, max_bytes
+        )
+
+    @staticmethod
+    def key(
+        graph: Union[nx.Graph, CompactGraph],
+        path: Sequence[int],
+        weights: Optional[Sequence[float]] = None,
+        *extra: Hashable,
+    ) -> Tuple:
+        """Kanonik anahtar: (graf sürümü, path tuple'ı, ağırlıklar, ek parametreler)."""
+        path = tuple(path)
+        return (graph_token(graph, path), path, tuple(weights) if weights is not None else None) + extra
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, self.evictions, len(self._data), self._bytes)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Kayıt varsa döndürür ve LRU sırasını günceller (hit/miss sayılır)."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Kaydı ekler; sınırlar aşılırsa en eski kayıtları çıkarır."""
+        size = _ENTRY_OVERHEAD + _BYTES_PER_NODE * len(key[1]) + sys.getsizeof(value)
+        if isinstance(key[0], tuple):
+            size += _BYTES_PER_HOP_ATTRIBUTES * len(key[0])
+        old = self._data.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        self._data[key] = (value, size)
+        self._bytes += size
+        while self._data and (len(self._data) > self.max_entries or self._bytes > self.max_bytes):
+            _, (_, evicted_size) = self._data.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Önbellekte yoksa compute() ile hesaplayıp saklar."""
+        entry = self._data.get(key)
+        if entry is not None:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Tüm kayıtları siler (sayaçlar korunur)."""
+        self._data.clear()
+        self._bytes = 0
+
+    def metrics(
+        self,
+        graph: Union[nx.Graph, CompactGraph],
+        path: Sequence[int],
+        weights: Sequence[float] = (0.4, 0.3, 0.3),
+    ) -> Tuple[float, float, float, float]:
+        """
+        total_delay / reliability_cost / bandwidth_cost / weighted_sum sonucunu önbellekler.
+
+        Returns:
+            (delay, reliability_cost, resource_cost, weighted_score)
+        """
+        def compute() -> Tuple[float, float, float, float]:
+            delay = total_delay(graph=graph, path=path)
+            rel_cost = reliability_cost(graph=graph, path=path)
+            res_cost = bandwidth_cost(graph=graph, path=path)
+            return delay, rel_cost, res_cost, weighted_sum(delay, rel_cost, res_cost, weights)
+
+        return self.get_or_compute(self.key(graph, path, weights, "metrics"), compute)
+
+    def evaluation_key(self, evaluator: PathEvaluator, path: Sequence[int]) -> Tuple:
+        """PathEvaluator sonucu için anahtar (ağırlık, bandwidth ve uç noktalar dahil)."""
+        return self.key(
+            evaluator.graph, path, evaluator.weights, "evaluate",
+            evaluator.required_bandwidth, evaluator.source, evaluator.target,
+        )
+
+    def evaluate(self, evaluator: PathEvaluator, path: Sequence[int]) -> PathMetrics:
+        """PathEvaluator.evaluate sonucunu önbellekler."""
+        return self.get_or_compute(self.evaluation_key(evaluator, path), lambda: evaluator.evaluate(path))
+
+    def is_valid(self, validator: PathValidator, path: Sequence[int], required_bandwidth: float) -> bool:
+        """PathValidator.is_simple_path + has_capacity sonucunu önbellekler."""
+        key = self.key(validator.graph, path, None, "valid", required_bandwidth)
+        return self.get_or_compute(
+            key,
+            lambda: validator.is_simple_path(path) and validator.has_capacity(path, required_bandwidth),
+        )
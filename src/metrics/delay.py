@@ -7,6 +7,7 @@ from typing import Iterable, List, Union
 
 import networkx as nx
 
+from ..network.compact_graph import CompactGraph
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -14,7 +15,7 @@ logger = get_logger(__name__)
 
 def total_delay(
     path_delays: Union[Iterable[float], None] = None,
-    graph: Union[nx.Graph, None] = None,
+    graph: Union[nx.Graph, CompactGraph, None] = None,
     path: Union[List[int], None] = None,
 ) -> float:
     """
@@ -26,7 +27,7 @@ def total_delay(
     
     Args:
         path_delays: Path üzerindeki edge delay değerleri (ms)
-        graph: NetworkX graph objesi (path ile birlikte kullanılır)
+        graph: NetworkX graph veya CompactGraph objesi (path ile birlikte kullanılır)
         path: Düğüm listesi [u1, u2, u3, ...] (graph ile birlikte kullanılır)
         
     Returns:
@@ -46,6 +47,17 @@ def total_delay(
             return 0.0
         
         total = 0.0
+        if isinstance(graph, CompactGraph):
+            delays = graph.delay
+            for u, v in zip(path_list, path_list[1:]):
+                eid = graph.edge_id(u, v)
+                if eid >= 0:
+                    total += float(delays[eid])
+                else:
+                    logger.warning("Edge (%s, %s) does not exist in graph", u, v)
+            logger.debug("Computed total delay from path %s: %.2f ms", path_list, total)
+            return total
+        
         for i in range(len(path_list) - 1):
             u = path_list[i]
             v = path_list[i + 1]
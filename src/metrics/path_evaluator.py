@@ -0,0 +1,302 @@
+"""
+Tek geçişli path değerlendirici
+BSM307 - Güz 2025
+
+total_delay, reliability_cost, bandwidth_cost ve weighted_sum fonksiyonlarının
+ayrı ayrı yaptığı path gezinmelerini tek bir döngüde birleştirir. Kenar
+attribute'ları CompactGraph'tan bir kez Python listelerine alınır; her hop
+için yalnızca bir (u, v) → edge-id araması yapılır.
+
+Sayısal sonuçlar metrik fonksiyonlarıyla bit düzeyinde aynıdır (aynı toplama
+sırası ve aynı 1 / (BW / 1000) ifadesi kullanılır).
+
+Artımlı değerlendirme: PathPrefix bir path'in kümülatif delay / -log r /
+kaynak maliyeti ve prefix/suffix minimum bandwidth dizilerini taşır. Mutasyon
+veya segment değişimiyle oluşan child'ın skoru splice() ile yalnızca değişen
+segment gezilerek O(değişen hop) sürede hesaplanır. Child'ın basitliği de
+yeniden set kurulmadan, yalnızca yeni düğümler parent'ların düğüm → indeks
+sözlüklerinde aranarak bulunur. Güvenilirlik maliyeti burada -log r toplamı
+olarak birikir; evaluate() ile fark ~1e-12 düzeyindedir.
+"""
+
+import math
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import networkx as nx
+
+from ..network.compact_graph import CompactGraph
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+INF = float("inf")
+
+
+class PathMetrics(NamedTuple):
+    """Bir path için tüm amaç değerleri ve kısıt bilgisi."""
+
+    delay: float
+    reliability_cost: float
+    resource_cost: float
+    bottleneck_bandwidth: float
+    is_simple: bool
+    feasible: bool
+    score: float
+
+    @property
+    def fitness(self) -> float:
+        """GA fitness'ı: uygun path için ağırlıklı skor, aksi halde sonsuz."""
+        return self.score if self.feasible else INF
+
+
+class PathPrefix(NamedTuple):
+    """
+    Path ve kümülatif metrik dizileri (uzunluk = düğüm sayısı).
+
+    delay[k], reliability_cost[k], resource_cost[k]: ilk k hop'un toplamı
+    min_prefix[k]: ilk k hop'un minimum bandwidth'i (k=0 için inf)
+    min_suffix[k]: k. düğümden sonraki hop'ların minimum bandwidth'i
+    positions: düğüm → path'teki indeksi (path basitse len(positions) == len(path))
+    """
+
+    path: List[int]
+    delay: List[float]
+    reliability_cost: List[float]
+    resource_cost: List[float]
+    min_prefix: List[float]
+    min_suffix: List[float]
+    positions: Dict[int, int]
+
+    @property
+    def is_simple(self) -> bool:
+        return len(self.positions) == len(self.path)
+
+
+class PathEvaluator:
+    """
+    Path'i tek geçişte değerlendirip PathMetrics döndürür.
+
+    feasible = kenarların hepsi mevcut + path basit + bottleneck bandwidth
+    ≥ required_bandwidth + (verildiyse) uç noktalar source/target ile eşleşir.
+    """
+
+    def __init__(
+        self,
+        graph: Union[nx.Graph, CompactGraph],
+        weights: Sequence[float] = (0.4, 0.3, 0.3),
+        required_bandwidth: float = 0.0,
+        source: Optional[int] = None,
+        target: Optional[int] = None,
+    ):
+        """
+        Args:
+            graph: NetworkX graph veya CompactGraph objesi
+            weights: (delay_weight, reliability_weight, resource_weight)
+            required_bandwidth: Minimum gerekli bandwidth (Mbps)
+            source: Beklenen başlangıç düğümü (None ise kontrol edilmez)
+            target: Beklenen hedef düğümü (None ise kontrol edilmez)
+        """
+        self.graph = graph if isinstance(graph, CompactGraph) else CompactGraph.from_graph(graph)
+        self.weights = tuple(weights)
+        self.required_bandwidth = required_bandwidth
+        self.source = source
+        self.target = target
+
+        compact = self.graph
+        self._lookup = compact.edge_lookup
+        self._delay: List[float] = compact.delay.tolist()
+        self._reliability: List[float] = compact.reliability.tolist()
+        self._bandwidth: List[float] = compact.bandwidth.tolist()
+        self._resource: List[float] = [
+            (1.0 / (bw / 1000.0)) if bw > 0 else INF for bw in self._bandwidth
+        ]
+        self._log_reliability: List[float] = [
+            -math.log(r) if r > 0 else INF for r in self._reliability
+        ]
+        logger.debug(
+            "Initialized PathEvaluator weights=%s, required_bandwidth=%s",
+            self.weights, required_bandwidth,
+        )
+
+    def evaluate(self, path: Sequence[int]) -> PathMetrics:
+        """
+        Path'i tek geçişte değerlendirir.
+
+        Args:
+            path: Düğüm listesi [u1, u2, u3, ...]
+
+        Returns:
+            PathMetrics kaydı
+        """
+        path_list = path if isinstance(path, list) else list(path)
+        n_nodes = len(path_list)
+        is_simple = len(set(path_list)) == n_nodes
+        endpoints_ok = n_nodes > 0 and (
+            (self.source is None or path_list[0] == self.source)
+            and (self.target is None or path_list[-1] == self.target)
+        )
+
+        if n_nodes <= 1:
+            return PathMetrics(0.0, 0.0, 0.0, INF, is_simple, endpoints_ok, 0.0)
+
+        lookup = self._lookup
+        delays, rels, resources, bws = self._delay, self._reliability, self._resource, self._bandwidth
+        delay = 0.0
+        reliability = 1.0
+        resource = 0.0
+        bottleneck = INF
+        u = path_list[0]
+        for v in path_list[1:]:
+            eid = lookup.get((u, v), -1)
+            if eid < 0:
+                return PathMetrics(INF, INF, INF, 0.0, is_simple, False, INF)
+            delay += delays[eid]
+            reliability *= rels[eid]
+            resource += resources[eid]
+            bw = bws[eid]
+            if bw < bottleneck:
+                bottleneck = bw
+            u = v
+
+        rel_cost = -math.log(reliability) if reliability > 0 else INF
+        wd, wr, wc = self.weights
+        score = wd * delay + wr * rel_cost + wc * resource
+        feasible = endpoints_ok and is_simple and bottleneck >= self.required_bandwidth
+        return PathMetrics(delay, rel_cost, resource, bottleneck, is_simple, feasible, score)
+
+    def fitness(self, path: Sequence[int]) -> float:
+        """Kısa yol: evaluate(path).fitness"""
+        return self.evaluate(path).fitness
+
+    def prefix(self, path: Sequence[int]) -> Optional[PathPrefix]:
+        """
+        Path için kümülatif metrik dizilerini oluşturur.
+
+        Returns:
+            PathPrefix veya path'te olmayan bir kenar varsa None
+        """
+        path_list = list(path)
+        lookup = self._lookup
+        delays, logs, resources, bws = self._delay, self._log_reliability, self._resource, self._bandwidth
+        delay, rel, res, low = [0.0], [0.0], [0.0], [INF]
+        u = path_list[0] if path_list else None
+        for v in path_list[1:]:
+            eid = lookup.get((u, v), -1)
+            if eid < 0:
+                return None
+            delay.append(delay[-1] + delays[eid])
+            rel.append(rel[-1] + logs[eid])
+            res.append(res[-1] + resources[eid])
+            low.append(min(low[-1], bws[eid]))
+            u = v
+
+        suffix = [INF] * len(path_list)
+        for k in range(len(path_list) - 2, -1, -1):
+            suffix[k] = min(suffix[k + 1], bws[lookup[(path_list[k], path_list[k + 1])]])
+        positions = {node: k for k, node in enumerate(path_list)}
+        return PathPrefix(path_list, delay, rel, res, low, suffix, positions)
+
+    def metrics_from_prefix(self, prefix: PathPrefix) -> PathMetrics:
+        """PathPrefix'in son elemanlarından PathMetrics üretir (O(1))."""
+        path = prefix.path
+        return self._assemble(
+            path, prefix.delay[-1], prefix.reliability_cost[-1], prefix.resource_cost[-1],
+            prefix.min_prefix[-1] if len(path) > 1 else INF, prefix.is_simple,
+        )
+
+    def splice(
+        self,
+        head: PathPrefix,
+        i: int,
+        segment: Sequence[int],
+        tail: PathPrefix,
+        j: int,
+    ) -> Tuple[List[int], PathMetrics]:
+        """
+        child = head.path[:i+1] + segment + tail.path[j:] için metrikleri artımlı hesaplar.
+
+        Mutasyon için head ve tail aynı parent'tır (aynı PathPrefix nesnesi);
+        segment değişimi (crossover) için tail ikinci parent'tır. Yalnızca
+        head.path[i] → segment → tail.path[j] arasındaki hop'lar gezilir.
+
+        Returns:
+            (child path, PathMetrics)
+        """
+        segment = list(segment)
+        child = head.path[:i + 1] + segment + tail.path[j:]
+        is_simple = self._splice_is_simple(head, i, segment, tail, j)
+        lookup = self._lookup
+        delays, logs, resources, bws = self._delay, self._log_reliability, self._resource, self._bandwidth
+
+        tail_delay, tail_rel, tail_res = self._suffix_sums(tail, j)
+        delay = head.delay[i] + tail_delay
+        rel = head.reliability_cost[i] + tail_rel
+        res = head.resource_cost[i] + tail_res
+        low = min(head.min_prefix[i], tail.min_suffix[j])
+
+        u = head.path[i]
+        for v in segment + [tail.path[j]]:
+            eid = lookup.get((u, v), -1)
+            if eid < 0:
+                return child, PathMetrics(INF, INF, INF, 0.0, is_simple, False, INF)
+            delay += delays[eid]
+            rel += logs[eid]
+            res += resources[eid]
+            if bws[eid] < low:
+                low = bws[eid]
+            u = v
+
+        return child, self._assemble(child, delay, rel, res, low, is_simple)
+
+    @staticmethod
+    def _splice_is_simple(
+        head: PathPrefix, i: int, segment: List[int], tail: PathPrefix, j: int
+    ) -> bool:
+        """
+        Child'ın basitliği: yalnızca segment düğümleri ve (farklı parent'larda)
+        kısa olan parça diğer parent'ın positions sözlüğünde aranır.
+        """
+        if not (head.is_simple and tail.is_simple):
+            child = head.path[:i + 1] + segment + tail.path[j:]
+            return len(set(child)) == len(child)
+        if len(set(segment)) != len(segment):
+            return False
+        for node in segment:
+            if head.positions.get(node, i + 1) <= i or tail.positions.get(node, -1) >= j:
+                return False
+        if head is tail:
+            # Aynı basit path'in [:i+1] ve [j:] parçaları j > i ise ayrıktır
+            return j > i
+        if i + 1 <= len(tail.path) - j:
+            return all(tail.positions.get(node, -1) < j for node in head.path[:i + 1])
+        return all(head.positions.get(node, i + 1) > i for node in tail.path[j:])
+
+    def _suffix_sums(self, tail: PathPrefix, j: int) -> Tuple[float, float, float]:
+        """tail.path[j:] hop'larının (delay, -log r, kaynak) toplamları."""
+        delay, rel, res = tail.delay, tail.reliability_cost, tail.resource_cost
+        if delay[j] < INF and rel[j] < INF and res[j] < INF:
+            return delay[-1] - delay[j], rel[-1] - rel[j], res[-1] - res[j]
+        # j'ye kadar sonsuz bir kenar varsa (r=0 veya BW=0) fark NaN olur;
+        # kuyruk kenarları yeniden toplanır
+        lookup = self._lookup
+        total_delay = total_rel = total_res = 0.0
+        path = tail.path
+        for k in range(j, len(path) - 1):
+            eid = lookup[(path[k], path[k + 1])]
+            total_delay += self._delay[eid]
+            total_rel += self._log_reliability[eid]
+            total_res += self._resource[eid]
+        return total_delay, total_rel, total_res
+
+    def _assemble(
+        self, path: List[int], delay: float, rel_cost: float, resource: float,
+        bottleneck: float, is_simple: bool,
+    ) -> PathMetrics:
+        endpoints_ok = len(path) > 0 and (
+            (self.source is None or path[0] == self.source)
+            and (self.target is None or path[-1] == self.target)
+        )
+        wd, wr, wc = self.weights
+        score = wd * delay + wr * rel_cost + wc * resource
+        feasible = endpoints_ok and is_simple and bottleneck >= self.required_bandwidth
+        return PathMetrics(delay, rel_cost, resource, bottleneck, is_simple, feasible, score)
@@ -8,6 +8,7 @@ from typing import Iterable, List, Union
 
 import networkx as nx
 
+from ..network.compact_graph import CompactGraph
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -15,7 +16,7 @@ logger = get_logger(__name__)
 
 def reliability_cost(
     path_reliabilities: Union[Iterable[float], None] = None,
-    graph: Union[nx.Graph, None] = None,
+    graph: Union[nx.Graph, CompactGraph, None] = None,
     path: Union[List[int], None] = None,
 ) -> float:
     """
@@ -27,7 +28,7 @@ def reliability_cost(
     
     Args:
         path_reliabilities: Path üzerindeki edge reliability değerleri [0.0-1.0]
-        graph: NetworkX graph objesi (path ile birlikte kullanılır)
+        graph: NetworkX graph veya CompactGraph objesi (path ile birlikte kullanılır)
         path: Düğüm listesi [u1, u2, u3, ...] (graph ile birlikte kullanılır)
         
     Returns:
@@ -50,6 +51,18 @@ def reliability_cost(
             return 0.0
         
         reliability = 1.0
+        if isinstance(graph, CompactGraph):
+            edge_ids = graph.path_edge_ids(path_list)
+            if edge_ids is None:
+                logger.warning("Path %s contains an edge that does not exist in graph", path_list)
+                reliability = 0.0
+            else:
+                for eid in edge_ids:
+                    reliability *= float(graph.reliability[eid])
+            cost = -math.log(reliability) if reliability > 0 else float("inf")
+            logger.debug("Computed reliability=%.4f cost=%.4f from path %s", reliability, cost, path_list)
+            return cost
+        
         for i in range(len(path_list) - 1):
             u = path_list[i]
             v = path_list[i + 1]
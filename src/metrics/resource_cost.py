@@ -7,6 +7,7 @@ from typing import Iterable, List, Tuple, Union
 
 import networkx as nx
 
+from ..network.compact_graph import CompactGraph
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -14,7 +15,7 @@ logger = get_logger(__name__)
 
 def bandwidth_cost(
     path_bandwidths: Union[Iterable[float], None] = None,
-    graph: Union[nx.Graph, None] = None,
+    graph: Union[nx.Graph, CompactGraph, None] = None,
     path: Union[List[int], None] = None,
 ) -> float:
     """
@@ -29,7 +30,7 @@ def bandwidth_cost(
     
     Args:
         path_bandwidths: Path üzerindeki edge bandwidth değerleri (Mbps)
-        graph: NetworkX graph objesi (path ile birlikte kullanılır)
+        graph: NetworkX graph veya CompactGraph objesi (path ile birlikte kullanılır)
         path: Düğüm listesi [u1, u2, u3, ...] (graph ile birlikte kullanılır)
         
     Returns:
@@ -54,6 +55,17 @@ def bandwidth_cost(
             return 0.0
         
         total = 0.0
+        if isinstance(graph, CompactGraph):
+            edge_ids = graph.path_edge_ids(path_list)
+            if edge_ids is None:
+                logger.warning("Path %s contains an edge that does not exist in graph", path_list)
+                return float("inf")
+            for eid in edge_ids:
+                edge_bandwidth_gbps = float(graph.bandwidth[eid]) / 1000.0
+                total += (1.0 / edge_bandwidth_gbps) if edge_bandwidth_gbps > 0 else float("inf")
+            logger.debug("Computed bandwidth cost=%.4f from path %s", total, path_list)
+            return total
+        
         for i in range(len(path_list) - 1):
             u = path_list[i]
             v = path_list[i + 1]
@@ -0,0 +1,343 @@
+"""
+Dizi tabanlı (CSR) graf anlık görüntüsü
+BSM307 - Güz 2025
+
+RandomNetworkGenerator.generate() + attach_attributes() çıktısını bir kez
+okuyup metriklerin, PathValidator'ın ve GA'nın sıcak döngülerinde networkx
+dict-of-dict yapısına hiç dokunmadan kullanılabilecek donmuş bir yapı üretir:
+
+- indptr / indices: CSR komşuluk dizileri (her yönsüz kenar iki yönde saklanır)
+- delay / reliability / bandwidth: CSR slotlarına paralel kenar attribute dizileri
+- processing_delay / node_reliability: düğüm attribute dizileri
+- (u, v) → edge-id araması O(1) (ilk kullanımda kurulan dict), toplu aramalar için
+  sıralı anahtar dizisi
+"""
+
+import hashlib
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import networkx as nx
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _freeze(array: np.ndarray) -> np.ndarray:
+    """Diziyi salt-okunur yapar (snapshot değişmez kalmalı)."""
+    array.setflags(write=False)
+    return array
+
+
+@dataclass(frozen=True, eq=False)
+class CompactGraph:
+    """
+    networkx grafının salt-okunur CSR kopyası.
+
+    Düğümler 0..n-1 aralığında tamsayı olmalıdır (Erdos-Renyi üreticisinin
+    çıktısı bu şekildedir). Edge-id, CSR slot indeksidir; yani (u, v) ve (v, u)
+    farklı slotlara karşılık gelir ancak attribute değerleri aynıdır.
+    """
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    delay: np.ndarray
+    reliability: np.ndarray
+    bandwidth: np.ndarray
+    processing_delay: np.ndarray
+    node_reliability: np.ndarray
+    _edge_lookup: Optional[Dict[Tuple[int, int], int]] = field(default=None, repr=False)
+    _edge_keys: Optional[np.ndarray] = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        if self._edge_keys is None:
+            rows = np.repeat(np.arange(self.num_nodes, dtype=np.int64), np.diff(self.indptr))
+            # CSR satır + sütun sıralı olduğundan u*n+v anahtarları da sıralıdır
+            keys = rows * self.num_nodes + self.indices.astype(np.int64)
+            object.__setattr__(self, "_edge_keys", _freeze(keys))
+        for name in ("indptr", "indices", "delay", "reliability", "bandwidth",
+                     "processing_delay", "node_reliability"):
+            _freeze(getattr(self, name))
+
+    @classmethod
+    def from_graph(cls, graph: nx.Graph) -> "CompactGraph":
+        """
+        networkx grafından CSR anlık görüntüsü oluşturur.
+
+        Eksik attribute'lar metrik fonksiyonlarıyla aynı varsayılanları alır
+        (delay=0.0, reliability=1.0, bandwidth=0.0).
+
+        Args:
+            graph: Attribute'ları eklenmiş networkx.Graph (düğümler 0..n-1)
+
+        Returns:
+            CompactGraph objesi
+        """
+        n = graph.number_of_nodes()
+        if set(graph.nodes) != set(range(n)):
+            raise ValueError("CompactGraph requires integer node labels 0..n-1")
+
+        m = graph.number_of_edges()
+        src = np.empty(m, dtype=np.int64)
+        dst = np.empty(m, dtype=np.int64)
+        delay = np.empty(m, dtype=np.float64)
+        reliability = np.empty(m, dtype=np.float64)
+        bandwidth = np.empty(m, dtype=np.float64)
+        for i, (u, v, data) in enumerate(graph.edges(data=True)):
+            src[i] = u
+            dst[i] = v
+            delay[i] = data.get("delay", 0.0)
+            reliability[i] = data.get("reliability", 1.0)
+            bandwidth[i] = data.get("bandwidth", 0.0)
+
+        processing_delay = np.array(
+            [graph.nodes[i].get("processing_delay", 0.0) for i in range(n)], dtype=np.float64
+        )
+        node_reliability = np.array(
+            [graph.nodes[i].get("reliability", 1.0) for i in range(n)], dtype=np.float64
+        )
+
+        return cls.from_edge_arrays(
+            n, src, dst, delay, reliability, bandwidth, processing_delay, node_reliability
+        )
+
+    @classmethod
+    def from_edge_arrays(
+        cls,
+        num_nodes: int,
+        src: np.ndarray,
+        dst: np.ndarray,
+        delay: np.ndarray,
+        reliability: np.ndarray,
+        bandwidth: np.ndarray,
+        processing_delay: Optional[np.ndarray] = None,
+        node_reliability: Optional[np.ndarray] = None,
+    ) -> "CompactGraph":
+        """
+        Yönsüz kenar listesinden (her kenar bir kez) CSR yapısı kurar.
+
+        Args:
+            num_nodes: Düğüm sayısı
+            src, dst: Kenar uç noktaları (uzunluk m)
+            delay, reliability, bandwidth: Kenar attribute'ları (uzunluk m)
+            processing_delay, node_reliability: Düğüm attribute'ları (uzunluk n)
+        """
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        rows = np.concatenate([src, dst])
+        cols = np.concatenate([dst, src])
+        order = np.lexsort((cols, rows))
+
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=num_nodes), out=indptr[1:])
+
+        def _both_directions(values: np.ndarray) -> np.ndarray:
+            values = np.asarray(values, dtype=np.float64)
+            return np.concatenate([values, values])[order]
+
+        if processing_delay is None:
+            processing_delay = np.zeros(num_nodes, dtype=np.float64)
+        if node_reliability is None:
+            node_reliability = np.ones(num_nodes, dtype=np.float64)
+
+        compact = cls(
+            indptr=indptr,
+            indices=cols[order].astype(np.int32),
+            delay=_both_directions(delay),
+            reliability=_both_directions(reliability),
+            bandwidth=_both_directions(bandwidth),
+            processing_delay=np.array(processing_delay, dtype=np.float64),
+            node_reliability=np.array(node_reliability, dtype=np.float64),
+        )
+        logger.debug(
+            "Built CompactGraph with %d nodes and %d edges", compact.num_nodes, compact.num_edges
+        )
+        return compact
+
+    def to_networkx(self) -> nx.Graph:
+        """
+        Attribute'larıyla birlikte networkx.Graph'e dönüştürür (yalnızca gerektiğinde).
+
+        Returns:
+            from_graph() ile tekrar aynı CompactGraph'e dönüşen networkx.Graph
+        """
+        graph = nx.Graph()
+        graph.add_nodes_from(
+            (i, {"processing_delay": delay, "reliability": reliability})
+            for i, (delay, reliability) in enumerate(
+                zip(self.processing_delay.tolist(), self.node_reliability.tolist())
+            )
+        )
+        rows = np.repeat(np.arange(self.num_nodes, dtype=np.int64), np.diff(self.indptr))
+        upper = np.flatnonzero(rows < self.indices)
+        graph.add_edges_from(
+            (u, v, {"bandwidth": bw, "delay": delay, "reliability": reliability})
+            for u, v, bw, delay, reliability in zip(
+                rows[upper].tolist(), self.indices[upper].tolist(), self.bandwidth[upper].tolist(),
+                self.delay[upper].tolist(), self.reliability[upper].tolist(),
+            )
+        )
+        return graph
+
+    @property
+    def edge_lookup(self) -> Dict[Tuple[int, int], int]:
+        """
+        (u, v) → edge-id sözlüğü.
+
+        İlk kullanımda kurulur; büyük graflarda yalnızca vektörel edge_ids()
+        kullanan akışlar bu O(E) Python sözlüğünün maliyetini hiç ödemez.
+        """
+        lookup = self._edge_lookup
+        if lookup is None:
+            rows = np.repeat(np.arange(self.num_nodes, dtype=np.int64), np.diff(self.indptr))
+            lookup = dict(zip(zip(rows.tolist(), self.indices.tolist()), range(len(self.indices))))
+            object.__setattr__(self, "_edge_lookup", lookup)
+        return lookup
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self) -> int:
+        """Yönsüz kenar sayısı (CSR slot sayısının yarısı)."""
+        return len(self.indices) // 2
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Yapı ve attribute dizilerinin içerik özeti (blake2b).
+
+        Snapshot değişmez olduğundan bir kez hesaplanır; önbellek anahtarlarında
+        graf sürümü olarak kullanılır.
+        """
+        cached = self.__dict__.get("_fingerprint")
+        if cached is None:
+            digest = hashlib.blake2b(digest_size=16)
+            for name in ("indptr", "indices", "delay", "reliability", "bandwidth",
+                         "processing_delay", "node_reliability"):
+                digest.update(np.ascontiguousarray(getattr(self, name)).tobytes())
+            cached = digest.hexdigest()
+            object.__setattr__(self, "_fingerprint", cached)
+        return cached
+
+    @property
+    def resource_per_edge(self) -> np.ndarray:
+        """
+        CSR slotlarına paralel 1 / (BW / 1000) kaynak maliyetleri (BW=0 için inf).
+
+        Bir kez hesaplanıp saklanır; toplu değerlendirme ve çözücüler her
+        çağrıda yeniden bölme yapmaz.
+        """
+        cached = self.__dict__.get("_resource_per_edge")
+        if cached is None:
+            cached = np.divide(
+                1.0, self.bandwidth / 1000.0,
+                out=np.full(len(self.bandwidth), np.inf), where=self.bandwidth > 0,
+            )
+            object.__setattr__(self, "_resource_per_edge", _freeze(cached))
+        return cached
+
+    @property
+    def reliability_cost_per_edge(self) -> np.ndarray:
+        """CSR slotlarına paralel -log(reliability) maliyetleri (r=0 için inf); önbellekli."""
+        cached = self.__dict__.get("_reliability_cost_per_edge")
+        if cached is None:
+            with np.errstate(divide="ignore"):
+                cached = -np.log(self.reliability)
+            object.__setattr__(self, "_reliability_cost_per_edge", _freeze(cached))
+        return cached
+
+    def number_of_nodes(self) -> int:
+        """networkx ile uyumlu düğüm sayısı."""
+        return self.num_nodes
+
+    def number_of_edges(self) -> int:
+        """networkx ile uyumlu kenar sayısı."""
+        return self.num_edges
+
+    def edge_id(self, u: int, v: int) -> int:
+        """(u, v) kenarının CSR slot indeksini döndürür; kenar yoksa -1."""
+        return self.edge_lookup.get((u, v), -1)
+
+    def edge_ids(self, us: np.ndarray, vs: np.ndarray) -> np.ndarray:
+        """
+        Vektörel (u, v) → edge-id araması (searchsorted, O(log E) / eleman).
+
+        Returns:
+            Edge-id dizisi; kenarı olmayan çiftler için -1
+        """
+        us = np.asarray(us, dtype=np.int64)
+        vs = np.asarray(vs, dtype=np.int64)
+        if len(self._edge_keys) == 0:
+            return np.full(us.shape, -1, dtype=np.int64)
+        n = self.num_nodes
+        in_range = (us >= 0) & (us < n) & (vs >= 0) & (vs < n)
+        keys = np.where(in_range, us * n + vs, -1)
+        pos = np.searchsorted(self._edge_keys, keys)
+        pos_clipped = np.minimum(pos, len(self._edge_keys) - 1)
+        found = in_range & (self._edge_keys[pos_clipped] == keys)
+        return np.where(found, pos_clipped, -1)
+
+    def has_edge(self, u: int, v: int) -> bool:
+        return (u, v) in self.edge_lookup
+
+    def neighbors(self, u: int) -> List[int]:
+        """u düğümünün komşularını artan sırada döndürür."""
+        return self.indices[self.indptr[u]:self.indptr[u + 1]].tolist()
+
+    def degree(self, u: int) -> int:
+        return int(self.indptr[u + 1] - self.indptr[u])
+
+    def adjacency_matrix(self) -> csr_matrix:
+        """scipy.sparse CSR komşuluk matrisi (veri: 1.0)."""
+        data = np.ones(len(self.indices), dtype=np.float64)
+        return csr_matrix(
+            (data, self.indices, self.indptr), shape=(self.num_nodes, self.num_nodes), copy=True
+        )
+
+    def shortest_path(self, source: int, target: int) -> Optional[List[int]]:
+        """
+        Hop sayısına göre en kısa yolu BFS ile bulur.
+
+        Returns:
+            Düğüm listesi veya yol yoksa None
+        """
+        if source == target:
+            return [source]
+        indptr, indices = self.indptr, self.indices
+        parent = {source: source}
+        queue = deque([source])
+        while queue:
+            u = queue.popleft()
+            for v in indices[indptr[u]:indptr[u + 1]].tolist():
+                if v in parent:
+                    continue
+                parent[v] = u
+                if v == target:
+                    path = [v]
+                    while path[-1] != source:
+                        path.append(parent[path[-1]])
+                    path.reverse()
+                    return path
+                queue.append(v)
+        return None
+
+    def has_path(self, source: int, target: int) -> bool:
+        return self.shortest_path(source, target) is not None
+
+    def path_edge_ids(self, path: Iterable[int]) -> Optional[List[int]]:
+        """Path üzerindeki edge-id listesini döndürür; eksik kenar varsa None."""
+        path_list = list(path)
+        lookup = self.edge_lookup
+        edge_ids = []
+        for u, v in zip(path_list, path_list[1:]):
+            eid = lookup.get((u, v), -1)
+            if eid < 0:
+                return None
+            edge_ids.append(eid)
+        return edge_ids
@@ -6,19 +6,94 @@ BSM307 - Güz 2025
 - 250 düğümlü Erdos-Renyi G(n, p) modeli
 - Bağlantı olasılığı P = 0.4
 - Bağlı (connected) graf garantisi veya S-D çiftleri arasında yol garantisi
+
+Attribute örneklemesi (sample_attribute_arrays) NumPy Generator ile vektöreldir:
+np.random.default_rng(seed) akışından sırasıyla processing_delay (n),
+node reliability (n), bandwidth (m), delay (m), link reliability (m) tek birer
+uniform çağrısıyla çekilir. Aynı seed, aynı düğüm / kenar sayısı ve aynı
+AttributeRanges her zaman aynı dizileri üretir (global random durumundan bağımsız).
+
+Büyük topolojiler (10k–100k düğüm) için generate_compact() networkx'i tamamen
+atlar: üst üçgendeki n(n-1)/2 düğüm çifti satır sıralı tek bir indeks uzayı
+olarak görülür ve kenarlar arasındaki boşluklar geometrik dağılımdan bloklar
+halinde çekilir (geometric skipping, beklenen O(m) iş). Yapı akışı
+np.random.default_rng([seed, 1]) ile attribute akışından ayrıdır.
 """
 
-from typing import Tuple
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, NamedTuple, Tuple, Union
 
 import networkx as nx
+import numpy as np
 
+from ..utils.disjoint_set import DisjointSet
 from ..utils.logger import get_logger
 from ..utils.random_seed import set_seed
-from ..utils.graph_helpers import add_node_attributes, add_edge_attributes
+from .compact_graph import CompactGraph
 
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class AttributeRanges:
+    """PDF attribute aralıkları (Bölüm 2.2 / 2.3) ve yuvarlama basamakları."""
+
+    processing_delay: Tuple[float, float] = (0.5, 2.0)
+    node_reliability: Tuple[float, float] = (0.95, 0.999)
+    bandwidth: Tuple[float, float] = (100.0, 1000.0)
+    delay: Tuple[float, float] = (3.0, 15.0)
+    reliability: Tuple[float, float] = (0.95, 0.999)
+
+
+class AttributeArrays(NamedTuple):
+    """Düğüm (uzunluk n) ve kenar listesine hizalı (uzunluk m) attribute dizileri."""
+
+    processing_delay: np.ndarray
+    node_reliability: np.ndarray
+    bandwidth: np.ndarray
+    delay: np.ndarray
+    reliability: np.ndarray
+
+
+# Üretim algoritmasının sürümü: aynı (n, p, seed, aralıklar) için çıktıyı değiştiren
+# her değişiklikte (örnekleme sırası, akışlar, köprü seçimi) artırılmalıdır;
+# topoloji önbelleği anahtarının parçasıdır
+GENERATOR_VERSION = 1
+
+# Yapı (kenar) örneklemesi ve köprü kenar seçimi için ayrı akışlar: default_rng([seed, stream])
+_STRUCTURE_STREAM = 1
+_BRIDGE_STREAM = 2
+
+
+class GenerationBenchmark(NamedTuple):
+    """generate_compact() ölçümü (bir (n, p) noktası)."""
+
+    num_nodes: int
+    edge_prob: float
+    num_edges: int
+    sample_seconds: float
+    total_seconds: float
+    edges_per_second: float
+
+
+def _pairs_from_offsets(num_nodes: int, offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Üst üçgen satır sıralı indeksleri (u < v) çiftlerine çevirir."""
+    rows = np.arange(num_nodes, dtype=np.int64)
+    # row_start[u] = u satırından önceki çift sayısı
+    row_start = rows * (2 * num_nodes - rows - 1) // 2
+    u = np.searchsorted(row_start, offsets, side="right") - 1
+    v = offsets - row_start[u] + u + 1
+    return u, v
+
+
+def _check_labels(graph: nx.Graph) -> None:
+    """Düğüm dizileri id ile indekslendiğinden etiketler 0..n-1 olmalıdır."""
+    if set(graph.nodes) != set(range(graph.number_of_nodes())):
+        raise ValueError("CompactGraph requires integer node labels 0..n-1")
+
+
 class RandomNetworkGenerator:
     """
     Erdos–Renyi tabanlı rastgele ağ üretimi.
@@ -29,16 +104,24 @@ class RandomNetworkGenerator:
     - Bağlı graf garantisi
     """
 
-    def __init__(self, num_nodes: int = 250, edge_prob: float = 0.4, seed: int = 42):
+    def __init__(
+        self,
+        num_nodes: int = 250,
+        edge_prob: float = 0.4,
+        seed: int = 42,
+        ranges: AttributeRanges = AttributeRanges(),
+    ):
         """
         Args:
             num_nodes: Düğüm sayısı (varsayılan: 250)
             edge_prob: Bağlantı olasılığı (varsayılan: 0.4 - PDF gereksinimi)
             seed: Rastgele tohum değeri
+            ranges: Attribute aralıkları (varsayılan: PDF değerleri)
         """
         self.num_nodes = num_nodes
         self.edge_prob = edge_prob
         self.seed = seed
+        self.ranges = ranges
         logger.info(
             "Initialized RandomNetworkGenerator nodes=%s, p=%s, seed=%s",
             num_nodes,
@@ -63,104 +146,235 @@ class RandomNetworkGenerator:
         # Erdos-Renyi graf üretimi
         graph = nx.erdos_renyi_graph(self.num_nodes, self.edge_prob, seed=self.seed)
         
-        # Bağlılık kontrolü ve garantisi
-        if not nx.is_connected(graph):
-            logger.warning(
-                "Generated graph is not connected. Attempting to connect components..."
-            )
-            # Bağlı bileşenleri birleştir
-            components = list(nx.connected_components(graph))
-            if len(components) > 1:
-                # En büyük bileşeni bul
-                largest_component = max(components, key=len)
-                # Diğer bileşenleri en büyük bileşene bağla
-                for component in components:
-                    if component != largest_component:
-                        # Her bileşenden bir düğüm seç ve bağla
-                        node_from_component = next(iter(component))
-                        node_to_largest = next(iter(largest_component))
-                        graph.add_edge(node_from_component, node_to_largest)
-                        logger.debug(
-                            "Connected component %s to largest component via edge (%s, %s)",
-                            component,
-                            node_from_component,
-                            node_to_largest,
-                        )
+        # Bağlılık garantisi: tek union-find geçişi + en az sayıda köprü kenar
+        n, m = graph.number_of_nodes(), graph.number_of_edges()
+        edges = np.fromiter(
+            itertools.chain.from_iterable(graph.edges()), dtype=np.int64, count=2 * m
+        ).reshape(m, 2)
+        bridge_src, bridge_dst = self._bridging_edges(edges[:, 0], edges[:, 1])
+        graph.add_edges_from(zip(bridge_src.tolist(), bridge_dst.tolist()))
         
-        # Bağlılık garantisi kontrolü
-        if not nx.is_connected(graph):
-            logger.error("Failed to create connected graph. Retrying with different seed...")
-            # Alternatif: Yeniden üret (daha yüksek edge_prob ile)
-            set_seed(self.seed + 1)
-            graph = nx.erdos_renyi_graph(self.num_nodes, min(0.5, self.edge_prob * 1.2), seed=self.seed + 1)
-            if not nx.is_connected(graph):
-                # Son çare: Minimum spanning tree ekle
-                if graph.number_of_nodes() > 1:
-                    mst = nx.minimum_spanning_tree(nx.complete_graph(self.num_nodes))
-                    graph = nx.compose(graph, mst)
-        
-        # Final kontrol
-        is_connected = nx.is_connected(graph)
         logger.info(
-            "Generated graph with %d nodes, %d edges, connected=%s",
-            graph.number_of_nodes(),
+            "Generated graph with %d nodes, %d edges (%d bridging), connected=True",
+            n,
             graph.number_of_edges(),
-            is_connected,
+            len(bridge_src),
         )
         
-        if not is_connected:
-            logger.warning(
-                "Graph is still not connected. Some S-D pairs may not have paths."
-            )
-        
         return graph
 
+    def sample_edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        G(n, p) kenarlarını geometric skipping ile doğrudan dizilere örnekler.
+
+        Returns:
+            (src, dst) int64 dizileri; src < dst ve (src, dst) sözlük sırasında
+        """
+        n, p = self.num_nodes, self.edge_prob
+        total = n * (n - 1) // 2
+        if total == 0 or p <= 0.0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty.copy()
+        if p >= 1.0:
+            offsets = np.arange(total, dtype=np.int64)
+            return _pairs_from_offsets(n, offsets)
+
+        rng = np.random.default_rng([self.seed, _STRUCTURE_STREAM])
+        # Beklenen kenar sayısı + 4 sigma kadar boşluk; çoğu zaman tek blok yeter
+        expected = total * p
+        block = int(expected + 4.0 * np.sqrt(expected * (1.0 - p))) + 16
+        chunks: List[np.ndarray] = []
+        position = -1
+        while True:
+            offsets = position + np.cumsum(rng.geometric(p, size=block))
+            if offsets[-1] >= total:
+                chunks.append(offsets[offsets < total])
+                break
+            chunks.append(offsets)
+            position = int(offsets[-1])
+        return _pairs_from_offsets(n, np.concatenate(chunks))
+
+    def _bridging_edges(self, src: np.ndarray, dst: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Kenarları tek geçişte DisjointSet'e ekler ve grafı bağlamak için gereken
+        en az sayıda (bileşen sayısı - 1) köprü kenarı seçer.
+
+        Her küçük bileşenin kökü, en büyük bileşenden rastgele seçilen bir düğüme
+        bağlanır. Graf bağlandığı anda geçiş erken biter.
+
+        Returns:
+            (src, dst) köprü kenarları (src < dst); graf zaten bağlıysa boş
+        """
+        n = self.num_nodes
+        dsu = DisjointSet(n)
+        for u, v in zip(src.tolist(), dst.tolist()):
+            if dsu.union(u, v) and dsu.components == 1:
+                break
+        if dsu.components <= 1:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        roots = np.fromiter((dsu.find(i) for i in range(n)), dtype=np.int64, count=n)
+        labels, sizes = np.unique(roots, return_counts=True)
+        main = labels[sizes.argmax()]
+        others = labels[labels != main]
+        rng = np.random.default_rng([self.seed, _BRIDGE_STREAM])
+        anchors = rng.choice(np.flatnonzero(roots == main), size=len(others))
+        logger.warning(
+            "Graph had %d components; adding %d bridging edges", len(labels), len(others)
+        )
+        return np.minimum(others, anchors), np.maximum(others, anchors)
+
+    def generate_compact(
+        self, to_networkx: bool = False
+    ) -> Union[CompactGraph, Tuple[CompactGraph, nx.Graph]]:
+        """
+        networkx kullanmadan bağlı bir G(n, p) grafını ve attribute'larını CSR
+        olarak üretir (köprü kenarlar da örneklenmiş attribute'lar alır).
+
+        Args:
+            to_networkx: True ise attribute'lu networkx.Graph de döndürülür
+
+        Returns:
+            CompactGraph veya to_networkx=True ise (CompactGraph, nx.Graph)
+        """
+        compact = self._compact_from_edges(*self.sample_edges())
+        if to_networkx:
+            return compact, compact.to_networkx()
+        return compact
+
+    def _compact_from_edges(self, src: np.ndarray, dst: np.ndarray) -> CompactGraph:
+        """Örneklenmiş kenarları köprülerle bağlar, attribute'ları örnekler ve CSR kurar."""
+        bridge_src, bridge_dst = self._bridging_edges(src, dst)
+        if len(bridge_src):
+            src = np.concatenate([src, bridge_src])
+            dst = np.concatenate([dst, bridge_dst])
+        attrs = self.sample_attribute_arrays(self.num_nodes, len(src))
+        compact = CompactGraph.from_edge_arrays(
+            self.num_nodes, src, dst, attrs.delay, attrs.reliability, attrs.bandwidth,
+            attrs.processing_delay, attrs.node_reliability,
+        )
+        logger.info(
+            "Generated compact graph with %d nodes, %d edges (p=%s)",
+            compact.num_nodes, compact.num_edges, self.edge_prob,
+        )
+        return compact
+
     def attach_attributes(self, graph: nx.Graph) -> nx.Graph:
-        """Örnek attribute ekleme akışı."""
-        node_attrs, edge_attrs = self._sample_attributes(graph)
-        add_node_attributes(graph, node_attrs)
-        add_edge_attributes(graph, edge_attrs)
+        """
+        Vektörel örneklenen attribute'ları networkx grafına yazar (CSR kurulmaz).
+
+        Raises:
+            ValueError: Düğüm etiketleri 0..n-1 değilse
+        """
+        _check_labels(graph)
+        attrs = self.sample_attribute_arrays(graph.number_of_nodes(), graph.number_of_edges())
+        self._write_graph(graph, attrs)
         return graph
 
-    def _sample_attributes(self, graph: nx.Graph) -> Tuple[dict, dict]:
+    def compact(self, graph: nx.Graph, write_graph: bool = False) -> CompactGraph:
+        """
+        Grafın kenar listesi için attribute'ları örnekler ve doğrudan CSR
+        dizilerine yazar; networkx grafına yalnızca istenirse yazılır.
+
+        Args:
+            graph: generate() çıktısı (düğümler 0..n-1)
+            write_graph: True ise attribute'lar graph'a da eklenir
+
+        Returns:
+            CompactGraph (write_graph=True iken CompactGraph.from_graph(graph) ile aynı)
+
+        Raises:
+            ValueError: Düğüm etiketleri 0..n-1 değilse
+        """
+        _check_labels(graph)
+        n, m = graph.number_of_nodes(), graph.number_of_edges()
+        edges = np.fromiter(
+            itertools.chain.from_iterable(graph.edges()), dtype=np.int64, count=2 * m
+        ).reshape(m, 2)
+        attrs = self.sample_attribute_arrays(n, m)
+        if write_graph:
+            self._write_graph(graph, attrs)
+        return CompactGraph.from_edge_arrays(
+            n, edges[:, 0], edges[:, 1], attrs.delay, attrs.reliability, attrs.bandwidth,
+            attrs.processing_delay, attrs.node_reliability,
+        )
+
+    def sample_attribute_arrays(self, num_nodes: int, num_edges: int) -> AttributeArrays:
         """
-        PDF gereksinimlerine göre gerçekçi attribute dağılımları üretir.
+        PDF gereksinimlerine göre attribute dizilerini tek seferde üretir.
 
         PDF Node Özellikleri (Bölüm 2.2):
-        - ProcessingDelay: [0.5 ms - 2.0 ms] arası rastgele
-        - NodeReliability: [0.95, 0.999] arası rastgele
+        - ProcessingDelay: [0.5 ms - 2.0 ms] arası rastgele (2 basamak)
+        - NodeReliability: [0.95, 0.999] arası rastgele (4 basamak)
 
         PDF Link Özellikleri (Bölüm 2.3):
-        - Bandwidth: [100 Mbps, 1000 Mbps] arası rastgele
-        - LinkDelay: [3 ms, 15 ms] arası rastgele
-        - LinkReliability: [0.95, 0.999] arası rastgele
-        """
-        import random
-
-        # Node attributes (Issue #2) - PDF Section 2.2
-        node_attrs = {}
-        for n in graph.nodes:
-            # ProcessingDelay: [0.5 ms - 2.0 ms] arası uniform rastgele
-            processing_delay = random.uniform(0.5, 2.0)
-            # NodeReliability: [0.95, 0.999] arası uniform rastgele
-            node_reliability = random.uniform(0.95, 0.999)
-            node_attrs[n] = {
-                "processing_delay": round(processing_delay, 2),
-                "reliability": round(node_reliability, 4)
-            }
-
-        # Edge attributes (Issue #3 - şimdilik placeholder, sonra güncellenecek)
-        edge_attrs = {}
-        for u, v in graph.edges:
-            bandwidth = random.uniform(100, 1000)  # [100-1000 Mbps] - PDF
-            link_delay = random.uniform(3, 15)      # [3-15 ms] - PDF
-            link_reliability = random.uniform(0.95, 0.999)  # [0.95-0.999] - PDF
-            edge_attrs[(u, v)] = {
-                "bandwidth": round(bandwidth, 1),
-                "delay": round(link_delay, 2),
-                "reliability": round(link_reliability, 4)
-            }
-
-        logger.debug(f"Sampled attributes for {len(node_attrs)} nodes and {len(edge_attrs)} edges")
-        return node_attrs, edge_attrs
+        - Bandwidth: [100 Mbps, 1000 Mbps] arası rastgele (1 basamak)
+        - LinkDelay: [3 ms, 15 ms] arası rastgele (2 basamak)
+        - LinkReliability: [0.95, 0.999] arası rastgele (4 basamak)
 
+        Akış sırası modül açıklamasında belgelenmiştir; kenar dizileri
+        graph.edges() sırasına hizalıdır.
+        """
+        rng = np.random.default_rng(self.seed)
+        ranges = self.ranges
+        attrs = AttributeArrays(
+            processing_delay=np.round(rng.uniform(*ranges.processing_delay, size=num_nodes), 2),
+            node_reliability=np.round(rng.uniform(*ranges.node_reliability, size=num_nodes), 4),
+            bandwidth=np.round(rng.uniform(*ranges.bandwidth, size=num_edges), 1),
+            delay=np.round(rng.uniform(*ranges.delay, size=num_edges), 2),
+            reliability=np.round(rng.uniform(*ranges.reliability, size=num_edges), 4),
+        )
+        logger.debug("Sampled attributes for %d nodes and %d edges", num_nodes, num_edges)
+        return attrs
+
+    @staticmethod
+    def _write_graph(graph: nx.Graph, attrs: AttributeArrays) -> None:
+        """
+        Düğüm dizilerini düğüm id'sine (0..n-1), kenar dizilerini graph.edges
+        sırasına göre attribute dict'lerine yazar.
+        """
+        nodes = graph.nodes
+        for node, delay, reliability in zip(
+            range(len(attrs.processing_delay)), attrs.processing_delay.tolist(),
+            attrs.node_reliability.tolist(),
+        ):
+            data = nodes[node]
+            data["processing_delay"] = delay
+            data["reliability"] = reliability
+        for (_, _, data), bandwidth, delay, reliability in zip(
+            graph.edges(data=True), attrs.bandwidth.tolist(), attrs.delay.tolist(),
+            attrs.reliability.tolist(),
+        ):
+            data["bandwidth"] = bandwidth
+            data["delay"] = delay
+            data["reliability"] = reliability
+
+
+def benchmark_generation(
+    points: Iterable[Tuple[int, float]] = ((1000, 0.4), (10000, 0.01), (50000, 0.001), (100000, 0.0002)),
+    seed: int = 42,
+) -> List[GenerationBenchmark]:
+    """
+    generate_compact() hızını farklı (n, p) noktalarında ölçer.
+
+    Returns:
+        Her nokta için GenerationBenchmark (kenar örnekleme ve toplam süre, kenar/sn)
+    """
+    results = []
+    for num_nodes, edge_prob in points:
+        generator = RandomNetworkGenerator(num_nodes, edge_prob, seed)
+        started = time.perf_counter()
+        src, dst = generator.sample_edges()
+        sampled = time.perf_counter()
+        compact = generator._compact_from_edges(src, dst)
+        finished = time.perf_counter()
+        total = finished - started
+        results.append(GenerationBenchmark(
+            num_nodes, edge_prob, compact.num_edges, sampled - started, total,
+            compact.num_edges / total if total > 0 else float("inf"),
+        ))
+        logger.info(
+            "Benchmark n=%d p=%s: %d edges, sample %.3fs, total %.3fs (%.0f edges/s)",
+            num_nodes, edge_prob, len(src), sampled - started, total, results[-1].edges_per_second,
+        )
+    return results
@@ -0,0 +1,142 @@
+"""
+Paylaşımlı bellekte (multiprocessing.shared_memory) CompactGraph
+BSM307 - Güz 2025
+
+Süreç havuzlarında her worker'ın grafı kendi belleğine kopyalaması yerine
+CompactGraph'ın CSR ve attribute dizileri (ve resource_per_edge gibi türetilmiş
+diziler) tek bir paylaşımlı bellek segmentine bir kez yazılır. Worker'lara
+yalnızca küçük bir SharedGraphHandle (segment adı + dizi düzeni) gönderilir;
+attach_graph() dizileri segment üzerinde kopyasız, salt-okunur NumPy
+görünümleri olarak açar. Böylece worker başına bellek graf boyutundan
+bağımsızdır.
+
+Yaşam döngüsü:
+- Segmenti yalnızca onu oluşturan SharedGraph sahibi siler (close / with bloğu)
+- Sahip kapatılmadan çöp toplanırsa veya yorumlayıcı kapanırsa weakref.finalize
+  segmenti yine siler; süreç çökerse multiprocessing resource tracker siler
+- Worker'lar segmenti süreç ömrü boyunca açık tutar, hiçbir zaman silmez
+"""
+
+import weakref
+from multiprocessing import shared_memory
+from typing import Dict, NamedTuple, Tuple
+
+import numpy as np
+
+from ..utils.logger import get_logger
+from .compact_graph import CompactGraph
+
+logger = get_logger(__name__)
+
+_ARRAY_FIELDS = (
+    "indptr", "indices", "delay", "reliability", "bandwidth", "processing_delay", "node_reliability",
+    "_edge_keys",
+)
+
+# CompactGraph'ın tembel hesapladığı türetilmiş diziler: sahip bir kez hesaplar,
+# worker'lar kendi kopyalarını üretmek yerine segmentteki görünümü kullanır
+_DERIVED_FIELDS = ("resource_per_edge", "reliability_cost_per_edge")
+
+# Dizilerin segment içindeki hizalaması (byte)
+_ALIGNMENT = 64
+
+# Worker'da açılmış segmentler (görünümler yaşadıkça eşleme açık kalmalı)
+_ATTACHED: Dict[str, shared_memory.SharedMemory] = {}
+
+
+class SharedGraphHandle(NamedTuple):
+    """Worker'lara gönderilen segment adı ve (alan, dtype, shape, offset) düzeni."""
+
+    name: str
+    layout: Tuple[Tuple[str, str, Tuple[int, ...], int], ...]
+
+
+def _release(segment: shared_memory.SharedMemory) -> None:
+    segment.close()
+    try:
+        segment.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class SharedGraph:
+    """
+    CompactGraph'ı paylaşımlı belleğe yayınlayan sahip taraf.
+
+    Context manager olarak veya close() ile kapatılarak kullanılmalıdır.
+    """
+
+    def __init__(self, graph: CompactGraph):
+        """
+        Args:
+            graph: Yayınlanacak CompactGraph
+        """
+        layout = []
+        size = 0
+        for name in _ARRAY_FIELDS + _DERIVED_FIELDS:
+            array = getattr(graph, name)
+            layout.append((name, array.dtype.str, array.shape, size))
+            size += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+        self._segment = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for name, dtype, shape, offset in layout:
+            view = np.ndarray(shape, dtype=dtype, buffer=self._segment.buf, offset=offset)
+            view[...] = getattr(graph, name)
+            del view
+        self.handle = SharedGraphHandle(self._segment.name, tuple(layout))
+        self.nbytes = size
+        self._finalizer = weakref.finalize(self, _release, self._segment)
+        logger.info(
+            "Published CompactGraph to shared memory %s (%d nodes, %d edges, %.1f MB)",
+            self.handle.name, graph.num_nodes, graph.num_edges, size / 1e6,
+        )
+
+    @property
+    def closed(self) -> bool:
+        return not self._finalizer.alive
+
+    def close(self) -> None:
+        """Segmenti kapatır ve siler (birden fazla çağrı güvenlidir)."""
+        if self._finalizer.alive:
+            self._finalizer()
+            logger.debug("Released shared memory %s", self.handle.name)
+
+    def __enter__(self) -> "SharedGraph":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _open_segment(name: str) -> shared_memory.SharedMemory:
+    try:
+        # Python 3.13+: worker'lar segmenti resource tracker'a kaydetmez
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def attach_graph(handle: SharedGraphHandle) -> CompactGraph:
+    """
+    Paylaşımlı segmentteki grafı kopyasız ve salt-okunur olarak açar.
+
+    Aynı süreçte aynı segment birden fazla kez açılırsa eşleme yeniden kullanılır.
+
+    Raises:
+        FileNotFoundError: Segment sahibi tarafından silinmişse
+    """
+    segment = _ATTACHED.get(handle.name)
+    if segment is None:
+        segment = _ATTACHED[handle.name] = _open_segment(handle.name)
+    arrays = {
+        name.lstrip("_"): np.ndarray(shape, dtype=dtype, buffer=segment.buf, offset=offset)
+        for name, dtype, shape, offset in handle.layout
+    }
+    derived = {name: arrays.pop(name) for name in _DERIVED_FIELDS}
+    edge_keys = arrays.pop("edge_keys")
+    edge_keys.setflags(write=False)
+    graph = CompactGraph(**arrays, _edge_keys=edge_keys)
+    for name, view in derived.items():
+        view.setflags(write=False)
+        object.__setattr__(graph, f"_{name}", view)
+    return graph
@@ -0,0 +1,162 @@
+"""
+İçerik adresli disk üzerinde topoloji önbelleği
+BSM307 - Güz 2025
+
+Üretilen topolojiler (CSR yapısı + attribute'lar) her CompactGraph dizisi için
+ayrı bir .npy dosyası olarak saklanır; dizin adı (üretici türü, n, p, seed,
+attribute aralıkları, format sürümü, üretici algoritma sürümü) tanımının
+blake2b özetidir. Parametrelerden biri değişirse veya generator.GENERATOR_VERSION
+artırılırsa anahtar da değişir, eski girdiler hiç okunmaz.
+
+Yükleme np.load(mmap_mode="r") ile yapılır: diziler salt-okunur bellek
+eşlemeli açılır, sayfalar yalnızca dokunuldukça okunur. Sıcak yüklemede ne
+graf üretimi ne de networkx kurulumu çalışır.
+
+Yazma önce geçici bir dizine yapılır ve os.replace ile atomik olarak
+yerine taşınır; yarım kalmış bir yazma hiçbir zaman geçerli girdi sayılmaz.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from ..utils.logger import get_logger
+from .compact_graph import CompactGraph
+from .generator import GENERATOR_VERSION, RandomNetworkGenerator
+
+logger = get_logger(__name__)
+
+# Dosya düzeni değişirse artırılır (anahtarın parçasıdır)
+FORMAT_VERSION = 1
+
+# generate() + attach_attributes() veya networkx'siz generate_compact()
+GENERATOR_KINDS = ("networkx", "compact")
+
+_ARRAY_FIELDS = (
+    "indptr", "indices", "delay", "reliability", "bandwidth", "processing_delay", "node_reliability",
+)
+
+_DEFAULT_DIRECTORY = Path.home() / ".cache" / "bsm307" / "topologies"
+
+
+def topology_spec(generator: RandomNetworkGenerator, kind: str = "networkx") -> Dict[str, object]:
+    """Önbellek anahtarını belirleyen üretim tanımı."""
+    if kind not in GENERATOR_KINDS:
+        raise ValueError(f"kind must be one of {GENERATOR_KINDS}, got {kind!r}")
+    return {
+        "format_version": FORMAT_VERSION,
+        "generator_version": GENERATOR_VERSION,
+        "kind": kind,
+        "num_nodes": generator.num_nodes,
+        "edge_prob": generator.edge_prob,
+        "seed": generator.seed,
+        "ranges": asdict(generator.ranges),
+    }
+
+
+def topology_key(generator: RandomNetworkGenerator, kind: str = "networkx") -> str:
+    """Üretim tanımının içerik özeti (dizin adı)."""
+    payload = json.dumps(topology_spec(generator, kind), sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class TopologyCache:
+    """Anahtar → .npy dizin önbelleği; yüklemeler bellek eşlemelidir."""
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            directory: Önbellek kök dizini (None ise BSM307_TOPOLOGY_CACHE ortam
+                değişkeni, o da yoksa ~/.cache/bsm307/topologies)
+        """
+        if directory is None:
+            directory = os.environ.get("BSM307_TOPOLOGY_CACHE", _DEFAULT_DIRECTORY)
+        self.directory = Path(directory)
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, generator: RandomNetworkGenerator, kind: str = "networkx") -> Path:
+        return self.directory / topology_key(generator, kind)
+
+    def load(self, generator: RandomNetworkGenerator, kind: str = "networkx") -> Optional[CompactGraph]:
+        """
+        Önbellekteki topolojiyi bellek eşlemeli olarak açar.
+
+        Returns:
+            CompactGraph veya girdi yoksa / sürümü uyuşmuyorsa None
+        """
+        entry = self.path(generator, kind)
+        try:
+            meta = json.loads((entry / "meta.json").read_text(encoding="utf-8"))
+            if meta.get("spec") != json.loads(json.dumps(topology_spec(generator, kind))):
+                logger.warning("Topology cache entry %s does not match its key; ignoring", entry)
+                return None
+            arrays = {name: np.load(entry / f"{name}.npy", mmap_mode="r") for name in _ARRAY_FIELDS}
+            edge_keys = np.load(entry / "edge_keys.npy", mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        return CompactGraph(**arrays, _edge_keys=edge_keys)
+
+    def save(
+        self, generator: RandomNetworkGenerator, graph: CompactGraph, kind: str = "networkx"
+    ) -> Path:
+        """Topolojiyi atomik olarak önbelleğe yazar."""
+        entry = self.path(generator, kind)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{entry.name}-", dir=self.directory))
+        try:
+            for name in _ARRAY_FIELDS:
+                np.save(staging / f"{name}.npy", np.ascontiguousarray(getattr(graph, name)))
+            np.save(staging / "edge_keys.npy", np.ascontiguousarray(graph._edge_keys))
+            meta = {
+                "spec": topology_spec(generator, kind),
+                "num_edges": graph.num_edges,
+                "fingerprint": graph.fingerprint,
+            }
+            (staging / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+            try:
+                os.replace(staging, entry)
+            except OSError:
+                # Girdi zaten var: başka bir süreç aynı içeriği yazmış olabilir;
+                # geçersiz (bozuk / eski) bir girdiyse yenisiyle değiştirilir
+                if self.load(generator, kind) is None:
+                    shutil.rmtree(entry, ignore_errors=True)
+                    os.replace(staging, entry)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        logger.info("Cached topology %s (%d nodes, %d edges)", entry.name, graph.num_nodes, graph.num_edges)
+        return entry
+
+    def get(self, generator: RandomNetworkGenerator, kind: str = "networkx") -> CompactGraph:
+        """
+        Önbellekteyse bellek eşlemeli topolojiyi, değilse üretip kaydettiği
+        topolojiyi döndürür.
+
+        Args:
+            generator: Üretim parametrelerini taşıyan RandomNetworkGenerator
+            kind: "networkx" (generate() + attribute'lar) veya "compact" (generate_compact())
+        """
+        graph = self.load(generator, kind)
+        if graph is not None:
+            self.hits += 1
+            logger.debug("Topology cache hit %s", topology_key(generator, kind))
+            return graph
+
+        self.misses += 1
+        if kind == "compact":
+            graph = generator.generate_compact()
+        else:
+            graph = generator.compact(generator.generate())
+        self.save(generator, graph, kind)
+        return graph
+
+    def clear(self) -> None:
+        """Tüm önbellek girdilerini siler."""
+        shutil.rmtree(self.directory, ignore_errors=True)
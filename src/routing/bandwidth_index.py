@@ -0,0 +1,112 @@
+"""
+Bandwidth eşiği indeksi ve budanmış alt graf görünümleri
+BSM307 - Güz 2025
+
+GA denemelerinin çoğu daha sonra bandwidth nedeniyle reddedilen path'ler
+üretmeye gidiyordu. BandwidthIndex kenarları (CSR slotlarını) bandwidth'e göre
+bir kez sıralar; herhangi bir required_bandwidth için uygun kenarlar sıralı
+dizinin bir kuyruğudur ve ikili arama ile bulunur.
+
+Her eşik için CSR slotlarına paralel salt-okunur bir bool maske üretilir ve
+kesim noktasına (aynı kenar kümesini veren eşikler aynı girdiyi paylaşır) göre
+LRU önbellekte tutulur. FeasibleView bu maskeyi CompactGraph dizilerinin
+üzerine koyar; graf kopyalanmaz. Random-walk üretimi, path repair ve
+shortest-path tohumlaması bu görünüm üzerinden çalışır, böylece uygun olmayan
+adaylar hiç üretilmez.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from ..network.compact_graph import CompactGraph
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class FeasibleView:
+    """CompactGraph üzerinde bandwidth ≥ eşik kenarlarının maskeli görünümü."""
+
+    def __init__(self, graph: CompactGraph, threshold: float, mask: np.ndarray):
+        self.graph = graph
+        self.threshold = threshold
+        self.mask = mask
+        self._neighbors: Dict[int, List[int]] = {}
+
+    @property
+    def num_edges(self) -> int:
+        """Uygun yönsüz kenar sayısı."""
+        return int(self.mask.sum()) // 2
+
+    def has_edge(self, u: int, v: int) -> bool:
+        eid = self.graph.edge_id(u, v)
+        return eid >= 0 and bool(self.mask[eid])
+
+    def neighbors(self, u: int) -> List[int]:
+        """u'nun uygun kenarlarla bağlı komşuları (düğüm başına bir kez hesaplanır)."""
+        result = self._neighbors.get(u)
+        if result is None:
+            start, stop = self.graph.indptr[u], self.graph.indptr[u + 1]
+            result = self.graph.indices[start:stop][self.mask[start:stop]].tolist()
+            self._neighbors[u] = result
+        return result
+
+    def adjacency_matrix(self) -> csr_matrix:
+        """Yalnızca uygun kenarları içeren 0/1 scipy CSR matrisi."""
+        n = self.graph.num_nodes
+        matrix = csr_matrix(
+            (self.mask.astype(np.int8), self.graph.indices, self.graph.indptr), shape=(n, n), copy=True
+        )
+        matrix.eliminate_zeros()
+        return matrix
+
+
+class BandwidthIndex:
+    """Bandwidth'e göre sıralı kenar indeksi ve eşik başına önbellekli maskeler."""
+
+    def __init__(self, graph: CompactGraph, cache_size: int = 16):
+        """
+        Args:
+            graph: CompactGraph
+            cache_size: Önbellekte tutulacak en fazla maske / görünüm sayısı
+        """
+        self.graph = graph
+        self.cache_size = cache_size
+        self._order = np.argsort(graph.bandwidth, kind="stable")
+        self._sorted = graph.bandwidth[self._order]
+        self._views: "OrderedDict[int, FeasibleView]" = OrderedDict()
+        logger.debug("Built BandwidthIndex over %d CSR slots", len(self._order))
+
+    def _cut(self, threshold: float) -> int:
+        """bandwidth ≥ threshold olan ilk sıralı konum."""
+        return int(np.searchsorted(self._sorted, threshold, side="left"))
+
+    def feasible_count(self, threshold: float) -> int:
+        """bandwidth ≥ threshold olan CSR slot sayısı (O(log E))."""
+        return len(self._sorted) - self._cut(threshold)
+
+    def max_bandwidth(self) -> float:
+        return float(self._sorted[-1]) if len(self._sorted) else 0.0
+
+    def view(self, threshold: float) -> FeasibleView:
+        """threshold için (önbellekli) FeasibleView."""
+        cut = self._cut(threshold)
+        view = self._views.get(cut)
+        if view is not None:
+            self._views.move_to_end(cut)
+            return view
+        mask = np.zeros(len(self._order), dtype=bool)
+        mask[self._order[cut:]] = True
+        mask.setflags(write=False)
+        view = FeasibleView(self.graph, threshold, mask)
+        self._views[cut] = view
+        if len(self._views) > self.cache_size:
+            self._views.popitem(last=False)
+        return view
+
+    def edge_mask(self, threshold: float) -> np.ndarray:
+        """CSR slotlarına paralel salt-okunur bool maske (bandwidth ≥ threshold)."""
+        return self.view(threshold).mask
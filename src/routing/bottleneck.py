@@ -0,0 +1,157 @@
+"""
+Maksimum darboğaz (bottleneck) kahini
+BSM307 - Güz 2025
+
+İki düğüm arasında ulaşılabilecek en büyük bottleneck bandwidth, bandwidth'e
+göre maksimum yayılan ağaçtaki (maximum spanning tree) tek path'in minimum
+kenarıdır. BottleneckOracle ağacı Kruskal + DisjointSet ile bir kez kurar,
+ardından binary lifting tabloları (2^k. ata ve o atlamadaki minimum bandwidth)
+hazırlar; her max_bottleneck(s, t) sorgusu LCA üzerinden O(log n)'dir.
+
+Böylece bir (S, D, B) talebinin uygunluğu optimizasyon başlamadan anında
+bilinir (admission control) ve ağaç path'i kendisi de uygun bir tohum path'tir.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+
+from ..network.compact_graph import CompactGraph
+from ..utils.disjoint_set import DisjointSet
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+INF = float("inf")
+
+
+class BottleneckOracle:
+    """Maksimum yayılan orman + LCA path-min ile darboğaz sorguları."""
+
+    def __init__(self, graph: CompactGraph):
+        """
+        Args:
+            graph: CompactGraph (bağlantısız graflarda her bileşen ayrı ağaçtır)
+        """
+        self.graph = graph
+        n = graph.num_nodes
+        rows = np.repeat(np.arange(n), np.diff(graph.indptr))
+        upper = rows < graph.indices
+        us, vs, bws = rows[upper], graph.indices[upper], graph.bandwidth[upper]
+
+        # Kruskal: bandwidth'e göre azalan sırada kenar ekle
+        order = np.argsort(-bws, kind="stable")
+        dsu = DisjointSet(n)
+        adjacency: List[List[tuple]] = [[] for _ in range(n)]
+        tree_edges = 0
+        for u, v, bw in zip(us[order].tolist(), vs[order].tolist(), bws[order].tolist()):
+            if dsu.union(u, v):
+                adjacency[u].append((v, bw))
+                adjacency[v].append((u, bw))
+                tree_edges += 1
+                if tree_edges == n - 1:
+                    break
+
+        # Her bileşeni kökten gezerek parent / derinlik / parent kenar bandwidth'i
+        parent = list(range(n))
+        depth = [0] * n
+        parent_bw = [INF] * n
+        component = [-1] * n
+        for root in range(n):
+            if component[root] >= 0:
+                continue
+            component[root] = root
+            stack = [root]
+            while stack:
+                u = stack.pop()
+                for v, bw in adjacency[u]:
+                    if component[v] < 0:
+                        component[v] = root
+                        parent[v] = u
+                        depth[v] = depth[u] + 1
+                        parent_bw[v] = bw
+                        stack.append(v)
+
+        # Binary lifting: up[k][v] = 2^k. ata, low[k][v] = o atlamadaki min bandwidth
+        levels = max(1, (max(depth) if depth else 0).bit_length())
+        up = [np.asarray(parent, dtype=np.int64)]
+        low = [np.asarray(parent_bw, dtype=np.float64)]
+        for _ in range(1, levels):
+            prev_up, prev_low = up[-1], low[-1]
+            up.append(prev_up[prev_up])
+            low.append(np.minimum(prev_low, prev_low[prev_up]))
+
+        self._up = [level.tolist() for level in up]
+        self._low = [level.tolist() for level in low]
+        self._parent = parent
+        self._depth = depth
+        self._component = component
+        self.tree_edges = tree_edges
+        logger.debug(
+            "Built BottleneckOracle nodes=%d, tree_edges=%d, components=%d, levels=%d",
+            n, tree_edges, dsu.components, levels,
+        )
+
+    def connected(self, source: int, target: int) -> bool:
+        return self._component[source] == self._component[target]
+
+    def max_bottleneck(self, source: int, target: int) -> float:
+        """
+        source → target herhangi bir path'in ulaşabileceği en büyük bottleneck bandwidth.
+
+        Returns:
+            Mbps; source == target ise inf, bağlantı yoksa 0.0
+        """
+        if source == target:
+            return INF
+        if not self.connected(source, target):
+            return 0.0
+
+        up, low, depth = self._up, self._low, self._depth
+        u, v = source, target
+        best = INF
+        if depth[u] < depth[v]:
+            u, v = v, u
+        diff = depth[u] - depth[v]
+        k = 0
+        while diff:
+            if diff & 1:
+                best = min(best, low[k][u])
+                u = up[k][u]
+            diff >>= 1
+            k += 1
+        if u == v:
+            return best
+        for k in range(len(up) - 1, -1, -1):
+            if up[k][u] != up[k][v]:
+                best = min(best, low[k][u], low[k][v])
+                u, v = up[k][u], up[k][v]
+        return min(best, low[0][u], low[0][v])
+
+    def is_feasible(self, source: int, target: int, required_bandwidth: float) -> bool:
+        """(S, D, B) talebini karşılayan bir path var mı? (O(log n) admission control)"""
+        return self.max_bottleneck(source, target) >= required_bandwidth
+
+    def tree_path(self, source: int, target: int) -> Optional[List[int]]:
+        """
+        Ağaçtaki source → target path'i (maksimum bottleneck'e sahip bir path).
+
+        Returns:
+            Düğüm listesi veya bağlantı yoksa None
+        """
+        if not self.connected(source, target):
+            return None
+        parent, depth = self._parent, self._depth
+        head, tail = [source], [target]
+        u, v = source, target
+        while depth[u] > depth[v]:
+            u = parent[u]
+            head.append(u)
+        while depth[v] > depth[u]:
+            v = parent[v]
+            tail.append(v)
+        while u != v:
+            u, v = parent[u], parent[v]
+            head.append(u)
+            tail.append(v)
+        return head + tail[-2::-1]
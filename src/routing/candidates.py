@@ -0,0 +1,142 @@
+"""
+Ağırlık slider'ları için talep başına aday path önbelleği
+BSM307 - Güz 2025
+
+Ağırlıklı toplam skoru w · (delay, rel_cost, res_cost) doğrusal olduğundan
+herhangi bir w ≥ 0 için en iyi path, Pareto cephesinin alt dışbükey zarfı
+üzerindeki (supported) path'lerden biridir. CandidateCache her (S, D, B)
+talebi için cepheyi ParetoSolver ile bir kez hesaplar, yalnızca supported
+path'leri (k x 3) amaç matrisiyle saklar; slider'ın her konumu tek bir
+matris-vektör çarpımı + argmin ile (mikrosaniyeler) çözülür.
+
+Çözücü yalnızca talep (S, D, B) değiştiğinde çalışır; talepler LRU ile
+sınırlandırılır.
+"""
+
+from collections import OrderedDict
+from typing import List, Sequence, Tuple, Union
+
+import networkx as nx
+import numpy as np
+from scipy.optimize import linprog
+
+from ..network.compact_graph import CompactGraph
+from ..utils.logger import get_logger
+from .pareto import ParetoFront, ParetoSolver
+
+logger = get_logger(__name__)
+
+Demand = Tuple[int, int, float]
+
+
+def supported_mask(objectives: np.ndarray, tolerance: float = 1e-9) -> np.ndarray:
+    """
+    Bir w ≥ 0 (Σw = 1) ağırlığı için en iyi olabilen satırlar.
+
+    Her satır i için w · (p_i - p_j) ≤ 0 (tüm j) sistemi küçük bir LP ile
+    uygunluk açısından kontrol edilir.
+
+    Args:
+        objectives: (m x 3) amaç matrisi (baskın olmayan noktalar)
+        tolerance: Göreli eşitlik toleransı
+
+    Returns:
+        Uzunluğu m olan bool dizi
+    """
+    count, dims = objectives.shape
+    mask = np.zeros(count, dtype=bool)
+    if count <= 2:
+        mask[:] = True
+        return mask
+    scale = tolerance * (1.0 + np.abs(objectives).max())
+    for i in range(count):
+        result = linprog(
+            np.zeros(dims),
+            A_ub=objectives[i] - objectives,
+            b_ub=np.full(count, scale),
+            A_eq=np.ones((1, dims)),
+            b_eq=[1.0],
+            bounds=[(0.0, None)] * dims,
+            method="highs",
+        )
+        mask[i] = result.status == 0
+    return mask
+
+
+class CandidateSet:
+    """Bir talep için supported path'ler ve (k x 3) amaç matrisi."""
+
+    def __init__(self, paths: List[List[int]], objectives: np.ndarray):
+        self.paths = paths
+        self.objectives = objectives
+
+    @classmethod
+    def from_front(cls, front: ParetoFront) -> "CandidateSet":
+        if len(front) == 0:
+            return cls([], np.empty((0, 3)))
+        keep = supported_mask(front.objectives)
+        paths = [list(p.path) for p, supported in zip(front.paths, keep) if supported]
+        return cls(paths, np.ascontiguousarray(front.objectives[keep]))
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def best(self, weights: Sequence[float]) -> Tuple[List[int], float]:
+        """
+        Ağırlık vektörü için en iyi aday (argmin w · objectives).
+
+        Returns:
+            (path kopyası, score) veya aday yoksa ([], inf)
+        """
+        if not self.paths:
+            return [], float("inf")
+        scores = self.objectives @ np.asarray(weights, dtype=np.float64)
+        k = int(scores.argmin())
+        return list(self.paths[k]), float(scores[k])
+
+
+class CandidateCache:
+    """(S, D, B) talebi → CandidateSet LRU önbelleği."""
+
+    def __init__(self, graph: Union[nx.Graph, CompactGraph], max_demands: int = 64):
+        """
+        Args:
+            graph: NetworkX graph veya CompactGraph objesi
+            max_demands: Önbellekte tutulacak en fazla talep sayısı
+        """
+        self.solver = ParetoSolver(graph)
+        self.max_demands = max_demands
+        self._sets: "OrderedDict[Demand, CandidateSet]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def candidates(self, source: int, target: int, required_bandwidth: float = 0.0) -> CandidateSet:
+        """Talebin aday kümesi (yoksa Pareto cephesinden bir kez hesaplanır)."""
+        key = (source, target, float(required_bandwidth))
+        candidate_set = self._sets.get(key)
+        if candidate_set is not None:
+            self._sets.move_to_end(key)
+            self.hits += 1
+            return candidate_set
+
+        self.misses += 1
+        front = self.solver.solve(source, target, required_bandwidth)
+        candidate_set = CandidateSet.from_front(front)
+        self._sets[key] = candidate_set
+        if len(self._sets) > self.max_demands:
+            self._sets.popitem(last=False)
+        logger.info(
+            "Cached %d supported candidates (of %d Pareto paths) for demand %s",
+            len(candidate_set), len(front), key,
+        )
+        return candidate_set
+
+    def best(
+        self,
+        source: int,
+        target: int,
+        weights: Sequence[float],
+        required_bandwidth: float = 0.0,
+    ) -> Tuple[List[int], float]:
+        """Talep ve ağırlıklar için en iyi path (önbellekteyse çözücü çalışmaz)."""
+        return self.candidates(source, target, required_bandwidth).best(weights)
@@ -0,0 +1,104 @@
+"""
+Ortak komşu (detour) indeksi
+BSM307 - Güz 2025
+
+Mutasyon u → x → v path parçasındaki x'i başka bir w ile değiştirmek için
+N(u) ∩ N(v) kümesine ihtiyaç duyar; eski kod bunu her mutasyonda u'nun tüm
+komşuları için has_edge(n, v) çağırarak buluyordu (p=0.4'te ~100 kontrol).
+
+DetourIndex {w : u–w–v} kümesini yalnızca sorgulanan (u, v) çifti için,
+ilk sorguda hesaplar ve LRU önbellekte saklar:
+
+- Küme, CSR'deki sıralı u ve v komşu satırlarının kesişimidir
+  (np.intersect1d, O(deg(u) + deg(v)))
+- Tüm 2-adım çiftlerini (A @ A) önceden çıkarmak n=5000, p=0.4'te ~10^10
+  girdi demektir; mutasyonlar ise yalnızca path'lerdeki çiftlere dokunur
+
+Aynı çift tekrar sorgulandığında küme önbellekten gelir; sample() rastgele
+bir w'yi O(1) sürede seçer. Komşu (u, v) kenarları da sorgulanabilir; u–v
+kenarını u–w–v ile uzatan ekleme hamleleri aynı sorguyu kullanır.
+"""
+
+import random
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy as np
+
+from ..network.compact_graph import CompactGraph
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DetourIndex:
+    """(u, v) → {w : u–w–v} isteğe bağlı, önbellekli indeksi."""
+
+    def __init__(self, graph: CompactGraph, cache_size: int = 65536):
+        """
+        Args:
+            graph: CompactGraph
+            cache_size: Önbellekte tutulacak en fazla (u, v) çifti sayısı
+        """
+        self.graph = graph
+        self.cache_size = cache_size
+        self._sets: "OrderedDict[Tuple[int, int], np.ndarray]" = OrderedDict()
+        self._empty = np.empty(0, dtype=graph.indices.dtype)
+        self._empty.setflags(write=False)
+        logger.debug("Initialized DetourIndex nodes=%d", graph.num_nodes)
+
+    @property
+    def num_pairs(self) -> int:
+        """Önbellekteki çift sayısı."""
+        return len(self._sets)
+
+    def detours(self, u: int, v: int) -> np.ndarray:
+        """u ve v'nin ortak komşuları (sıralı, salt-okunur; yoksa boş)."""
+        key = (u, v)
+        common = self._sets.get(key)
+        if common is not None:
+            self._sets.move_to_end(key)
+            return common
+        if u == v:
+            return self._empty
+        indptr, indices = self.graph.indptr, self.graph.indices
+        common = np.intersect1d(
+            indices[indptr[u]:indptr[u + 1]], indices[indptr[v]:indptr[v + 1]], assume_unique=True
+        )
+        common.setflags(write=False)
+        self._sets[key] = common
+        if len(self._sets) > self.cache_size:
+            self._sets.popitem(last=False)
+        return common
+
+    def count(self, u: int, v: int) -> int:
+        return len(self.detours(u, v))
+
+    def sample(
+        self, u: int, v: int, exclude: int = -1, rng: Optional[random.Random] = None
+    ) -> int:
+        """
+        u–w–v olan rastgele bir w (exclude hariç, uniform) seçer; küme
+        önbellekteyse O(1).
+
+        Args:
+            u, v: Uç düğümler
+            exclude: Seçilmemesi gereken düğüm (ör. değiştirilen eski düğüm)
+            rng: random.Random örneği (None ise global random modülü)
+
+        Returns:
+            Düğüm veya aday yoksa -1
+        """
+        common = self.detours(u, v)
+        size = len(common)
+        if size == 0:
+            return -1
+        rng = rng or random
+        k = rng.randrange(size)
+        w = int(common[k])
+        if w != exclude:
+            return w
+        if size == 1:
+            return -1
+        # exclude'a denk gelinirse kalan size-1 aday arasından uniform seç
+        return int(common[(k + 1 + rng.randrange(size - 1)) % size])
@@ -0,0 +1,104 @@
+"""
+Hop sayısına göre next-hop tabloları
+BSM307 - Güz 2025
+
+GA path repair her eksik kenar ve hedefe ulaşma adımı için yeni bir BFS
+yapıyordu. NextHopTable her hedef düğüm için bir kez BFS ağacı kurar
+(scipy.sparse.csgraph.breadth_first_order) ve next_hop[hedef][u] dizisini
+saklar; sonraki tüm u → hedef sorguları yalnızca tablo yürüyüşüdür.
+
+Satırlar ihtiyaç duyuldukça (tembel) doldurulur; fill_all() ile tüm çiftler
+önceden hesaplanabilir. Tablo bir bandwidth eşiğiyle kurulursa yalnızca
+bandwidth ≥ eşik kenarları kullanılır (BandwidthIndex verilirse maske
+onun önbelleğinden alınır).
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import breadth_first_order
+
+from ..network.compact_graph import CompactGraph
+from .bandwidth_index import BandwidthIndex
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class NextHopTable:
+    """Hedef başına tembel doldurulan hop-sayısı next-hop tablosu."""
+
+    def __init__(
+        self,
+        graph: CompactGraph,
+        min_bandwidth: float = 0.0,
+        bandwidth_index: Optional[BandwidthIndex] = None,
+    ):
+        """
+        Args:
+            graph: CompactGraph
+            min_bandwidth: Kullanılacak kenarlar için minimum bandwidth (Mbps)
+            bandwidth_index: Paylaşılan BandwidthIndex (None ise maske doğrudan hesaplanır)
+        """
+        self.graph = graph
+        self.min_bandwidth = min_bandwidth
+        n = graph.num_nodes
+        if bandwidth_index is not None:
+            mask = bandwidth_index.edge_mask(min_bandwidth).astype(np.int8)
+        else:
+            mask = (graph.bandwidth >= min_bandwidth).astype(np.int8)
+        self._matrix = csr_matrix((mask, graph.indices, graph.indptr), shape=(n, n), copy=True)
+        self._matrix.eliminate_zeros()
+        self._rows: Dict[int, List[int]] = {}
+        logger.debug(
+            "Initialized NextHopTable nodes=%d, min_bandwidth=%.1f, usable_edges=%d",
+            n, min_bandwidth, self._matrix.nnz // 2,
+        )
+
+    def row(self, target: int) -> List[int]:
+        """
+        target'a doğru her düğümün next-hop'u (ulaşılamıyorsa -1, target için target).
+        """
+        row = self._rows.get(target)
+        if row is None:
+            _, predecessors = breadth_first_order(
+                self._matrix, target, directed=True, return_predecessors=True
+            )
+            predecessors = np.where(predecessors < 0, -1, predecessors)
+            predecessors[target] = target
+            row = predecessors.tolist()
+            self._rows[target] = row
+        return row
+
+    def fill_all(self) -> None:
+        """Tüm hedefler için satırları önceden hesaplar (all-pairs)."""
+        for target in range(self.graph.num_nodes):
+            self.row(target)
+
+    def next_hop(self, u: int, target: int) -> int:
+        return self.row(target)[u]
+
+    def has_path(self, u: int, target: int) -> bool:
+        return self.row(target)[u] >= 0
+
+    def distance(self, u: int, target: int) -> int:
+        """Hop sayısı (ulaşılamıyorsa -1)."""
+        path = self.path(u, target)
+        return len(path) - 1 if path is not None else -1
+
+    def path(self, u: int, target: int) -> Optional[List[int]]:
+        """
+        u → target en az hop'lu path (tablo yürüyüşü, BFS yok).
+
+        Returns:
+            Düğüm listesi veya yol yoksa None
+        """
+        row = self.row(target)
+        if row[u] < 0:
+            return None
+        path = [u]
+        while u != target:
+            u = row[u]
+            path.append(u)
+        return path
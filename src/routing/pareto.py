@@ -0,0 +1,211 @@
+"""
+Kesin Pareto cephesi (çok kriterli label-setting)
+BSM307 - Güz 2025
+
+Üç amaç da kenarlar boyunca toplanabilir (delay, -log r, 1000 / BW) olduğundan
+bir talebin tüm baskın olmayan (non-dominated) path'leri Martins tipi
+label-setting aramasıyla kesin olarak bulunur:
+
+- Label'lar (delay, rel_cost, res_cost) sözlük sırasıyla heap'ten çekilir;
+  çekilen label kalıcıdır ve sonradan baskınlanamaz
+- Her düğümde yalnızca baskın olmayan label'lar tutulur (dominance pruning)
+- Yalnızca bandwidth ≥ talep kenarları genişletilir (BandwidthIndex maskesi)
+- Hedefe olan amaç bazlı alt sınırlar (üç ters Dijkstra) eklendiğinde hedef
+  cephesindeki bir label tarafından baskınlanan label'lar hiç üretilmez
+
+Label'lar paralel Python listelerinde (maliyetler, düğüm, parent label) tutulur;
+path'ler parent zincirinden yalnızca hedef label'ları için kurulur. Pozitif
+kenar maliyetlerinde Pareto-optimal path'ler zaten basittir.
+
+Sonuç ParetoFront'tur; her ağırlık vektörü için en iyi path, cephe matrisi
+ile tek bir nokta çarpımı (argmin) ile bulunur.
+"""
+
+import heapq
+import math
+from typing import List, NamedTuple, Sequence, Tuple, Union
+
+import networkx as nx
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+from ..metrics.path_evaluator import PathEvaluator
+from ..network.compact_graph import CompactGraph
+from ..utils.logger import get_logger
+from .bandwidth_index import BandwidthIndex
+from .weighted_solver import MIN_WEIGHT
+
+logger = get_logger(__name__)
+
+INF = float("inf")
+
+
+class ParetoPath(NamedTuple):
+    """Cephedeki bir path ve amaç değerleri."""
+
+    path: List[int]
+    delay: float
+    reliability_cost: float
+    resource_cost: float
+    bottleneck_bandwidth: float
+
+
+class ParetoFront:
+    """Baskın olmayan path'ler + (m x 3) amaç matrisi."""
+
+    def __init__(self, paths: List[ParetoPath]):
+        self.paths = paths
+        self.objectives = np.array(
+            [(p.delay, p.reliability_cost, p.resource_cost) for p in paths], dtype=np.float64
+        ).reshape(len(paths), 3)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __iter__(self):
+        return iter(self.paths)
+
+    def scores(self, weights: Sequence[float]) -> np.ndarray:
+        """Her cephe path'inin ağırlıklı skoru."""
+        return self.objectives @ np.asarray(weights, dtype=np.float64)
+
+    def best(self, weights: Sequence[float]) -> Tuple[List[int], float]:
+        """
+        Ağırlık vektörü için en iyi path (yeni optimizasyon yok, argmin).
+
+        Returns:
+            (path, score) veya cephe boşsa ([], inf)
+        """
+        if not self.paths:
+            return [], INF
+        scores = self.scores(weights)
+        k = int(np.argmin(scores))
+        return list(self.paths[k].path), float(scores[k])
+
+
+class ParetoSolver:
+    """(delay, reliability_cost, resource_cost) için kesin Pareto cephesi çözücüsü."""
+
+    def __init__(self, graph: Union[nx.Graph, CompactGraph]):
+        """
+        Args:
+            graph: NetworkX graph veya CompactGraph objesi
+        """
+        self.graph = graph if isinstance(graph, CompactGraph) else CompactGraph.from_graph(graph)
+        compact = self.graph
+        self._costs = np.stack([
+            compact.delay, compact.reliability_cost_per_edge, compact.resource_per_edge,
+        ])
+        self.bandwidth_index = BandwidthIndex(compact)
+        self._evaluator = PathEvaluator(compact, (1.0, 0.0, 0.0))
+        self.last_label_count = 0
+
+    def _lower_bounds(self, target: int, mask: np.ndarray) -> List[List[float]]:
+        """Her amaç için düğümlerden target'a en küçük maliyet (uygun kenarlarla)."""
+        compact = self.graph
+        n = compact.num_nodes
+        bounds = []
+        for costs in self._costs:
+            # csgraph sıfır ağırlığı "kenar yok" sayar; uygun olmayan kenarlar inf
+            data = np.where(mask, np.maximum(costs, MIN_WEIGHT), np.inf)
+            matrix = csr_matrix((data, compact.indices, compact.indptr), shape=(n, n), copy=True)
+            bounds.append(dijkstra(matrix, directed=True, indices=target).tolist())
+        return bounds
+
+    def solve(self, source: int, target: int, required_bandwidth: float = 0.0) -> ParetoFront:
+        """
+        Talep için tüm baskın olmayan path'leri bulur.
+
+        Args:
+            source: Başlangıç düğümü
+            target: Hedef düğümü
+            required_bandwidth: Minimum gerekli bandwidth (Mbps)
+
+        Returns:
+            ParetoFront (path'ler delay'e göre artan sırada)
+        """
+        compact = self.graph
+        mask = self.bandwidth_index.edge_mask(required_bandwidth)
+        if source == target:
+            return ParetoFront([ParetoPath([source], 0.0, 0.0, 0.0, INF)])
+
+        hd, hr, hc = self._lower_bounds(target, mask)
+        if not math.isfinite(hd[source]):
+            logger.warning(
+                "No path %s→%s satisfies bandwidth=%.1f Mbps", source, target, required_bandwidth
+            )
+            return ParetoFront([])
+
+        indptr = compact.indptr.tolist()
+        indices = compact.indices.tolist()
+        usable = mask.tolist()
+        cd, cr, cc = (costs.tolist() for costs in self._costs)
+
+        # Label deposu (paralel listeler) ve düğüm başına canlı label id'leri
+        ld, lr, lc, lnode, lparent, alive = [0.0], [0.0], [0.0], [source], [-1], [True]
+        at_node: List[List[int]] = [[] for _ in range(compact.num_nodes)]
+        at_node[source].append(0)
+        heap = [(0.0, 0.0, 0.0, 0)]
+        front: List[int] = []
+
+        while heap:
+            d, r, c, label = heapq.heappop(heap)
+            if not alive[label]:
+                continue
+            u = lnode[label]
+            if u == target:
+                front.append(label)
+                continue
+
+            for slot in range(indptr[u], indptr[u + 1]):
+                if not usable[slot]:
+                    continue
+                v = indices[slot]
+                nd, nr, nc = d + cd[slot], r + cr[slot], c + cc[slot]
+
+                # Hedefteki label'lar (alt sınırlarla) bu label'ı baskınlıyor mu?
+                bd, br, bc = nd + hd[v], nr + hr[v], nc + hc[v]
+                if any(ld[t] <= bd and lr[t] <= br and lc[t] <= bc for t in at_node[target]):
+                    continue
+
+                # Düğümdeki label'larla baskınlık
+                labels = at_node[v]
+                if any(ld[j] <= nd and lr[j] <= nr and lc[j] <= nc for j in labels):
+                    continue
+                keep = []
+                for j in labels:
+                    if nd <= ld[j] and nr <= lr[j] and nc <= lc[j]:
+                        alive[j] = False
+                    else:
+                        keep.append(j)
+
+                new = len(ld)
+                ld.append(nd)
+                lr.append(nr)
+                lc.append(nc)
+                lnode.append(v)
+                lparent.append(label)
+                alive.append(True)
+                keep.append(new)
+                at_node[v] = keep
+                heapq.heappush(heap, (nd, nr, nc, new))
+
+        self.last_label_count = len(ld)
+        paths = []
+        for label in front:
+            path = []
+            while label >= 0:
+                path.append(lnode[label])
+                label = lparent[label]
+            path.reverse()
+            metrics = self._evaluator.evaluate(path)
+            paths.append(ParetoPath(
+                path, metrics.delay, metrics.reliability_cost, metrics.resource_cost,
+                metrics.bottleneck_bandwidth,
+            ))
+        logger.info(
+            "Pareto front %s→%s (bandwidth=%.1f): %d paths, %d labels",
+            source, target, required_bandwidth, len(paths), self.last_label_count,
+        )
+        return ParetoFront(paths)
@@ -3,19 +3,25 @@ Yol uygunluk kontrolü
 BSM307 - Güz 2025
 """
 
-from typing import Iterable
+from typing import Iterable, Union
 
 import networkx as nx
 
+from ..network.compact_graph import CompactGraph
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
 class PathValidator:
-    """Yol uygunluk kontrolü için temel iskelet."""
+    """
+    Yol uygunluk kontrolü için temel iskelet.
 
-    def __init__(self, graph: nx.Graph):
+    graph olarak networkx.Graph veya CompactGraph kabul edilir; CompactGraph
+    verildiğinde kapasite kontrolü doğrudan bandwidth dizisi üzerinden yapılır.
+    """
+
+    def __init__(self, graph: Union[nx.Graph, CompactGraph]):
         self.graph = graph
 
     def is_simple_path(self, path: Iterable[int]) -> bool:
@@ -66,6 +72,9 @@ class PathValidator:
             logger.debug("Path too short for capacity check: %s", path_list)
             return True
         
+        if isinstance(self.graph, CompactGraph):
+            return self._has_capacity_compact(path_list, required_bandwidth)
+        
         # Path üzerindeki her edge'i kontrol et
         for i in range(len(path_list) - 1):
             u = path_list[i]
@@ -97,3 +106,22 @@ class PathValidator:
         )
         return True
 
+
+    def _has_capacity_compact(self, path_list: list, required_bandwidth: float) -> bool:
+        """CompactGraph için has_capacity: edge-id araması + bandwidth dizisi."""
+        bandwidth = self.graph.bandwidth
+        for u, v in zip(path_list, path_list[1:]):
+            eid = self.graph.edge_id(u, v)
+            if eid < 0:
+                logger.warning("Edge (%s, %s) does not exist in graph", u, v)
+                return False
+            if bandwidth[eid] < required_bandwidth:
+                logger.debug(
+                    "Edge (%s, %s) has insufficient bandwidth: %.1f < %.1f Mbps",
+                    u,
+                    v,
+                    bandwidth[eid],
+                    required_bandwidth,
+                )
+                return False
+        return True
@@ -3,14 +3,42 @@ Basit UI giriş noktası
 BSM307 - Güz 2025
 """
 
-from typing import Any
+from typing import Any, List, Optional, Sequence, Tuple
 
+from ..routing.candidates import CandidateCache
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+class RouteSelector:
+    """
+    Ağırlık slider'larının arka ucu.
+
+    Talep (S, D, B) değiştiğinde aday path'ler bir kez hesaplanır; slider
+    hareketleri yalnızca önbellekteki aday kümesi üzerinde argmin'dir.
+    """
+
+    def __init__(self, graph: Any, max_demands: int = 64):
+        self.cache = CandidateCache(graph, max_demands=max_demands)
+        self.demand: Optional[Tuple[int, int, float]] = None
+        self.weights: Tuple[float, float, float] = (0.4, 0.3, 0.3)
+
+    def set_demand(self, source: int, target: int, required_bandwidth: float) -> Tuple[List[int], float]:
+        """Yeni talep seçildiğinde çağrılır (gerekirse çözücü çalışır)."""
+        self.demand = (source, target, required_bandwidth)
+        return self.cache.best(source, target, self.weights, required_bandwidth)
+
+    def set_weights(self, weights: Sequence[float]) -> Tuple[List[int], float]:
+        """Slider hareketinde çağrılır (çözücü çalışmaz)."""
+        self.weights = tuple(weights)
+        if self.demand is None:
+            return [], float("inf")
+        source, target, required_bandwidth = self.demand
+        return self.cache.best(source, target, self.weights, required_bandwidth)
+
+
 def run_app(graph: Any) -> None:
     """TODO: CLI/GUI başlangıcı."""
     logger.info("Launching placeholder UI with graph=%s nodes", getattr(graph, "number_of_nodes", lambda: "?")())
-    # TODO: networkx + matplotlib entegrasyonu, S-D seçimi, slider'lar
+    # TODO: networkx + matplotlib entegrasyonu, S-D seçimi, slider'lar (RouteSelector ile)
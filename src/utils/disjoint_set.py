@@ -0,0 +1,41 @@
+"""
+Union-find (disjoint set) yardımcısı
+BSM307 - Güz 2025
+"""
+
+from typing import List
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DisjointSet:
+    """Boyuta göre birleştirme + yol yarılama ile union-find (0..n-1 elemanlar)."""
+
+    def __init__(self, size: int):
+        self.parent: List[int] = list(range(size))
+        self.size: List[int] = [1] * size
+        self.components = size
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """a ve b'nin kümelerini birleştirir; zaten aynı kümedeyse False döndürür."""
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+        self.components -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
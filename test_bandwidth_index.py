@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+BandwidthIndex test script
+BSM307 - Güz 2025
+"""
+
+import sys
+import os
+
+# Proje kökünü Python path'e ekle
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.network.generator import RandomNetworkGenerator
+from src.network.compact_graph import CompactGraph
+from src.routing.bandwidth_index import BandwidthIndex
+from src.routing.path_validator import PathValidator
+from src.algorithms.ga.genetic_algorithm import GeneticAlgorithm
+import numpy as np
+
+
+def test_threshold_views():
+    """Maskeler ve görünümler bandwidth ≥ eşik kenarlarıyla aynı olmalı"""
+    print("=" * 60)
+    print("🧪 TEST: BandwidthIndex views")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=80, edge_prob=0.15, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    compact = CompactGraph.from_graph(graph)
+    index = BandwidthIndex(compact, cache_size=4)
+
+    for threshold in (0.0, 150.0, 500.0, 750.0, 2000.0):
+        mask = index.edge_mask(threshold)
+        assert np.array_equal(mask, compact.bandwidth >= threshold)
+        assert index.feasible_count(threshold) == int(mask.sum())
+        assert not mask.flags.writeable
+        view = index.view(threshold)
+        for u in range(0, 80, 11):
+            expected = [v for v in compact.neighbors(u) if graph[u][v]["bandwidth"] >= threshold]
+            assert view.neighbors(u) == expected
+            assert all(view.has_edge(u, v) for v in expected)
+    print("✅ Test 1 PASSED: Masks and neighbor lists match the threshold")
+
+    assert index.view(500.0) is index.view(500.0)
+    print("✅ Test 2 PASSED: Views are cached per threshold")
+
+    print("\n✅ ALL view TESTS PASSED!\n")
+    return True
+
+
+def test_ga_uses_feasible_view():
+    """GA başlangıç popülasyonu yalnızca uygun path'lerden oluşmalı"""
+    print("=" * 60)
+    print("🧪 TEST: GA seeding on the feasible subgraph")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=120, edge_prob=0.1, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    validator = PathValidator(graph)
+    ga = GeneticAlgorithm(graph, 0, 60, required_bandwidth=500.0, population_size=30, seed=2)
+    walks = [ga._generate_random_path() for _ in range(50)]
+    walks = [path for path in walks if path is not None]
+    assert walks and all(validator.has_capacity(path, 500.0) for path in walks)
+    print(f"✅ Test 1 PASSED: {len(walks)} random walks never use an infeasible edge")
+
+    population = ga.initialize_population()
+    assert all(validator.has_capacity(path, 500.0) for path in population)
+    print(f"✅ Test 2 PASSED: Population of {len(population)} feasible paths")
+
+    print("\n✅ ALL GA seeding TESTS PASSED!\n")
+    return True
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("BSM307 - BandwidthIndex Test Suite")
+    print("=" * 60 + "\n")
+
+    try:
+        ok1 = test_threshold_views()
+        ok2 = test_ga_uses_feasible_view()
+
+        if ok1 and ok2:
+            print("\n✅ ALL TESTS PASSED!")
+            return 0
+        print("\n❌ SOME TESTS FAILED!")
+        return 1
+    except Exception as e:
+        print(f"\n❌ Test error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+BottleneckOracle test script
+BSM307 - Güz 2025
+"""
+
+import sys
+import os
+
+# Proje kökünü Python path'e ekle
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.network.generator import RandomNetworkGenerator
+from src.network.compact_graph import CompactGraph
+from src.routing.bottleneck import BottleneckOracle
+from src.routing.path_validator import PathValidator
+from src.algorithms.ga.genetic_algorithm import GeneticAlgorithm
+from src.utils.disjoint_set import DisjointSet
+import networkx as nx
+
+
+def _widest_reference(graph, source, target):
+    """Referans: eşik azalırken source ve target'ın bağlandığı ilk bandwidth."""
+    for threshold in sorted({bw for _, _, bw in graph.edges(data="bandwidth")}, reverse=True):
+        pruned = nx.Graph()
+        pruned.add_nodes_from(graph.nodes)
+        pruned.add_edges_from((u, v) for u, v, bw in graph.edges(data="bandwidth") if bw >= threshold)
+        if nx.has_path(pruned, source, target):
+            return threshold
+    return 0.0
+
+
+def test_disjoint_set():
+    """Union-find birleştirme ve bileşen sayısı"""
+    print("=" * 60)
+    print("🧪 TEST: DisjointSet")
+    print("=" * 60)
+
+    dsu = DisjointSet(6)
+    assert dsu.union(0, 1) and dsu.union(2, 3) and dsu.union(1, 3)
+    assert not dsu.union(0, 2)
+    assert dsu.connected(0, 3) and not dsu.connected(0, 4)
+    assert dsu.components == 3
+    print("✅ Test 1 PASSED: union/find/connected and component count")
+
+    print("\n✅ ALL DisjointSet TESTS PASSED!\n")
+    return True
+
+
+def test_max_bottleneck():
+    """Kahin brute-force darboğaz değeriyle aynı sonucu vermeli"""
+    print("=" * 60)
+    print("🧪 TEST: BottleneckOracle")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=60, edge_prob=0.1, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    validator = PathValidator(graph)
+    oracle = BottleneckOracle(CompactGraph.from_graph(graph))
+
+    for source, target in [(0, 59), (3, 17), (10, 45), (22, 23), (5, 40)]:
+        expected = _widest_reference(graph, source, target)
+        assert oracle.max_bottleneck(source, target) == expected
+        path = oracle.tree_path(source, target)
+        assert path[0] == source and path[-1] == target
+        assert validator.is_simple_path(path) and validator.has_capacity(path, expected)
+        assert oracle.is_feasible(source, target, expected)
+        assert not oracle.is_feasible(source, target, expected + 1e-6)
+    assert oracle.max_bottleneck(7, 7) == float("inf")
+    print("✅ Test 1 PASSED: Max bottleneck and tree paths match brute force")
+
+    disconnected = nx.Graph()
+    disconnected.add_nodes_from(range(4))
+    disconnected.add_edge(0, 1, bandwidth=300.0, delay=1.0, reliability=0.99)
+    disconnected.add_edge(2, 3, bandwidth=800.0, delay=1.0, reliability=0.99)
+    split = BottleneckOracle(CompactGraph.from_graph(disconnected))
+    assert split.max_bottleneck(0, 3) == 0.0 and split.tree_path(0, 3) is None
+    assert split.max_bottleneck(2, 3) == 800.0
+    print("✅ Test 2 PASSED: Disconnected components handled")
+
+    print("\n✅ ALL oracle TESTS PASSED!\n")
+    return True
+
+
+def test_ga_admission_control():
+    """Uygun olmayan talepte GA denemeye başlamadan boş popülasyon döndürmeli"""
+    print("=" * 60)
+    print("🧪 TEST: GA admission control")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=60, edge_prob=0.1, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    ga = GeneticAlgorithm(graph, 0, 59, required_bandwidth=5000.0, population_size=20, seed=1)
+    assert ga._bottleneck is None
+    assert ga.initialize_population() == []
+    assert ga._bottleneck is not None
+    assert ga.run(generations=3) == ([], float("inf"))
+    print("✅ Test 1 PASSED: Infeasible demand rejected instantly")
+
+    print("\n✅ ALL admission TESTS PASSED!\n")
+    return True
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("BSM307 - BottleneckOracle Test Suite")
+    print("=" * 60 + "\n")
+
+    try:
+        ok1 = test_disjoint_set()
+        ok2 = test_max_bottleneck()
+        ok3 = test_ga_admission_control()
+
+        if ok1 and ok2 and ok3:
+            print("\n✅ ALL TESTS PASSED!")
+            return 0
+        print("\n❌ SOME TESTS FAILED!")
+        return 1
+    except Exception as e:
+        print(f"\n❌ Test error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
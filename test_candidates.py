@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+CandidateCache test script
+BSM307 - Güz 2025
+"""
+
+import sys
+import os
+import time
+
+# Proje kökünü Python path'e ekle
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.network.generator import RandomNetworkGenerator
+from src.routing.candidates import CandidateCache, supported_mask
+from src.routing.weighted_solver import WeightedSumSolver
+from src.ui.app import RouteSelector
+import numpy as np
+
+
+def test_supported_mask():
+    """Dışbükey zarfın içinde kalan nokta supported olmamalı"""
+    print("=" * 60)
+    print("🧪 TEST: Supported point filter")
+    print("=" * 60)
+
+    points = np.array([[1.0, 10.0, 2.0], [10.0, 1.0, 2.0], [6.0, 6.0, 3.0], [2.0, 2.0, 10.0]])
+    assert supported_mask(points).tolist() == [True, True, False, True]
+    print("✅ Test 1 PASSED: Unsupported (non-convex) point removed")
+
+    print("\n✅ ALL mask TESTS PASSED!\n")
+    return True
+
+
+def test_slider_lookup():
+    """Slider konumları çözücü çalıştırmadan kesin optimumu vermeli"""
+    print("=" * 60)
+    print("🧪 TEST: Weight slider re-ranking")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=250, edge_prob=0.4, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    exact = WeightedSumSolver(graph)
+    cache = CandidateCache(graph)
+
+    candidates = cache.candidates(0, 100, 300.0)
+    rng = np.random.default_rng(0)
+    sliders = rng.dirichlet(np.ones(3), size=200)
+    started = time.perf_counter()
+    answers = [candidates.best(w) for w in sliders]
+    per_lookup = (time.perf_counter() - started) / len(sliders)
+    for w, (path, score) in zip(sliders, answers):
+        _, expected = exact.solve(0, 100, w, 300.0)
+        assert abs(score - expected) < 1e-9
+    print(f"✅ Test 1 PASSED: {len(candidates)} candidates, 200 slider positions exact "
+          f"({per_lookup * 1e6:.1f} µs per lookup)")
+
+    selector = RouteSelector(graph)
+    selector.set_demand(0, 100, 300.0)
+    for w in sliders[:20]:
+        selector.set_weights(w)
+    assert selector.cache.misses == 1 and selector.cache.hits == 20
+    print("✅ Test 2 PASSED: Solver runs only when the demand changes")
+
+    path, _ = candidates.best(sliders[0])
+    path.append(-1)
+    assert candidates.best(sliders[0])[0][-1] == 100
+    print("✅ Test 3 PASSED: Returned paths are copies; the cached set stays intact")
+
+    print("\n✅ ALL slider TESTS PASSED!\n")
+    return True
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("BSM307 - CandidateCache Test Suite")
+    print("=" * 60 + "\n")
+
+    try:
+        ok1 = test_supported_mask()
+        ok2 = test_slider_lookup()
+
+        if ok1 and ok2:
+            print("\n✅ ALL TESTS PASSED!")
+            return 0
+        print("\n❌ SOME TESTS FAILED!")
+        return 1
+    except Exception as e:
+        print(f"\n❌ Test error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+CompactGraph (CSR anlık görüntüsü) test script
+BSM307 - Güz 2025
+"""
+
+import sys
+import os
+
+# Proje kökünü Python path'e ekle
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.network.generator import RandomNetworkGenerator
+from src.network.compact_graph import CompactGraph
+from src.metrics.delay import total_delay
+from src.metrics.reliability import reliability_cost
+from src.metrics.resource_cost import bandwidth_cost
+from src.routing.path_validator import PathValidator
+from src.algorithms.ga.genetic_algorithm import GeneticAlgorithm
+import networkx as nx
+import numpy as np
+
+
+def test_structure():
+    """CSR yapısı ve attribute dizileri networkx grafıyla birebir aynı olmalı"""
+    print("=" * 60)
+    print("🧪 TEST: CompactGraph structure")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=250, edge_prob=0.4, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    compact = CompactGraph.from_graph(graph)
+
+    assert compact.num_nodes == graph.number_of_nodes()
+    assert compact.num_edges == graph.number_of_edges()
+    print(f"✅ Test 1 PASSED: {compact.num_nodes} nodes, {compact.num_edges} edges")
+
+    for u, v, data in list(graph.edges(data=True))[:200]:
+        for a, b in ((u, v), (v, u)):
+            eid = compact.edge_id(a, b)
+            assert eid >= 0, f"Missing edge ({a}, {b})"
+            assert compact.delay[eid] == data["delay"]
+            assert compact.reliability[eid] == data["reliability"]
+            assert compact.bandwidth[eid] == data["bandwidth"]
+    print("✅ Test 2 PASSED: Edge attributes match in both directions")
+
+    for node in range(10):
+        assert sorted(graph.neighbors(node)) == compact.neighbors(node)
+        assert compact.processing_delay[node] == graph.nodes[node]["processing_delay"]
+    print("✅ Test 3 PASSED: Neighbors and node attributes match")
+
+    assert compact.edge_id(0, 999) == -1
+    assert not compact.has_edge(0, 0)
+    us = np.array([u for u, _ in list(graph.edges())[:50]] + [0, 0])
+    vs = np.array([v for _, v in list(graph.edges())[:50]] + [0, 999])
+    ids = compact.edge_ids(us, vs)
+    assert all(ids[i] == compact.edge_id(int(us[i]), int(vs[i])) for i in range(len(us)))
+    print("✅ Test 4 PASSED: Scalar and vectorized edge-id lookups agree")
+
+    assert not compact.delay.flags.writeable
+    print("✅ Test 5 PASSED: Attribute arrays are read-only")
+
+    resource = compact.resource_per_edge
+    assert resource is compact.resource_per_edge and not resource.flags.writeable
+    assert np.array_equal(resource, 1.0 / (compact.bandwidth / 1000.0))
+    costs = compact.reliability_cost_per_edge
+    assert costs is compact.reliability_cost_per_edge and not costs.flags.writeable
+    assert np.allclose(costs, -np.log(compact.reliability))
+    print("✅ Test 6 PASSED: Per-edge resource and reliability costs computed once and cached")
+
+    print("\n✅ ALL CompactGraph structure TESTS PASSED!\n")
+    return True
+
+
+def test_metrics_and_validator():
+    """Metrikler ve PathValidator iki graf türünde aynı sonucu vermeli"""
+    print("=" * 60)
+    print("🧪 TEST: Metrics / PathValidator on CompactGraph")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=250, edge_prob=0.4, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    compact = CompactGraph.from_graph(graph)
+    nx_validator = PathValidator(graph)
+    compact_validator = PathValidator(compact)
+
+    for source, target in [(0, 50), (10, 100), (20, 150)]:
+        path = nx.shortest_path(graph, source, target, weight="delay")
+        assert total_delay(graph=graph, path=path) == total_delay(graph=compact, path=path)
+        assert reliability_cost(graph=graph, path=path) == reliability_cost(graph=compact, path=path)
+        assert bandwidth_cost(graph=graph, path=path) == bandwidth_cost(graph=compact, path=path)
+        for bw in (100.0, 500.0, 900.0):
+            assert nx_validator.has_capacity(path, bw) == compact_validator.has_capacity(path, bw)
+        print(f"✅ Path {source}→{target}: metrics and capacity checks identical")
+
+    assert compact_validator.has_capacity([0, 999], 100.0) is False
+    assert reliability_cost(graph=compact, path=[0, 999]) == float("inf")
+    assert bandwidth_cost(graph=compact, path=[0, 999]) == float("inf")
+    print("✅ Non-existent edges handled like networkx")
+
+    print("\n✅ ALL metric/validator TESTS PASSED!\n")
+    return True
+
+
+def test_genetic_algorithm():
+    """GA doğrudan CompactGraph ile çalışabilmeli"""
+    print("=" * 60)
+    print("🧪 TEST: GeneticAlgorithm on CompactGraph")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=60, edge_prob=0.2, seed=42)
+    compact = CompactGraph.from_graph(generator.attach_attributes(generator.generate()))
+    ga = GeneticAlgorithm(compact, source=0, target=59, required_bandwidth=100.0,
+                          population_size=20, seed=7)
+    best_path, best_fitness = ga.run(generations=10)
+
+    assert best_path[0] == 0 and best_path[-1] == 59
+    assert best_fitness < float("inf")
+    assert all(isinstance(node, int) for node in best_path)
+    print(f"✅ GA best fitness={best_fitness:.4f}, path length={len(best_path)}")
+
+    print("\n✅ ALL GA TESTS PASSED!\n")
+    return True
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("BSM307 - CompactGraph Test Suite")
+    print("=" * 60 + "\n")
+
+    try:
+        ok1 = test_structure()
+        ok2 = test_metrics_and_validator()
+        ok3 = test_genetic_algorithm()
+
+        if ok1 and ok2 and ok3:
+            print("\n✅ ALL TESTS PASSED!")
+            return 0
+        print("\n❌ SOME TESTS FAILED!")
+        return 1
+    except Exception as e:
+        print(f"\n❌ Test error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
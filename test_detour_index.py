@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+DetourIndex test script
+BSM307 - Güz 2025
+"""
+
+import sys
+import os
+import random
+
+# Proje kökünü Python path'e ekle
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.network.generator import RandomNetworkGenerator
+from src.network.compact_graph import CompactGraph
+from src.routing.detour_index import DetourIndex
+from src.algorithms.sa.simulated_annealing import SimulatedAnnealingRouter
+import networkx as nx
+
+
+def test_detour_sets():
+    """Her çift için detour kümesi N(u) ∩ N(v) ile aynı olmalı"""
+    print("=" * 60)
+    print("🧪 TEST: DetourIndex sets")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=80, edge_prob=0.15, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    index = DetourIndex(CompactGraph.from_graph(graph), cache_size=500)
+    assert index.num_pairs == 0
+
+    for u in range(0, 80, 3):
+        for v in range(80):
+            expected = sorted(set(graph.neighbors(u)) & set(graph.neighbors(v))) if u != v else []
+            assert index.detours(u, v).tolist() == expected
+            assert index.count(u, v) == len(expected)
+    assert index.num_pairs == 500
+    assert index.detours(0, 7) is index.detours(0, 7)
+    print("✅ Test 1 PASSED: On-demand sets match neighbor intersections, LRU bounded")
+
+    rng = random.Random(1)
+    u, v = next((a, b) for a in range(80) for b in range(80) if index.count(a, b) >= 3)
+    excluded = int(index.detours(u, v)[0])
+    draws = {index.sample(u, v, exclude=excluded, rng=rng) for _ in range(300)}
+    assert draws == set(index.detours(u, v).tolist()) - {excluded}
+    lonely = next((a, b) for a in range(80) for b in range(80) if index.count(a, b) == 1)
+    assert index.sample(*lonely, exclude=int(index.detours(*lonely)[0])) == -1
+    assert index.sample(0, 0) == -1
+    print("✅ Test 2 PASSED: sample() covers all candidates except the excluded node")
+
+    print("\n✅ ALL detour TESTS PASSED!\n")
+    return True
+
+
+def test_sa_neighbor():
+    """SA komşu hamleleri basit ve bağlı path üretmeli"""
+    print("=" * 60)
+    print("🧪 TEST: SA neighbor moves")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=80, edge_prob=0.15, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    router = SimulatedAnnealingRouter(graph)
+    random.seed(4)
+    path = nx.shortest_path(graph, 0, 50)
+    changed = 0
+    for _ in range(200):
+        candidate = router.neighbor(path)
+        assert candidate[0] == 0 and candidate[-1] == 50
+        assert len(set(candidate)) == len(candidate)
+        assert all(graph.has_edge(a, b) for a, b in zip(candidate, candidate[1:]))
+        changed += candidate != path
+        path = candidate
+    assert changed > 0
+    print(f"✅ Test 1 PASSED: {changed}/200 neighbor moves changed the path, all valid")
+
+    print("\n✅ ALL SA neighbor TESTS PASSED!\n")
+    return True
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("BSM307 - DetourIndex Test Suite")
+    print("=" * 60 + "\n")
+
+    try:
+        ok1 = test_detour_sets()
+        ok2 = test_sa_neighbor()
+
+        if ok1 and ok2:
+            print("\n✅ ALL TESTS PASSED!")
+            return 0
+        print("\n❌ SOME TESTS FAILED!")
+        return 1
+    except Exception as e:
+        print(f"\n❌ Test error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
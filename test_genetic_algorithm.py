@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+GeneticAlgorithm test script
+BSM307 - Güz 2025
+"""
+
+import sys
+import os
+
+# Proje kökünü Python path'e ekle
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.network.generator import RandomNetworkGenerator
+from src.routing.path_validator import PathValidator
+from src.algorithms.ga.genetic_algorithm import GeneticAlgorithm
+from src.algorithms.ga import island
+from src.algorithms.ga.island import _FINISHED, IslandModel, _island_worker
+from src.algorithms.ga.operators import crossover, remove_loops
+from src.algorithms.ga.parallel import ParallelEvaluator, compare_with_serial
+from src.metrics.batch import evaluate_population, pad_population
+from src.network.compact_graph import CompactGraph
+from src.network.shared_graph import SharedGraph
+from src.routing.weighted_solver import WeightedSumSolver
+import multiprocessing as mp
+import networkx as nx
+import signal
+import time
+import numpy as np
+
+
+def test_bounded_offspring_loop():
+    """Sıkı bandwidth altında generasyon başına deneme sayısı sınırlı olmalı"""
+    print("=" * 60)
+    print("🧪 TEST: Bounded offspring generation")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=250, edge_prob=0.4, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    validator = PathValidator(graph)
+    ga = GeneticAlgorithm(graph, 0, 50, required_bandwidth=900.0, population_size=30,
+                          seed=3, max_offspring_attempts=5)
+    best_path, best_fitness = ga.run(generations=8)
+
+    assert len(ga.generation_stats) == 8
+    for stats in ga.generation_stats:
+        assert stats.attempts <= 5
+        assert stats.attempts * 2 >= stats.invalid_children
+    print(f"✅ Test 1 PASSED: attempts per generation <= 5 "
+          f"(invalid={sum(s.invalid_children for s in ga.generation_stats)}, "
+          f"repairs={sum(s.repairs for s in ga.generation_stats)}, "
+          f"refilled={sum(s.refilled for s in ga.generation_stats)})")
+
+    assert any(stats.refilled > 0 for stats in ga.generation_stats)
+    assert validator.has_capacity(best_path, 900.0)
+    assert best_fitness < float("inf")
+    print(f"✅ Test 2 PASSED: Pool refill keeps a feasible best path (fitness={best_fitness:.4f})")
+
+    fitness_curve = [stats.best_fitness for stats in ga.generation_stats]
+    assert fitness_curve == sorted(fitness_curve, reverse=True)
+    print("✅ Test 3 PASSED: Best fitness is non-increasing across generations")
+
+    print("\n✅ ALL bounded-loop TESTS PASSED!\n")
+    return True
+
+
+def test_parallel_matches_serial():
+    """Process havuzu ile değerlendirme seri mod ile birebir aynı olmalı"""
+    print("=" * 60)
+    print("🧪 TEST: Parallel fitness evaluation")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=120, edge_prob=0.1, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    compact = CompactGraph.from_graph(graph)
+    ga = GeneticAlgorithm(compact, 0, 60, required_bandwidth=300.0, population_size=40, seed=5)
+    population = ga.initialize_population()
+    matrix, lengths = pad_population(population)
+
+    serial = evaluate_population(compact, (matrix, lengths), ga.weights, 300.0, 0, 60)
+    with ParallelEvaluator(compact, ga.weights, 300.0, 0, 60, workers=2, chunk_size=7) as parallel:
+        chunked = parallel.evaluate(matrix, lengths)
+    for column_a, column_b in zip(serial, chunked):
+        assert np.array_equal(column_a, column_b)
+    print(f"✅ Test 1 PASSED: {len(population)} paths evaluated identically in 7-path chunks")
+
+    report = compare_with_serial(compact, 0, 60, generations=10, workers=2,
+                                 required_bandwidth=300.0, population_size=40)
+    assert report.identical
+    print(f"✅ Test 2 PASSED: Same seed gives identical GA result "
+          f"(serial={report.serial_seconds:.3f}s, parallel={report.parallel_seconds:.3f}s, "
+          f"speedup={report.speedup:.2f}x)")
+
+    print("\n✅ ALL parallel TESTS PASSED!\n")
+    return True
+
+
+def _killed_island(index, *args):
+    """Ada 1 sonuç göndermeden SIGKILL ile ölür (OOM killer benzetimi)."""
+    if index == 1:
+        os.kill(os.getpid(), signal.SIGKILL)
+    _island_worker(index, *args)
+
+
+def test_island_model():
+    """Adalar farklı seed'lerle çalışmalı ve her M generasyonda göç etmeli"""
+    print("=" * 60)
+    print("🧪 TEST: Island model")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=120, edge_prob=0.1, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    validator = PathValidator(graph)
+    model = IslandModel(graph, 0, 60, islands=3, migration_interval=4, migrants=2, seed=11,
+                        required_bandwidth=300.0, population_size=20)
+    best_path, best_fitness = model.run(generations=12)
+
+    assert [result.seed for result in model.island_results] == [11, 12, 13]
+    assert all(result.migrations == 3 for result in model.island_results)
+    print("✅ Test 1 PASSED: 3 islands with distinct seeds, 3 migrations each")
+
+    assert best_fitness == min(result.best_fitness for result in model.island_results)
+    assert best_path[0] == 0 and best_path[-1] == 60
+    assert validator.is_simple_path(best_path) and validator.has_capacity(best_path, 300.0)
+    print(f"✅ Test 2 PASSED: Best island result returned (fitness={best_fitness:.4f})")
+
+    island._island_worker = _killed_island
+    try:
+        model = IslandModel(graph, 0, 60, islands=3, migration_interval=4, migrants=2, seed=11,
+                            migration_timeout=1.0, required_bandwidth=300.0, population_size=20)
+        model.run(generations=12)
+        raise AssertionError("killed island went unnoticed")
+    except RuntimeError as error:
+        assert "island 1 exited with code" in str(error)
+    finally:
+        island._island_worker = _island_worker
+    print("✅ Test 3 PASSED: An island killed without reporting raises instead of hanging")
+
+    print("\n✅ ALL island TESTS PASSED!\n")
+    return True
+
+
+def test_common_node_crossover():
+    """Ortak düğüm crossover'ı repair olmadan geçerli basit child'lar üretmeli"""
+    print("=" * 60)
+    print("🧪 TEST: Common-node crossover")
+    print("=" * 60)
+
+    assert remove_loops([0, 1, 2, 3, 1, 4, 5, 4, 6]) == [0, 1, 4, 6]
+    assert remove_loops([0, 1, 2]) == [0, 1, 2]
+    print("✅ Test 1 PASSED: remove_loops cuts cycles and keeps endpoints")
+
+    generator = RandomNetworkGenerator(num_nodes=120, edge_prob=0.1, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    ga = GeneticAlgorithm(graph, 0, 60, required_bandwidth=0.0, population_size=40, seed=8)
+    population = ga.initialize_population()
+    children = 0
+    for a in population[:15]:
+        for b in population[15:30]:
+            for child in crossover(a, b) + ga._crossover(ga._as_chromosome(a), ga._as_chromosome(b)):
+                assert child[0] == 0 and child[-1] == 60
+                assert len(set(child)) == len(child)
+                assert all(graph.has_edge(u, v) for u, v in zip(child, child[1:]))
+                if getattr(child, "metrics", None) is not None:
+                    expected = ga.evaluator.evaluate(child)
+                    assert abs(child.metrics.score - expected.score) < 1e-9
+                children += 1
+    assert ga._repair_count == 0
+    print(f"✅ Test 2 PASSED: {children} children are simple, connected and need no repair")
+
+    print("\n✅ ALL crossover TESTS PASSED!\n")
+    return True
+
+
+def test_warm_start_reoptimize():
+    """Ağırlık / talep değişiminde önceki popülasyondan sıcak başlangıç"""
+    print("=" * 60)
+    print("🧪 TEST: Warm-start reoptimize")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=250, edge_prob=0.4, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    validator = PathValidator(graph)
+    exact = WeightedSumSolver(graph)
+    ga = GeneticAlgorithm(graph, 0, 50, required_bandwidth=300.0, population_size=40, seed=21)
+    ga.run(generations=30)
+    assert len(ga.population) == 40
+
+    started = time.perf_counter()
+    best_path, best_fitness = ga.reoptimize(weights=(0.2, 0.5, 0.3), required_bandwidth=600.0,
+                                            generations=100, stall_generations=5)
+    elapsed = time.perf_counter() - started
+    assert ga.weights == (0.2, 0.5, 0.3) and ga.required_bandwidth == 600.0
+    assert validator.has_capacity(best_path, 600.0)
+    assert len(ga.generation_stats) < 100
+    _, optimum = exact.solve(0, 50, (0.2, 0.5, 0.3), 600.0)
+    assert best_fitness >= optimum - 1e-9
+    print(f"✅ Test 1 PASSED: Re-optimized in {len(ga.generation_stats)} generations, "
+          f"{elapsed:.3f}s (fitness={best_fitness:.4f}, optimum={optimum:.4f})")
+
+    fitness_before = best_fitness
+    _, resumed_fitness = ga.resume(generations=10)
+    assert resumed_fitness <= fitness_before
+    print("✅ Test 2 PASSED: resume() continues from the final population")
+
+    print("\n✅ ALL warm-start TESTS PASSED!\n")
+    return True
+
+
+def test_stopping_criteria():
+    """Durgunluk, göreli iyileşme eşiği, çeşitlilik tabanı ve süre sınırı"""
+    print("=" * 60)
+    print("🧪 TEST: Stopping criteria")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=250, edge_prob=0.4, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    ga = GeneticAlgorithm(graph, 0, 50, population_size=40, seed=5, stall_generations=5)
+    result = ga.optimize(generations=500)
+    assert result.stop_reason == "stall" and result.generations < 500
+    assert result.generations == len(ga.generation_stats)
+    assert result.best_path and result.best_path[0] == 0 and result.best_path[-1] == 50
+    print(f"✅ Test 1 PASSED: Stalled after {result.generations} generations")
+
+    strict = GeneticAlgorithm(graph, 0, 50, population_size=40, seed=5,
+                              stall_generations=5, min_improvement=0.5)
+    strict_result = strict.optimize(generations=500)
+    assert strict_result.stop_reason == "stall"
+    assert strict_result.generations <= result.generations
+    print(f"✅ Test 2 PASSED: min_improvement=0.5 stops after {strict_result.generations} generations")
+
+    diverse = GeneticAlgorithm(graph, 0, 50, population_size=40, seed=5, diversity_floor=1.01)
+    diverse_result = diverse.optimize(generations=50)
+    assert diverse_result.stop_reason == "diversity" and diverse_result.generations == 1
+    print("✅ Test 3 PASSED: Diversity floor stops the run")
+
+    timed = GeneticAlgorithm(graph, 0, 50, population_size=40, seed=5, deadline_ms=50.0)
+    timed_result = timed.optimize(generations=100000)
+    assert timed_result.stop_reason == "deadline"
+    assert timed_result.generations < 100000 and timed_result.best_path
+    print(f"✅ Test 4 PASSED: Deadline hit after {timed_result.generations} generations "
+          f"({timed_result.elapsed_ms:.1f} ms)")
+
+    full = GeneticAlgorithm(graph, 0, 50, population_size=20, seed=5).optimize(generations=5)
+    assert full.stop_reason == "generations" and full.generations == 5
+    print("✅ Test 5 PASSED: Runs to the generation limit without criteria")
+
+    started = time.perf_counter()
+    tight = GeneticAlgorithm(graph, 0, 50, population_size=400, k_shortest_seeds=100, seed=5,
+                             deadline_ms=20.0)
+    tight_result = tight.optimize(generations=50)
+    elapsed = time.perf_counter() - started
+    assert tight_result.stop_reason == "deadline" and tight_result.generations == 0
+    assert 0 < len(tight.population) < 400
+    print(f"✅ Test 6 PASSED: Deadline honoured during initialization ({elapsed * 1000:.1f} ms)")
+
+    # Erken duran komşu ada: _FINISHED görüldükten sonra göçmen beklenmez
+    ctx = mp.get_context()
+    inbox, outbox, results = ctx.Queue(), ctx.Queue(), ctx.Queue()
+    inbox.put(_FINISHED)
+    # _FINISHED'dan sonra gelen göçmenler hiç okunmamalı
+    inbox.put([nx.shortest_path(graph, 0, 50)])
+    with SharedGraph(CompactGraph.from_graph(graph)) as shared:
+        started = time.perf_counter()
+        _island_worker(0, shared.handle, 0, 50, 5, 12, 1, 2, 5.0, {"population_size": 20},
+                       inbox, outbox, results)
+        elapsed = time.perf_counter() - started
+    index, island_result, error = results.get(timeout=5.0)
+    assert error is None and island_result.migrations == 0
+    sent = [outbox.get(timeout=5.0) for _ in range(13)]
+    assert sent[-1] is _FINISHED and all(isinstance(batch, list) for batch in sent[:-1])
+    assert isinstance(inbox.get(timeout=5.0), list)
+    print(f"✅ Test 7 PASSED: Island stops waiting once its neighbour finished ({elapsed:.2f}s)")
+
+    print("\n✅ ALL stopping TESTS PASSED!\n")
+    return True
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("BSM307 - GeneticAlgorithm Test Suite")
+    print("=" * 60 + "\n")
+
+    try:
+        ok1 = test_bounded_offspring_loop()
+        ok2 = test_parallel_matches_serial()
+        ok3 = test_island_model()
+        ok4 = test_common_node_crossover()
+        ok5 = test_warm_start_reoptimize()
+        ok6 = test_stopping_criteria()
+
+        if ok1 and ok2 and ok3 and ok4 and ok5 and ok6:
+            print("\n✅ ALL TESTS PASSED!")
+            return 0
+        print("\n❌ SOME TESTS FAILED!")
+        return 1
+    except Exception as e:
+        print(f"\n❌ Test error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+k_shortest_paths test script
+BSM307 - Güz 2025
+"""
+
+import sys
+import os
+import itertools
+
+# Proje kökünü Python path'e ekle
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.network.generator import RandomNetworkGenerator
+from src.routing.k_shortest import k_shortest_paths
+from src.routing.path_validator import PathValidator
+from src.routing.weighted_solver import WeightedSumSolver
+from src.algorithms.ga.genetic_algorithm import GeneticAlgorithm
+import networkx as nx
+
+
+def test_matches_networkx():
+    """İlk k path networkx.shortest_simple_paths ile aynı skorları vermeli"""
+    print("=" * 60)
+    print("🧪 TEST: Yen k-shortest paths")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=60, edge_prob=0.1, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    weights = (0.4, 0.3, 0.3)
+    solver = WeightedSumSolver(graph)
+    validator = PathValidator(graph)
+
+    results = list(itertools.islice(k_shortest_paths(solver, 0, 45, weights, 300.0), 12))
+    scores = [score for _, score in results]
+    assert results[0][0] == solver.solve(0, 45, weights, 300.0)[0]
+    assert scores == sorted(scores)
+    assert len({tuple(path) for path, _ in results}) == len(results)
+    for path, _ in results:
+        assert validator.is_simple_path(path) and validator.has_capacity(path, 300.0)
+    print(f"✅ Test 1 PASSED: {len(results)} distinct feasible paths in non-decreasing score order")
+
+    pruned = nx.Graph()
+    pruned.add_edges_from(
+        (u, v, {"w": solver.score([u, v], weights)})
+        for u, v, bw in graph.edges(data="bandwidth") if bw >= 300.0
+    )
+    reference = itertools.islice(nx.shortest_simple_paths(pruned, 0, 45, weight="w"), 12)
+    expected = [solver.score(path, weights) for path in reference]
+    assert all(abs(a - b) < 1e-9 for a, b in zip(scores, expected))
+    print("✅ Test 2 PASSED: Scores match networkx.shortest_simple_paths")
+
+    assert list(k_shortest_paths(solver, 0, 45, weights, 5000.0)) == []
+    print("✅ Test 3 PASSED: Infeasible demand yields nothing")
+
+    ga = GeneticAlgorithm(graph, 0, 45, weights, 300.0, population_size=20, seed=1)
+    ga.initialize_population()
+    solver = ga.solver
+    ga.initialize_population()
+    assert ga.solver is solver and solver.bandwidth_index is ga.bandwidth_index
+    print("✅ Test 4 PASSED: GA seeding reuses one solver sharing the GA's BandwidthIndex")
+
+    print("\n✅ ALL k-shortest TESTS PASSED!\n")
+    return True
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("BSM307 - k_shortest_paths Test Suite")
+    print("=" * 60 + "\n")
+
+    try:
+        ok1 = test_matches_networkx()
+
+        if ok1:
+            print("\n✅ ALL TESTS PASSED!")
+            return 0
+        print("\n❌ SOME TESTS FAILED!")
+        return 1
+    except Exception as e:
+        print(f"\n❌ Test error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
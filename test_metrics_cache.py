@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+PathMetricsCache test script
+BSM307 - Güz 2025
+"""
+
+import sys
+import os
+
+# Proje kökünü Python path'e ekle
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.network.generator import RandomNetworkGenerator
+from src.network.compact_graph import CompactGraph
+from src.metrics.cache import PathMetricsCache
+from src.metrics.delay import total_delay
+from src.routing.path_validator import PathValidator
+from src.utils.graph_helpers import add_edge_attributes
+from src.algorithms.ga.genetic_algorithm import GeneticAlgorithm
+import networkx as nx
+
+
+def test_hits_and_eviction():
+    """Hit/miss sayaçları ve kayıt/bayt sınırlı LRU çıkarma"""
+    print("=" * 60)
+    print("🧪 TEST: PathMetricsCache hits and eviction")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=60, edge_prob=0.2, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    path = nx.shortest_path(graph, 0, 30)
+    cache = PathMetricsCache(max_entries=3)
+
+    first = cache.metrics(graph, path)
+    second = cache.metrics(graph, path)
+    assert first == second
+    assert first[0] == total_delay(graph=graph, path=path)
+    assert cache.stats.hits == 1 and cache.stats.misses == 1
+    print(f"✅ Test 1 PASSED: hit_rate={cache.stats.hit_rate:.2f}")
+
+    cache.metrics(graph, path, weights=(1.0, 0.0, 0.0))
+    assert cache.stats.misses == 2, "Different weights must not share an entry"
+    for target in (31, 32, 33):
+        cache.metrics(graph, nx.shortest_path(graph, 0, target))
+    assert len(cache) == 3 and cache.stats.evictions == 2
+    print(f"✅ Test 2 PASSED: entry bound enforced, evictions={cache.stats.evictions}")
+
+    small = PathMetricsCache(max_bytes=1000)
+    for target in range(31, 45):
+        small.metrics(graph, nx.shortest_path(graph, 0, target))
+    assert small.stats.bytes <= 1000 and small.stats.evictions > 0
+    print(f"✅ Test 3 PASSED: byte bound enforced, bytes={small.stats.bytes}")
+
+    print("\n✅ ALL hit/eviction TESTS PASSED!\n")
+    return True
+
+
+def test_invalidation():
+    """Graf attribute'ları değişince eski kayıtlar kullanılmamalı"""
+    print("=" * 60)
+    print("🧪 TEST: PathMetricsCache invalidation")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=60, edge_prob=0.2, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    path = nx.shortest_path(graph, 0, 30)
+    u, v = path[0], path[1]
+    cache = PathMetricsCache()
+    validator = PathValidator(graph)
+
+    before = cache.metrics(graph, path)[0]
+    assert cache.is_valid(validator, path, 100.0)
+    add_edge_attributes(graph, {(u, v): {"delay": graph.edges[u, v]["delay"] + 100.0,
+                                         "bandwidth": 50.0}})
+    after = cache.metrics(graph, path)[0]
+    assert abs(after - before - 100.0) < 1e-9
+    assert not cache.is_valid(validator, path, 100.0)
+    print("✅ Test 1 PASSED: add_edge_attributes invalidates entries")
+
+    graph.edges[u, v]["delay"] = 0.0
+    assert cache.metrics(graph, path)[0] == total_delay(graph=graph, path=path)
+    graph.edges[u, v]["bandwidth"] = 500.0
+    assert cache.is_valid(validator, path, 100.0)
+    print("✅ Test 2 PASSED: Direct attribute edits invalidate entries")
+
+    compact_a = CompactGraph.from_graph(graph)
+    graph.edges[u, v]["delay"] = 1.0
+    compact_b = CompactGraph.from_graph(graph)
+    assert compact_a.fingerprint != compact_b.fingerprint
+    assert cache.metrics(compact_a, path)[0] != cache.metrics(compact_b, path)[0]
+    print("✅ Test 3 PASSED: CompactGraph snapshots keyed by content fingerprint")
+
+    print("\n✅ ALL invalidation TESTS PASSED!\n")
+    return True
+
+
+def test_genetic_algorithm_with_cache():
+    """Önbellekli GA, önbelleksiz GA ile aynı sonucu vermeli"""
+    print("=" * 60)
+    print("🧪 TEST: GeneticAlgorithm with shared cache")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=60, edge_prob=0.2, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    plain = GeneticAlgorithm(graph, 0, 59, required_bandwidth=100.0, population_size=20, seed=5)
+    plain_result = plain.run(generations=10)
+
+    cache = PathMetricsCache()
+    cached = GeneticAlgorithm(graph, 0, 59, required_bandwidth=100.0, population_size=20,
+                              seed=5, cache=cache)
+    cached_result = cached.run(generations=10)
+
+    assert plain_result[0] == cached_result[0]
+    assert abs(plain_result[1] - cached_result[1]) < 1e-9
+    assert cache.stats.hits > 0
+    print(f"✅ Same result, cache stats={cache.stats}")
+
+    print("\n✅ ALL GA cache TESTS PASSED!\n")
+    return True
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("BSM307 - PathMetricsCache Test Suite")
+    print("=" * 60 + "\n")
+
+    try:
+        ok1 = test_hits_and_eviction()
+        ok2 = test_invalidation()
+        ok3 = test_genetic_algorithm_with_cache()
+
+        if ok1 and ok2 and ok3:
+            print("\n✅ ALL TESTS PASSED!")
+            return 0
+        print("\n❌ SOME TESTS FAILED!")
+        return 1
+    except Exception as e:
+        print(f"\n❌ Test error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
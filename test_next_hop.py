@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+NextHopTable test script
+BSM307 - Güz 2025
+"""
+
+import sys
+import os
+
+# Proje kökünü Python path'e ekle
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.network.generator import RandomNetworkGenerator
+from src.network.compact_graph import CompactGraph
+from src.routing.next_hop import NextHopTable
+from src.routing.path_validator import PathValidator
+import networkx as nx
+
+
+def test_hop_counts():
+    """Tablo yürüyüşü BFS ile aynı hop sayısını vermeli"""
+    print("=" * 60)
+    print("🧪 TEST: NextHopTable hop counts")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=80, edge_prob=0.08, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    table = NextHopTable(CompactGraph.from_graph(graph))
+    table.fill_all()
+
+    lengths = dict(nx.all_pairs_shortest_path_length(graph))
+    for u in range(0, 80, 7):
+        for v in range(0, 80, 5):
+            path = table.path(u, v)
+            assert path[0] == u and path[-1] == v
+            assert len(path) - 1 == lengths[u][v]
+            assert all(graph.has_edge(a, b) for a, b in zip(path, path[1:]))
+    print("✅ Test 1 PASSED: All sampled pairs use minimum hop counts")
+
+    assert table.path(5, 5) == [5]
+    print("✅ Test 2 PASSED: Trivial path handled")
+
+    print("\n✅ ALL hop-count TESTS PASSED!\n")
+    return True
+
+
+def test_bandwidth_threshold():
+    """Eşikli tablo yalnızca bandwidth ≥ eşik kenarlarını kullanmalı"""
+    print("=" * 60)
+    print("🧪 TEST: NextHopTable bandwidth threshold")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=80, edge_prob=0.08, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    validator = PathValidator(graph)
+    table = NextHopTable(CompactGraph.from_graph(graph), min_bandwidth=600.0)
+
+    pruned = nx.Graph()
+    pruned.add_nodes_from(graph.nodes)
+    pruned.add_edges_from((u, v) for u, v, bw in graph.edges(data="bandwidth") if bw >= 600.0)
+
+    for v in range(0, 80, 9):
+        for u in range(80):
+            path = table.path(u, v)
+            if nx.has_path(pruned, u, v):
+                assert validator.has_capacity(path, 600.0)
+                assert len(path) - 1 == nx.shortest_path_length(pruned, u, v)
+            else:
+                assert path is None and not table.has_path(u, v)
+    print("✅ Test 1 PASSED: Paths respect the bandwidth threshold")
+
+    print("\n✅ ALL threshold TESTS PASSED!\n")
+    return True
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("BSM307 - NextHopTable Test Suite")
+    print("=" * 60 + "\n")
+
+    try:
+        ok1 = test_hop_counts()
+        ok2 = test_bandwidth_threshold()
+
+        if ok1 and ok2:
+            print("\n✅ ALL TESTS PASSED!")
+            return 0
+        print("\n❌ SOME TESTS FAILED!")
+        return 1
+    except Exception as e:
+        print(f"\n❌ Test error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+ParetoSolver test script
+BSM307 - Güz 2025
+"""
+
+import sys
+import os
+import time
+
+# Proje kökünü Python path'e ekle
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.network.generator import RandomNetworkGenerator
+from src.metrics.path_evaluator import PathEvaluator
+from src.routing.pareto import ParetoSolver
+from src.routing.weighted_solver import WeightedSumSolver
+import networkx as nx
+
+
+def _brute_force_front(graph, source, target, required_bandwidth):
+    evaluator = PathEvaluator(graph, required_bandwidth=required_bandwidth)
+    points = []
+    for path in nx.all_simple_paths(graph, source, target):
+        metrics = evaluator.evaluate(path)
+        if metrics.feasible:
+            points.append((metrics.delay, metrics.reliability_cost, metrics.resource_cost))
+    return {
+        p for p in points
+        if not any(q != p and all(a <= b for a, b in zip(q, p)) for q in points)
+    }
+
+
+def test_exact_front():
+    """Cephe, tüm basit path'lerin brute-force Pareto kümesiyle aynı olmalı"""
+    print("=" * 60)
+    print("🧪 TEST: Pareto front exactness")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=12, edge_prob=0.45, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    solver = ParetoSolver(graph)
+    for required_bandwidth in (0.0, 200.0, 400.0):
+        front = solver.solve(0, 7, required_bandwidth)
+        found = {(p.delay, p.reliability_cost, p.resource_cost) for p in front}
+        expected = _brute_force_front(graph, 0, 7, required_bandwidth)
+        assert len(found) == len(expected)
+        for point in found:
+            assert any(all(abs(a - b) < 1e-9 for a, b in zip(point, q)) for q in expected)
+        assert all(p.bottleneck_bandwidth >= required_bandwidth for p in front)
+        print(f"✅ Test PASSED: bandwidth={required_bandwidth}: {len(found)} non-dominated paths")
+
+    print("\n✅ ALL exactness TESTS PASSED!\n")
+    return True
+
+
+def test_weight_lookup():
+    """Cephe üzerindeki argmin, Dijkstra çözücüsüyle aynı skoru vermeli"""
+    print("=" * 60)
+    print("🧪 TEST: Weight lookup over the front")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=250, edge_prob=0.4, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    solver = ParetoSolver(graph)
+    started = time.perf_counter()
+    front = solver.solve(0, 100, 500.0)
+    elapsed = time.perf_counter() - started
+    points = [(p.delay, p.reliability_cost, p.resource_cost) for p in front]
+    assert len(front) > 0
+    for p in front:
+        assert p.path[0] == 0 and p.path[-1] == 100
+        assert len(set(p.path)) == len(p.path)
+        assert p.bottleneck_bandwidth >= 500.0
+    for i, a in enumerate(points):
+        assert not any(j != i and all(x <= y for x, y in zip(b, a)) for j, b in enumerate(points))
+    print(f"✅ Test 1 PASSED: 250-node front ({len(front)} paths) in {elapsed:.3f}s")
+
+    exact = WeightedSumSolver(graph)
+    for weights in [(0.4, 0.3, 0.3), (1.0, 0.0, 0.0), (0.1, 0.8, 0.1), (0.2, 0.2, 0.6)]:
+        _, score = front.best(weights)
+        _, expected = exact.solve(0, 100, weights, 500.0)
+        assert abs(score - expected) < 1e-9
+    print("✅ Test 2 PASSED: front.best() matches WeightedSumSolver for all weight vectors")
+
+    print("\n✅ ALL lookup TESTS PASSED!\n")
+    return True
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("BSM307 - ParetoSolver Test Suite")
+    print("=" * 60 + "\n")
+
+    try:
+        ok1 = test_exact_front()
+        ok2 = test_weight_lookup()
+
+        if ok1 and ok2:
+            print("\n✅ ALL TESTS PASSED!")
+            return 0
+        print("\n❌ SOME TESTS FAILED!")
+        return 1
+    except Exception as e:
+        print(f"\n❌ Test error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+PathEvaluator test script
+BSM307 - Güz 2025
+"""
+
+import sys
+import os
+import math
+
+# Proje kökünü Python path'e ekle
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.network.generator import RandomNetworkGenerator
+from src.network.compact_graph import CompactGraph
+from src.metrics.delay import total_delay
+from src.metrics.reliability import reliability_cost
+from src.metrics.resource_cost import bandwidth_cost, weighted_sum
+from src.metrics.path_evaluator import PathEvaluator
+from src.metrics.batch import evaluate_population, pad_population
+import networkx as nx
+import numpy as np
+
+
+def _sample_paths(graph):
+    paths = []
+    for source, target in [(0, 50), (10, 100), (20, 150), (3, 7)]:
+        paths.append(nx.shortest_path(graph, source, target))
+        paths.append(nx.shortest_path(graph, source, target, weight="delay"))
+    return paths
+
+
+def test_single_pass_matches_metrics():
+    """PathEvaluator sonuçları metrik fonksiyonlarıyla birebir aynı olmalı"""
+    print("=" * 60)
+    print("🧪 TEST: PathEvaluator vs. metric functions")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=250, edge_prob=0.4, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    weights = (0.4, 0.3, 0.3)
+    evaluator = PathEvaluator(graph, weights)
+
+    for path in _sample_paths(graph):
+        metrics = evaluator.evaluate(path)
+        delay = total_delay(graph=graph, path=path)
+        rel = reliability_cost(graph=graph, path=path)
+        res = bandwidth_cost(graph=graph, path=path)
+        assert metrics.delay == delay
+        assert metrics.reliability_cost == rel
+        assert metrics.resource_cost == res
+        assert metrics.score == weighted_sum(delay, rel, res, weights)
+        bottleneck = min(graph.edges[u, v]["bandwidth"] for u, v in zip(path, path[1:]))
+        assert metrics.bottleneck_bandwidth == bottleneck
+        assert metrics.is_simple and metrics.feasible
+        print(f"✅ Path {path[0]}→{path[-1]} (len={len(path)}): score={metrics.score:.4f}")
+
+    print("\n✅ ALL single-pass TESTS PASSED!\n")
+    return True
+
+
+def test_feasibility():
+    """Uygunluk bayrakları ve fitness değeri"""
+    print("=" * 60)
+    print("🧪 TEST: PathEvaluator feasibility")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=250, edge_prob=0.4, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    compact = CompactGraph.from_graph(graph)
+    path = nx.shortest_path(graph, 0, 50)
+    bottleneck = min(graph.edges[u, v]["bandwidth"] for u, v in zip(path, path[1:]))
+
+    ok = PathEvaluator(compact, required_bandwidth=bottleneck, source=0, target=50).evaluate(path)
+    assert ok.feasible and ok.fitness == ok.score
+    print("✅ Test 1 PASSED: Bottleneck equal to demand is feasible")
+
+    tight = PathEvaluator(compact, required_bandwidth=bottleneck + 0.1).evaluate(path)
+    assert not tight.feasible and math.isinf(tight.fitness)
+    assert not math.isinf(tight.score)
+    print("✅ Test 2 PASSED: Insufficient bandwidth is infeasible but still scored")
+
+    wrong_target = PathEvaluator(compact, source=0, target=51).evaluate(path)
+    assert not wrong_target.feasible
+    print("✅ Test 3 PASSED: Endpoint mismatch is infeasible")
+
+    loop = PathEvaluator(compact).evaluate(path + path[-2::-1][:1])
+    assert not loop.is_simple and not loop.feasible
+    print("✅ Test 4 PASSED: Cyclic path is infeasible")
+
+    missing = PathEvaluator(compact).evaluate([0, 999])
+    assert not missing.feasible and math.isinf(missing.reliability_cost)
+    print("✅ Test 5 PASSED: Missing edge yields infinite cost")
+
+    empty = PathEvaluator(compact).evaluate([])
+    assert empty.delay == 0.0 and not empty.feasible
+    print("✅ Test 6 PASSED: Empty path handled")
+
+    print("\n✅ ALL feasibility TESTS PASSED!\n")
+    return True
+
+
+def test_batch_matches_single_pass():
+    """evaluate_population PathEvaluator ile aynı sonuçları vermeli"""
+    print("=" * 60)
+    print("🧪 TEST: evaluate_population vs. PathEvaluator")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=250, edge_prob=0.4, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    compact = CompactGraph.from_graph(graph)
+    weights = (0.5, 0.3, 0.2)
+    paths = _sample_paths(graph)
+    paths += [[0, 999], [], [5], paths[0] + [paths[0][-2]]]
+
+    evaluator = PathEvaluator(compact, weights, required_bandwidth=300.0)
+    batch = evaluate_population(compact, paths, weights, required_bandwidth=300.0)
+    matrix, lengths = pad_population(paths)
+    batch_matrix = evaluate_population(compact, (matrix, lengths), weights, required_bandwidth=300.0)
+
+    for i, path in enumerate(paths):
+        single = evaluator.evaluate(path)
+        for field in ("delay", "reliability_cost", "resource_cost", "bottleneck_bandwidth", "score"):
+            expected = getattr(single, field)
+            got = getattr(batch, field)[i]
+            assert np.isclose(got, expected, rtol=1e-12) or (math.isinf(got) and math.isinf(expected)), \
+                f"{field} mismatch for {path}: {got} != {expected}"
+        assert bool(batch.is_simple[i]) == single.is_simple
+        assert bool(batch.feasible[i]) == single.feasible, f"feasible mismatch for {path}"
+    assert np.array_equal(batch.fitness, batch_matrix.fitness)
+    print(f"✅ Test 1 PASSED: {len(paths)} paths (ragged and padded) match single-pass results")
+
+    empty = evaluate_population(compact, [], weights)
+    assert len(empty.score) == 0
+    print("✅ Test 2 PASSED: Empty population handled")
+
+    print("\n✅ ALL batch TESTS PASSED!\n")
+    return True
+
+
+def test_incremental_splice():
+    """splice() sonuçları child'ın tam değerlendirmesiyle aynı olmalı"""
+    print("=" * 60)
+    print("🧪 TEST: PathPrefix / splice incremental evaluation")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=80, edge_prob=0.1, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    compact = CompactGraph.from_graph(graph)
+    evaluator = PathEvaluator(compact, (0.4, 0.3, 0.3), required_bandwidth=200.0)
+
+    parent = nx.shortest_path(graph, 0, 79, weight="delay")
+    mid = parent[len(parent) // 2]
+    other = nx.shortest_path(graph, 0, mid) + nx.shortest_path(graph, mid, 79, weight="bandwidth")[1:]
+    assert len(set(other)) == len(other)
+    head = evaluator.prefix(parent)
+    tail = evaluator.prefix(other)
+
+    full = evaluator.evaluate(parent)
+    from_prefix = evaluator.metrics_from_prefix(head)
+    assert abs(full.score - from_prefix.score) < 1e-9
+    assert full.feasible == from_prefix.feasible
+    print("✅ Test 1 PASSED: metrics_from_prefix matches evaluate")
+
+    checked = 0
+    for pos in range(1, len(parent) - 1):
+        prev_node, next_node = parent[pos - 1], parent[pos + 1]
+        for node in compact.neighbors(prev_node):
+            if compact.has_edge(node, next_node) and node != parent[pos]:
+                child, metrics = evaluator.splice(head, pos - 1, [node], head, pos + 1)
+                expected = evaluator.evaluate(child)
+                assert child == parent[:pos] + [node] + parent[pos + 1:]
+                for field in ("delay", "reliability_cost", "resource_cost", "score"):
+                    assert abs(getattr(metrics, field) - getattr(expected, field)) < 1e-9
+                assert metrics.bottleneck_bandwidth == expected.bottleneck_bandwidth
+                assert metrics.feasible == expected.feasible
+                assert metrics.is_simple == expected.is_simple
+                checked += 1
+    print(f"✅ Test 2 PASSED: {checked} single-node substitutions match full evaluation")
+
+    common = [node for node in parent[1:-1] if node in other[1:-1]]
+    for node in common:
+        i, j = parent.index(node), other.index(node)
+        child, metrics = evaluator.splice(head, i, [], tail, j + 1)
+        expected = evaluator.evaluate(child)
+        assert abs(metrics.score - expected.score) < 1e-9
+        assert metrics.feasible == expected.feasible
+        assert metrics.is_simple == expected.is_simple
+    for k in range(1, len(parent) - 1):
+        for m in range(1, len(other) - 1):
+            child, metrics = evaluator.splice(head, k - 1, [], tail, m)
+            assert metrics.is_simple == (len(set(child)) == len(child))
+    print(f"✅ Test 3 PASSED: {len(common)} tail swaps between two parents match")
+
+    broken, metrics = evaluator.splice(head, 0, [999], head, 2)
+    assert not metrics.feasible and math.isinf(metrics.fitness)
+    print("✅ Test 4 PASSED: Splice through a missing edge is infeasible")
+
+    graph.edges[other[0], other[1]]["reliability"] = 0.0
+    evaluator = PathEvaluator(CompactGraph.from_graph(graph), (0.4, 0.3, 0.3))
+    head, tail = evaluator.prefix(parent), evaluator.prefix(other)
+    assert math.isinf(tail.reliability_cost[-1])
+    for node in common:
+        i, j = parent.index(node), other.index(node)
+        child, metrics = evaluator.splice(head, i, [], tail, j + 1)
+        expected = evaluator.evaluate(child)
+        assert not math.isnan(metrics.score)
+        assert metrics.score == expected.score or abs(metrics.score - expected.score) < 1e-9
+    print("✅ Test 5 PASSED: Tails behind a zero-reliability edge do not produce NaN")
+
+    print("\n✅ ALL incremental TESTS PASSED!\n")
+    return True
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("BSM307 - PathEvaluator Test Suite")
+    print("=" * 60 + "\n")
+
+    try:
+        ok1 = test_single_pass_matches_metrics()
+        ok2 = test_feasibility()
+        ok3 = test_batch_matches_single_pass()
+        ok4 = test_incremental_splice()
+
+        if ok1 and ok2 and ok3 and ok4:
+            print("\n✅ ALL TESTS PASSED!")
+            return 0
+        print("\n❌ SOME TESTS FAILED!")
+        return 1
+    except Exception as e:
+        print(f"\n❌ Test error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+SharedGraph (paylaşımlı bellekte CompactGraph) test script
+BSM307 - Güz 2025
+"""
+
+import sys
+import os
+import gc
+import multiprocessing as mp
+
+# Proje kökünü Python path'e ekle
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.network.generator import RandomNetworkGenerator
+from src.network.shared_graph import SharedGraph, attach_graph
+import numpy as np
+
+
+def _child_summary(handle):
+    """Worker tarafı: segmenti açar ve kopyasız / salt-okunur olduğunu raporlar."""
+    graph = attach_graph(handle)
+    try:
+        graph.bandwidth[0] = 0.0
+        writable = True
+    except ValueError:
+        writable = False
+    zero_copy = all(not getattr(graph, name).flags.owndata
+                    for name in ("indptr", "indices", "delay", "bandwidth", "_edge_keys",
+                                 "resource_per_edge", "reliability_cost_per_edge"))
+    # Türetilmiş dizi worker'da yeniden hesaplanmamalı (segmentteki görünüm)
+    zero_copy &= graph.__dict__["_resource_per_edge"] is graph.resource_per_edge
+    # edge_ids paylaşılan _edge_keys üzerinde arar; edge_id'nin sözlüğünü kurmaz
+    edge_id = int(graph.edge_ids([0], graph.neighbors(0)[:1])[0])
+    return graph.fingerprint, writable, zero_copy, edge_id
+
+
+def test_publish_and_attach():
+    """Yayınla, başka süreçte kopyasız aç, kapatınca segment silinsin"""
+    print("=" * 60)
+    print("🧪 TEST: Shared-memory topology")
+    print("=" * 60)
+
+    compact = RandomNetworkGenerator(num_nodes=300, edge_prob=0.2, seed=4).generate_compact()
+    with SharedGraph(compact) as shared:
+        assert shared.nbytes >= compact.indices.nbytes + compact.bandwidth.nbytes
+        with mp.get_context("spawn").Pool(2) as pool:
+            summaries = pool.map(_child_summary, [shared.handle] * 2)
+        for fingerprint, writable, zero_copy, edge_id in summaries:
+            assert fingerprint == compact.fingerprint
+            assert not writable and zero_copy
+            assert edge_id == compact.edge_id(0, compact.neighbors(0)[0])
+        print(f"✅ Test 1 PASSED: Workers attach {shared.nbytes / 1e6:.2f} MB zero-copy, read-only")
+        name = shared.handle.name
+    assert shared.closed
+    try:
+        with mp.get_context("spawn").Pool(1) as pool:
+            pool.apply(_child_summary, (shared.handle,))
+        raise AssertionError("segment should be unlinked")
+    except FileNotFoundError:
+        pass
+    print(f"✅ Test 2 PASSED: Segment {name} is unlinked on exit")
+
+    leaked = SharedGraph(compact)
+    handle = leaked.handle
+    del leaked
+    gc.collect()
+    try:
+        with mp.get_context("spawn").Pool(1) as pool:
+            pool.apply(_child_summary, (handle,))
+        raise AssertionError("segment should be unlinked by the finalizer")
+    except FileNotFoundError:
+        pass
+    print("✅ Test 3 PASSED: Unclosed owners are cleaned up by the finalizer")
+
+    print("\n✅ ALL shared graph TESTS PASSED!\n")
+    return True
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("BSM307 - SharedGraph Test Suite")
+    print("=" * 60 + "\n")
+
+    try:
+        ok1 = test_publish_and_attach()
+
+        if ok1:
+            print("\n✅ ALL TESTS PASSED!")
+            return 0
+        print("\n❌ SOME TESTS FAILED!")
+        return 1
+    except Exception as e:
+        print(f"\n❌ Test error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+TopologyCache (disk üzerinde bellek eşlemeli topoloji önbelleği) test script
+BSM307 - Güz 2025
+"""
+
+import sys
+import os
+import tempfile
+import time
+
+# Proje kökünü Python path'e ekle
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.network.generator import AttributeRanges, RandomNetworkGenerator
+from src.network.compact_graph import CompactGraph
+from src.network import topology_cache
+from src.network.topology_cache import TopologyCache, topology_key
+from src.algorithms.ga.genetic_algorithm import GeneticAlgorithm
+import numpy as np
+
+
+def test_keys():
+    """Anahtar tüm üretim parametrelerine bağlı olmalı"""
+    print("=" * 60)
+    print("🧪 TEST: Content-addressed keys")
+    print("=" * 60)
+
+    base = RandomNetworkGenerator(num_nodes=250, edge_prob=0.4, seed=42)
+    assert topology_key(base) == topology_key(RandomNetworkGenerator(250, 0.4, 42))
+    variants = [
+        RandomNetworkGenerator(251, 0.4, 42),
+        RandomNetworkGenerator(250, 0.3, 42),
+        RandomNetworkGenerator(250, 0.4, 43),
+        RandomNetworkGenerator(250, 0.4, 42, ranges=AttributeRanges(bandwidth=(10.0, 100.0))),
+    ]
+    keys = {topology_key(base), topology_key(base, "compact")}
+    keys.update(topology_key(generator) for generator in variants)
+    assert len(keys) == 6
+    print("✅ Test 1 PASSED: kind, n, p, seed and ranges all change the key")
+
+    original = topology_cache.GENERATOR_VERSION
+    try:
+        topology_cache.GENERATOR_VERSION = original + 1
+        bumped = topology_key(base)
+    finally:
+        topology_cache.GENERATOR_VERSION = original
+    assert bumped not in keys
+    print("✅ Test 2 PASSED: Bumping GENERATOR_VERSION changes the key")
+
+    print("\n✅ ALL key TESTS PASSED!\n")
+    return True
+
+
+def test_cold_and_warm_load():
+    """Soğuk üretim + kayıt, sıcak bellek eşlemeli yükleme"""
+    print("=" * 60)
+    print("🧪 TEST: Cold and warm load")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=250, edge_prob=0.4, seed=42)
+    with tempfile.TemporaryDirectory() as directory:
+        cache = TopologyCache(directory)
+        started = time.perf_counter()
+        cold = cache.get(generator)
+        cold_seconds = time.perf_counter() - started
+        assert cache.misses == 1 and cache.hits == 0
+
+        started = time.perf_counter()
+        warm = cache.get(generator)
+        warm_seconds = time.perf_counter() - started
+        assert cache.hits == 1
+        assert isinstance(warm.indices, np.memmap) and not warm.bandwidth.flags.writeable
+        assert warm.fingerprint == cold.fingerprint
+
+        graph = generator.attach_attributes(generator.generate())
+        assert CompactGraph.from_graph(graph).fingerprint == warm.fingerprint
+        print(f"✅ Test 1 PASSED: cold {cold_seconds * 1000:.1f} ms, warm {warm_seconds * 1000:.2f} ms")
+
+        ga = GeneticAlgorithm(warm, 0, 50, population_size=20, seed=3)
+        best_path, best_fitness = ga.run(generations=5)
+        assert best_path[0] == 0 and best_path[-1] == 50 and best_fitness < float("inf")
+        print("✅ Test 2 PASSED: GA runs on the memory-mapped topology")
+
+        compact = cache.get(RandomNetworkGenerator(2000, 0.01, seed=1), kind="compact")
+        again = cache.get(RandomNetworkGenerator(2000, 0.01, seed=1), kind="compact")
+        assert compact.fingerprint == again.fingerprint and cache.hits == 2
+        print("✅ Test 3 PASSED: generate_compact() topologies are cached too")
+
+        (cache.path(generator) / "meta.json").write_text("{}", encoding="utf-8")
+        assert cache.load(generator) is None
+        assert cache.get(generator).fingerprint == cold.fingerprint
+        assert cache.load(generator) is not None
+        print("✅ Test 4 PASSED: Invalid entries are regenerated")
+
+    print("\n✅ ALL load TESTS PASSED!\n")
+    return True
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("BSM307 - TopologyCache Test Suite")
+    print("=" * 60 + "\n")
+
+    try:
+        ok1 = test_keys()
+        ok2 = test_cold_and_warm_load()
+
+        if ok1 and ok2:
+            print("\n✅ ALL TESTS PASSED!")
+            return 0
+        print("\n❌ SOME TESTS FAILED!")
+        return 1
+    except Exception as e:
+        print(f"\n❌ Test error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
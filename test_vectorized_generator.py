@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+RandomNetworkGenerator vektörel üretim test script
+BSM307 - Güz 2025
+"""
+
+import sys
+import os
+import time
+
+# Proje kökünü Python path'e ekle
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.network.generator import AttributeRanges, RandomNetworkGenerator, benchmark_generation
+from src.network.compact_graph import CompactGraph
+import networkx as nx
+import numpy as np
+
+
+def test_vectorized_attributes():
+    """NumPy Generator ile tek çağrıda attribute örneklemesi"""
+    print("=" * 60)
+    print("🧪 TEST: Vectorized attribute sampling")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=250, edge_prob=0.4, seed=42)
+    first = generator.sample_attribute_arrays(250, 12000)
+    second = RandomNetworkGenerator(num_nodes=250, edge_prob=0.4, seed=42).sample_attribute_arrays(250, 12000)
+    for a, b in zip(first, second):
+        assert np.array_equal(a, b)
+    other = RandomNetworkGenerator(num_nodes=250, edge_prob=0.4, seed=43).sample_attribute_arrays(250, 12000)
+    assert not np.array_equal(first.bandwidth, other.bandwidth)
+    print("✅ Test 1 PASSED: Same seed gives the same stream")
+
+    ranges = AttributeRanges()
+    for name in first._fields:
+        low, high = getattr(ranges, name)
+        values = getattr(first, name)
+        assert low <= values.min() and values.max() <= high, name
+    assert np.array_equal(first.bandwidth, np.round(first.bandwidth, 1))
+    print("✅ Test 2 PASSED: Values stay within the PDF ranges")
+
+    graph = generator.generate()
+    compact = generator.compact(graph)
+    assert "bandwidth" not in next(iter(graph.edges(data=True)))[2]
+    generator.attach_attributes(graph)
+    reference = CompactGraph.from_graph(graph)
+    assert compact.fingerprint == reference.fingerprint
+    u, v = next(iter(graph.edges()))
+    assert graph.edges[u, v]["bandwidth"] == compact.bandwidth[compact.edge_id(u, v)]
+    print("✅ Test 3 PASSED: Edge-aligned arrays match the networkx attributes")
+
+    shuffled = nx.Graph()
+    shuffled.add_nodes_from(reversed(range(graph.number_of_nodes())))
+    shuffled.add_edges_from(graph.edges())
+    compact = generator.compact(shuffled, write_graph=True)
+    assert compact.fingerprint == CompactGraph.from_graph(shuffled).fingerprint
+    try:
+        generator.compact(nx.relabel_nodes(graph, str))
+        raise AssertionError("non-integer labels accepted")
+    except ValueError:
+        pass
+    print("✅ Test 3b PASSED: Node attributes follow node ids, not iteration order")
+
+    started = time.perf_counter()
+    big = generator.sample_attribute_arrays(1000, 200000)
+    elapsed = time.perf_counter() - started
+    assert len(big.processing_delay) == len(big.node_reliability) == 1000
+    for name in ("bandwidth", "delay", "reliability"):
+        values = getattr(big, name)
+        low, high = getattr(ranges, name)
+        assert values.shape == (200000,) and values.dtype == np.float64
+        assert low <= values.min() and values.max() <= high
+    print(f"✅ Test 4 PASSED: 200k edges sampled in {elapsed * 1000:.1f} ms")
+
+    print("\n✅ ALL attribute TESTS PASSED!\n")
+    return True
+
+
+def test_compact_generation():
+    """networkx'siz G(n, p) üretimi (geometric skipping → CSR)"""
+    print("=" * 60)
+    print("🧪 TEST: Compact G(n, p) generation")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=400, edge_prob=0.05, seed=11)
+    src, dst = generator.sample_edges()
+    assert (src < dst).all() and dst.max() < 400
+    keys = src * 400 + dst
+    assert (np.diff(keys) > 0).all()
+    expected = 400 * 399 / 2 * 0.05
+    assert abs(len(src) - expected) < 5 * np.sqrt(expected)
+    again, _ = RandomNetworkGenerator(num_nodes=400, edge_prob=0.05, seed=11).sample_edges()
+    assert np.array_equal(src, again)
+    print(f"✅ Test 1 PASSED: {len(src)} unique edges (expected ≈{expected:.0f})")
+
+    counts = np.zeros((12, 12))
+    for seed in range(400):
+        s, d = RandomNetworkGenerator(num_nodes=12, edge_prob=0.3, seed=seed).sample_edges()
+        counts[s, d] += 1
+    frequencies = counts[np.triu_indices(12, 1)] / 400
+    assert abs(frequencies.mean() - 0.3) < 0.02
+    assert frequencies.min() > 0.15 and frequencies.max() < 0.45
+    print("✅ Test 2 PASSED: Every pair appears with probability ≈p")
+
+    full, _ = RandomNetworkGenerator(num_nodes=20, edge_prob=1.0, seed=1).sample_edges()
+    empty, _ = RandomNetworkGenerator(num_nodes=20, edge_prob=0.0, seed=1).sample_edges()
+    assert len(full) == 190 and len(empty) == 0
+    print("✅ Test 3 PASSED: p=0 and p=1 edge cases")
+
+    compact, graph = generator.generate_compact(to_networkx=True)
+    assert compact.num_edges == len(src) == graph.number_of_edges()
+    assert CompactGraph.from_graph(graph).fingerprint == compact.fingerprint
+    print("✅ Test 4 PASSED: Optional networkx conversion round-trips")
+
+    for result in benchmark_generation(((2000, 0.05), (20000, 0.0005)), seed=3):
+        assert result.num_edges > 0 and result.edges_per_second > 0
+        print(f"   n={result.num_nodes}, p={result.edge_prob}: {result.num_edges} edges, "
+              f"{result.edges_per_second:,.0f} edges/s")
+    print("✅ Test 5 PASSED: Benchmark reports edges/second")
+
+    print("\n✅ ALL compact generation TESTS PASSED!\n")
+    return True
+
+
+def test_connectivity_repair():
+    """Union-find ile tek geçişte en az sayıda köprü kenar"""
+    print("=" * 60)
+    print("🧪 TEST: Union-find connectivity repair")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=3000, edge_prob=0.0005, seed=5)
+    src, dst = generator.sample_edges()
+    raw = nx.Graph()
+    raw.add_nodes_from(range(3000))
+    raw.add_edges_from(zip(src.tolist(), dst.tolist()))
+    components = nx.number_connected_components(raw)
+    assert components > 1
+
+    compact, graph = generator.generate_compact(to_networkx=True)
+    assert nx.is_connected(graph)
+    assert compact.num_edges - len(src) == components - 1
+    for u, v, data in graph.edges(data=True):
+        assert 100.0 <= data["bandwidth"] <= 1000.0 and 3.0 <= data["delay"] <= 15.0
+    print(f"✅ Test 1 PASSED: {components} components joined with {components - 1} sampled bridges")
+
+    nx_graph = RandomNetworkGenerator(num_nodes=500, edge_prob=0.002, seed=9).generate()
+    assert nx.is_connected(nx_graph)
+    dense = RandomNetworkGenerator(num_nodes=250, edge_prob=0.4, seed=42)
+    assert dense._bridging_edges(*dense.sample_edges())[0].size == 0
+    print("✅ Test 2 PASSED: generate() is connected and dense graphs need no bridges")
+
+    checked = 0
+    for seed in range(20):
+        small = RandomNetworkGenerator(num_nodes=200, edge_prob=0.004, seed=seed)
+        src, dst = small.sample_edges()
+        raw = nx.Graph()
+        raw.add_nodes_from(range(200))
+        raw.add_edges_from(zip(src.tolist(), dst.tolist()))
+        component_of = {node: k for k, nodes in enumerate(nx.connected_components(raw)) for node in nodes}
+        bridge_src, bridge_dst = small._bridging_edges(src, dst)
+        assert len(bridge_src) == nx.number_connected_components(raw) - 1
+        assert (bridge_src < bridge_dst).all()
+        raw.add_edges_from(zip(bridge_src.tolist(), bridge_dst.tolist()))
+        assert nx.is_connected(raw)
+        assert all(component_of[u] != component_of[v] for u, v in zip(bridge_src.tolist(), bridge_dst.tolist()))
+        checked += 1
+    print(f"✅ Test 3 PASSED: {checked} sparse graphs bridged with exactly components - 1 edges")
+
+    print("\n✅ ALL connectivity TESTS PASSED!\n")
+    return True
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("BSM307 - Vectorized Generator Test Suite")
+    print("=" * 60 + "\n")
+
+    try:
+        ok1 = test_vectorized_attributes()
+        ok2 = test_compact_generation()
+        ok3 = test_connectivity_repair()
+
+        if ok1 and ok2 and ok3:
+            print("\n✅ ALL TESTS PASSED!")
+            return 0
+        print("\n❌ SOME TESTS FAILED!")
+        return 1
+    except Exception as e:
+        print(f"\n❌ Test error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+WeightedSumSolver (Dijkstra oracle) test script
+BSM307 - Güz 2025
+"""
+
+import sys
+import os
+import math
+
+# Proje kökünü Python path'e ekle
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.network.generator import RandomNetworkGenerator
+from src.metrics.delay import total_delay
+from src.metrics.reliability import reliability_cost
+from src.metrics.resource_cost import bandwidth_cost, weighted_sum
+from src.routing.path_validator import PathValidator
+from src.routing.weighted_solver import WeightedSumSolver
+from src.algorithms.ga.genetic_algorithm import GeneticAlgorithm
+import networkx as nx
+
+
+def _score(graph, path, weights):
+    return weighted_sum(
+        total_delay(graph=graph, path=path),
+        reliability_cost(graph=graph, path=path),
+        bandwidth_cost(graph=graph, path=path),
+        weights,
+    )
+
+
+def test_matches_brute_force():
+    """Küçük grafta tüm basit path'ler arasında en iyisini bulmalı"""
+    print("=" * 60)
+    print("🧪 TEST: WeightedSumSolver vs. brute force")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=9, edge_prob=0.5, seed=3)
+    graph = generator.attach_attributes(generator.generate())
+    solver = WeightedSumSolver(graph)
+    validator = PathValidator(graph)
+
+    for weights in [(0.4, 0.3, 0.3), (1.0, 0.0, 0.0), (0.0, 0.0, 1.0), (0.1, 0.8, 0.1)]:
+        for bandwidth in (0.0, 400.0, 700.0):
+            path, score = solver.solve(0, 8, weights, bandwidth)
+            candidates = [
+                p for p in nx.all_simple_paths(graph, 0, 8) if validator.has_capacity(p, bandwidth)
+            ]
+            if not candidates:
+                assert path == [] and math.isinf(score)
+                continue
+            best = min(_score(graph, p, weights) for p in candidates)
+            assert validator.has_capacity(path, bandwidth)
+            assert abs(score - best) < 1e-9, f"{weights}/{bandwidth}: {score} != {best}"
+            assert abs(score - _score(graph, path, weights)) < 1e-12
+        print(f"✅ weights={weights}: optimal for all bandwidth levels")
+
+    print("\n✅ ALL brute-force TESTS PASSED!\n")
+    return True
+
+
+def test_oracle_bounds_ga():
+    """GA hiçbir zaman kesin çözümden daha iyi skor bulamamalı"""
+    print("=" * 60)
+    print("🧪 TEST: WeightedSumSolver as GA oracle")
+    print("=" * 60)
+
+    generator = RandomNetworkGenerator(num_nodes=250, edge_prob=0.4, seed=42)
+    graph = generator.attach_attributes(generator.generate())
+    solver = WeightedSumSolver(graph)
+    weights = (0.4, 0.3, 0.3)
+
+    path, score = solver.solve(0, 50, weights, required_bandwidth=500.0)
+    ga = GeneticAlgorithm(graph, 0, 50, weights=weights, required_bandwidth=500.0,
+                          population_size=20, seed=1)
+    _, ga_fitness = ga.run(generations=5)
+    assert score <= ga_fitness + 1e-9
+    print(f"✅ Oracle score={score:.4f} <= GA fitness={ga_fitness:.4f}")
+
+    assert solver.composite_weights(weights) is solver.composite_weights(list(weights))
+    print("✅ Composite weights are cached per weight vector")
+
+    assert solver.solve(7, 7, weights) == ([7], 0.0)
+    assert solver.solve(0, 50, weights, required_bandwidth=5000.0) == ([], float("inf"))
+    print("✅ Degenerate and infeasible demands handled")
+
+    print("\n✅ ALL oracle TESTS PASSED!\n")
+    return True
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("BSM307 - WeightedSumSolver Test Suite")
+    print("=" * 60 + "\n")
+
+    try:
+        ok1 = test_matches_brute_force()
+        ok2 = test_oracle_bounds_ga()
+
+        if ok1 and ok2:
+            print("\n✅ ALL TESTS PASSED!")
+            return 0
+        print("\n❌ SOME TESTS FAILED!")
+        return 1
+    except Exception as e:
+        print(f"\n❌ Test error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())